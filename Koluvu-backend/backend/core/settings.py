@@ -258,6 +258,94 @@ CACHES = {
     }
 }
 
+# ATS analysis results and the keyword library version they are keyed by.
+# LocMemCache evicts least recently used entries beyond MAX_ENTRIES; set
+# ATS_CACHE_URL (redis://...) to share results between server processes,
+# with an allkeys-lru maxmemory policy on the Redis side. The versions that
+# invalidate these entries are kept in the database (ats.CacheVersion), so
+# invalidation reaches every process with either backend
+ATS_CACHE_URL = os.getenv('ATS_CACHE_URL', '')
+if ATS_CACHE_URL:
+    CACHES['ats'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': ATS_CACHE_URL,
+        'KEY_PREFIX': 'ats',
+    }
+else:
+    CACHES['ats'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ats-results',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('ATS_CACHE_MAX_ENTRIES', 5000))},
+    }
+ATS_ANALYSIS_CACHE_TTL = int(os.getenv('ATS_ANALYSIS_CACHE_TTL', 24 * 60 * 60))  # seconds
+
+# ATS resume extraction (runs in a pool of worker processes, outside requests)
+ATS_EXTRACTION_WORKERS = int(os.getenv('ATS_EXTRACTION_WORKERS', 2))
+ATS_EXTRACTION_TIMEOUT = int(os.getenv('ATS_EXTRACTION_TIMEOUT', 20))  # wall-clock seconds per document
+ATS_EXTRACTION_CPU_TIMEOUT = int(os.getenv('ATS_EXTRACTION_CPU_TIMEOUT', 10))  # CPU seconds per document, 0 disables
+ATS_EXTRACTION_MAX_PAGES = int(os.getenv('ATS_EXTRACTION_MAX_PAGES', 20))
+ATS_EXTRACTION_MAX_RSS_MB = int(os.getenv('ATS_EXTRACTION_MAX_RSS_MB', 512))  # per worker process
+ATS_EXTRACTION_MAX_ADDRESS_SPACE_MB = int(os.getenv('ATS_EXTRACTION_MAX_ADDRESS_SPACE_MB', 1024))  # RLIMIT_AS per worker process, 0 disables
+
+# Extracted document text is cached by SHA-256 of the uploaded bytes; the
+# digest is computed by the upload handler while the file streams in
+ATS_DOCUMENT_CACHE_MAX_BYTES = int(os.getenv('ATS_DOCUMENT_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+FILE_UPLOAD_HANDLERS = [
+    'shared_services.ats.upload_handlers.SHA256UploadHandler',
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+
+# Public ATS analyze endpoints: per-upload size cap and result cache lifetime
+ATS_ANALYZE_MAX_UPLOAD_BYTES = int(os.getenv('ATS_ANALYZE_MAX_UPLOAD_BYTES', 5 * 1024 * 1024))
+ATS_ANALYZE_RESULT_CACHE_TTL = int(os.getenv('ATS_ANALYZE_RESULT_CACHE_TTL', 60 * 60))  # seconds
+
+# Public job board responses, cached under a version bumped on every job or
+# employer write. The version must be shared by every server process, so
+# responses are only cached with PUBLIC_JOBS_CACHE_URL (redis://...) set;
+# without it the dummy backend turns response caching off
+PUBLIC_JOBS_CACHE_URL = os.getenv('PUBLIC_JOBS_CACHE_URL', '')
+if PUBLIC_JOBS_CACHE_URL:
+    CACHES['public_jobs'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': PUBLIC_JOBS_CACHE_URL,
+        'KEY_PREFIX': 'public_jobs',
+    }
+else:
+    CACHES['public_jobs'] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+PUBLIC_JOBS_CACHE_TTL = int(os.getenv('PUBLIC_JOBS_CACHE_TTL', 5 * 60))  # seconds
+
+# Seconds browsers and CDNs may reuse public job and shared resume responses
+# before revalidating them with If-None-Match / If-Modified-Since
+HTTP_PUBLIC_MAX_AGE = int(os.getenv('HTTP_PUBLIC_MAX_AGE', 0))
+
+# Write-behind counters (job views, applications, ...) are buffered here and
+# flushed to the database every COUNTER_FLUSH_INTERVAL seconds. Every server
+# process must see the same deltas, so increments are only buffered with
+# COUNTERS_CACHE_URL (redis://...) set; without it the dummy backend makes
+# each increment a direct UPDATE
+COUNTERS_CACHE_URL = os.getenv('COUNTERS_CACHE_URL', '')
+if COUNTERS_CACHE_URL:
+    CACHES['counters'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': COUNTERS_CACHE_URL,
+        'KEY_PREFIX': 'counters',
+    }
+else:
+    CACHES['counters'] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+COUNTER_FLUSH_INTERVAL = int(os.getenv('COUNTER_FLUSH_INTERVAL', 5))  # seconds
+
+# Reverse proxies in front of the app that append the client address to
+# X-Forwarded-For; 0 trusts only REMOTE_ADDR (job view analytics)
+TRUSTED_PROXY_COUNT = int(os.getenv('TRUSTED_PROXY_COUNT', 0))
+
+# Public job board facet counts are cached briefly per normalized filter set
+PUBLIC_JOB_FACETS_CACHE_TTL = int(os.getenv('PUBLIC_JOB_FACETS_CACHE_TTL', 60))  # seconds
+
 # Password Security
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from employee_dashboard.models import CandidateSearchProfile, CandidateSearchDocument
+from employee_dashboard.search_documents import refresh_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized candidate search documents from the candidate profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Profiles rebuilt per batch'
+        )
+        parser.add_argument(
+            '--profile', type=int, action='append', dest='profile_ids',
+            help='Only rebuild this search profile id (can be repeated)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options['batch_size'], 1)
+
+        profiles = CandidateSearchProfile.objects.order_by('id')
+        if options['profile_ids']:
+            profiles = profiles.filter(id__in=options['profile_ids'])
+
+        rebuilt = 0
+        last_id = 0
+        while True:
+            profile_ids = list(profiles.filter(id__gt=last_id).values_list('id', flat=True)[:batch_size])
+            if not profile_ids:
+                break
+            last_id = profile_ids[-1]
+            rebuilt += refresh_search_documents(profile_ids=profile_ids, notify=False)
+            self.stdout.write(f'Rebuilt {rebuilt} search documents...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Successfully rebuilt {rebuilt} candidate search documents '
+            f'({CandidateSearchDocument.objects.count()} total)'
+        ))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_dashboard', '0012_fix_twitter_url_column'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidatesearchprofile',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='canonical_skill_id',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:56
+
+from django.db import migrations
+
+# This migration used to add and populate CandidateSearchProfile.search_text,
+# which 0015 replaced with CandidateSearchDocument before it was released.
+# It is kept without operations so the migration graph stays intact.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_dashboard', '0013_candidatesearchprofile_skill_ids_and_more'),
+    ]
+
+    operations = []
@@ -0,0 +1,133 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:02
+
+import re
+from collections import defaultdict
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.utils import timezone
+
+# Frozen copies of shared_services.boolean_query.normalize_search_text and
+# employee_dashboard.search_documents as of this migration, so later changes
+# to them do not alter what this migration writes
+SEARCH_TEXT_RE = re.compile(r'[^a-z0-9+#.]+')
+
+BATCH_SIZE = 500
+
+
+def normalize_search_text(*values):
+    tokens = []
+    for value in values:
+        if not value:
+            continue
+        for token in SEARCH_TEXT_RE.split(str(value).lower()):
+            token = token.rstrip('.')
+            if token:
+                tokens.append(token)
+    return f" {' '.join(tokens)} " if tokens else ''
+
+
+def build_search_document(CandidateSearchDocument, row, skill_names, now):
+    return CandidateSearchDocument(
+        profile_id=row['id'],
+        employee_id=row['employee_id'],
+        search_text=normalize_search_text(
+            row['key_skills'], row['employee__current_designation'], row['employee__current_position'],
+            row['department'], row['industry'], *skill_names
+        ),
+        designation_text=normalize_search_text(
+            row['employee__current_designation'], row['employee__current_position']
+        ),
+        location_text=normalize_search_text(row['employee__location']),
+        preferred_location_text=normalize_search_text(row['preferred_location']),
+        skill_ids=row['skill_ids'] or [],
+        department=(row['department'] or '').strip().lower(),
+        experience_years=row['employee__experience_years'],
+        present_ctc=row['present_ctc'],
+        expected_ctc=row['expected_ctc'],
+        notice_period=row['notice_period'],
+        actively_looking=row['actively_looking'],
+        is_searchable=row['is_searchable'],
+        last_active=row['last_active'],
+        updated_at=now,
+    )
+
+
+def populate_search_documents(apps, schema_editor):
+    CandidateSearchProfile = apps.get_model('employee_dashboard', 'CandidateSearchProfile')
+    CandidateSearchDocument = apps.get_model('employee_dashboard', 'CandidateSearchDocument')
+    Skill = apps.get_model('employee_dashboard', 'Skill')
+    now = timezone.now()
+
+    last_id = 0
+    while True:
+        rows = list(
+            CandidateSearchProfile.objects.filter(id__gt=last_id).order_by('id').values(
+                'id', 'employee_id', 'key_skills', 'skill_ids', 'department', 'industry', 'present_ctc',
+                'expected_ctc', 'notice_period', 'preferred_location', 'actively_looking', 'is_searchable',
+                'last_active', 'employee__current_designation', 'employee__current_position',
+                'employee__location', 'employee__experience_years',
+            )[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        last_id = rows[-1]['id']
+
+        skill_names = defaultdict(list)
+        skills = Skill.objects.filter(employee_id__in=[row['employee_id'] for row in rows])
+        for employee_id, name in skills.values_list('employee_id', 'name'):
+            skill_names[employee_id].append(name)
+
+        CandidateSearchDocument.objects.bulk_create([
+            build_search_document(CandidateSearchDocument, row, skill_names[row['employee_id']], now)
+            for row in rows
+        ])
+        if schema_editor.connection.vendor == 'postgresql':
+            CandidateSearchDocument.objects.filter(profile_id__in=[row['id'] for row in rows]).update(
+                search_vector=(
+                    SearchVector('search_text', weight='A', config='simple')
+                    + SearchVector('designation_text', weight='B', config='simple')
+                    + SearchVector('location_text', 'preferred_location_text', weight='C', config='simple')
+                )
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_dashboard', '0014_candidatesearchprofile_search_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidateSearchDocument',
+            fields=[
+                ('profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='employee_dashboard.candidatesearchprofile')),
+                ('search_text', models.TextField(blank=True, default='')),
+                ('designation_text', models.TextField(blank=True, default='')),
+                ('location_text', models.TextField(blank=True, default='')),
+                ('preferred_location_text', models.TextField(blank=True, default='')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, null=True)),
+                ('skill_ids', models.JSONField(blank=True, default=list)),
+                ('department', models.CharField(blank=True, default='', max_length=255)),
+                ('experience_years', models.IntegerField(blank=True, null=True)),
+                ('present_ctc', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('expected_ctc', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('notice_period', models.CharField(blank=True, default='', max_length=50)),
+                ('actively_looking', models.BooleanField(default=False)),
+                ('is_searchable', models.BooleanField(default=True)),
+                ('last_active', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='employee_dashboard.employeeprofile')),
+            ],
+            options={
+                'db_table': 'employee_dashboard_candidatesearchdocument',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='cand_search_vector_gin'), django.contrib.postgres.indexes.GinIndex(fields=['skill_ids'], name='cand_search_skill_ids_gin'), models.Index(fields=['is_searchable', '-last_active'], name='cand_search_active_idx'), models.Index(fields=['department'], name='cand_search_department_idx'), models.Index(fields=['experience_years'], name='cand_search_experience_idx'), models.Index(fields=['expected_ctc'], name='cand_search_ctc_idx')],
+            },
+        ),
+        migrations.RunPython(populate_search_documents, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_dashboard', '0016_geocoded_locations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidatesearchdocument',
+            name='percolation_requested_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When matching against saved searches was queued', null=True),
+        ),
+    ]
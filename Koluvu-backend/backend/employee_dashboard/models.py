@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.cache import cache
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
@@ -22,6 +24,9 @@ class EmployeeProfile(models.Model):
     phone = models.CharField(max_length=20, blank=True, default='')  # Keep for compatibility
     date_of_birth = models.DateField(null=True, blank=True)
     location = models.CharField(max_length=255, blank=True, default='')
+    # Coordinates geocoded from location (shared_services.geo), null when unknown
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     linkedin_url = models.URLField(blank=True, default='')
     linkedin_profile = models.URLField(blank=True, default='')  # Keep for compatibility
     github_url = models.URLField(blank=True, default='')
@@ -63,6 +68,16 @@ class EmployeeProfile(models.Model):
     
     def __str__(self):
         return f"{self.user.username} - {self.current_position}"
+    
+    def save(self, *args, **kwargs):
+        # Geocode the location from the offline gazetteer
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'location' in update_fields:
+            from shared_services.geo import geocode
+            self.latitude, self.longitude = geocode(self.location) or (None, None)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'latitude', 'longitude'}
+        super().save(*args, **kwargs)
 
 
 class Education(models.Model):
@@ -116,12 +131,22 @@ class Skill(models.Model):
     
     employee = models.ForeignKey(EmployeeProfile, on_delete=models.CASCADE, related_name='skills')
     name = models.CharField(max_length=100)
+    canonical_skill_id = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     proficiency = models.CharField(max_length=20, choices=PROFICIENCY_LEVELS)
     years_of_experience = models.IntegerField(null=True, blank=True)
 
     def __str__(self):
         return f"{self.name} - {self.proficiency}"
 
+    def save(self, *args, **kwargs):
+        """Resolve the skill name to its canonical skill id"""
+        from shared_services.ats.skills import canonical_skill_id
+        self.canonical_skill_id = canonical_skill_id(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'canonical_skill_id'}
+        super().save(*args, **kwargs)
+
 
 class Resume(models.Model):
     """Resume model for employee with builder support"""
@@ -203,6 +228,11 @@ class ResumeSharingLink(models.Model):
     
     def __str__(self):
         return f"Share link for {self.resume.title}"
+    
+    def increment_views(self):
+        """Increment link view count (buffered, see shared_services.counters)"""
+        from shared_services.counters import increment
+        increment('resume_share_views', self.pk)
 
 
 class CandidateSearchProfile(models.Model):
@@ -213,6 +243,7 @@ class CandidateSearchProfile(models.Model):
     department = models.CharField(max_length=255, blank=True, default='')
     industry = models.CharField(max_length=255, blank=True, default='')
     key_skills = models.TextField(blank=True, default='')  # Comma-separated skills
+    skill_ids = models.JSONField(default=list, blank=True)  # Sorted canonical ids of key_skills and employee skills
     
     # Compensation Details
     present_ctc = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
@@ -245,10 +276,79 @@ class CandidateSearchProfile(models.Model):
     def __str__(self):
         return f"Search Profile - {self.employee.user.get_full_name()}"
     
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'key_skills' in update_fields:
+            self.skill_ids = self.resolve_skill_ids()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(kwargs['update_fields']) | {'skill_ids'}
+        super().save(*args, **kwargs)
+    
+    def resolve_skill_ids(self):
+        """Canonical ids of key_skills plus the employee's individual skills"""
+        from shared_services.ats.skills import resolve_skill_ids
+        skill_ids = set(resolve_skill_ids(self.key_skills))
+        if self.employee_id:
+            skill_ids.update(
+                Skill.objects.filter(employee_id=self.employee_id, canonical_skill_id__isnull=False)
+                .values_list('canonical_skill_id', flat=True)
+            )
+        return sorted(skill_ids)
+    
     class Meta:
         db_table = 'employee_dashboard_candidatesearchprofile'
 
 
+class CandidateSearchDocument(models.Model):
+    """
+    Denormalized search row for one candidate.
+
+    Copies everything boolean candidate search filters and scores on from
+    the search profile, employee profile and skills, so a search reads this
+    single table. Kept current by the receivers below; rebuild with
+    ``manage.py rebuild_candidate_search``.
+    """
+    profile = models.OneToOneField(
+        CandidateSearchProfile, on_delete=models.CASCADE, primary_key=True, related_name='search_document'
+    )
+    employee = models.OneToOneField(EmployeeProfile, on_delete=models.CASCADE, related_name='search_document')
+    
+    # Normalized, space-delimited token text (see normalize_search_text)
+    search_text = models.TextField(blank=True, default='')  # Skills, designation, department, industry
+    designation_text = models.TextField(blank=True, default='')
+    location_text = models.TextField(blank=True, default='')
+    preferred_location_text = models.TextField(blank=True, default='')
+    search_vector = SearchVectorField(null=True, blank=True)  # Filled on PostgreSQL only
+    skill_ids = models.JSONField(default=list, blank=True)
+    
+    department = models.CharField(max_length=255, blank=True, default='')  # Lowercased
+    experience_years = models.IntegerField(null=True, blank=True)
+    present_ctc = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    expected_ctc = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    notice_period = models.CharField(max_length=50, blank=True, default='')
+    actively_looking = models.BooleanField(default=False)
+    is_searchable = models.BooleanField(default=True)
+    last_active = models.DateTimeField(null=True, blank=True)
+    percolation_requested_at = models.DateTimeField(null=True, blank=True, editable=False,
+                                                    help_text="When matching against saved searches was queued")
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"Search Document - profile {self.profile_id}"
+    
+    class Meta:
+        db_table = 'employee_dashboard_candidatesearchdocument'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='cand_search_vector_gin'),
+            GinIndex(fields=['skill_ids'], name='cand_search_skill_ids_gin'),
+            models.Index(fields=['is_searchable', '-last_active'], name='cand_search_active_idx'),
+            models.Index(fields=['department'], name='cand_search_department_idx'),
+            models.Index(fields=['experience_years'], name='cand_search_experience_idx'),
+            models.Index(fields=['expected_ctc'], name='cand_search_ctc_idx'),
+        ]
+
+
 class CandidateProject(models.Model):
     """Projects/portfolio for candidates"""
     candidate = models.ForeignKey(CandidateSearchProfile, on_delete=models.CASCADE, related_name='projects')
@@ -544,6 +644,39 @@ def create_employee_settings(sender, instance, created, **kwargs):
         EmployeeSettings.objects.create(employee=instance)
 
 
+@receiver(post_save, sender=CandidateSearchProfile)
+def candidate_search_profile_saved(sender, instance, update_fields=None, **kwargs):
+    """Rebuild the candidate's search document from the saved profile"""
+    from .search_documents import PROFILE_SOURCE_FIELDS, refresh_search_documents
+    if update_fields is not None and not set(update_fields) & set(PROFILE_SOURCE_FIELDS):
+        return
+    refresh_search_documents(profile_ids=[instance.id])
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def employee_skill_changed(sender, instance, **kwargs):
+    """Keep the search profile's canonical skill ids and search document in sync with the employee's skills"""
+    from .search_documents import refresh_search_documents
+    search_profile = CandidateSearchProfile.objects.filter(employee_id=instance.employee_id).only(
+        'id', 'employee_id', 'key_skills'
+    ).first()
+    if search_profile:
+        CandidateSearchProfile.objects.filter(id=search_profile.id).update(
+            skill_ids=search_profile.resolve_skill_ids()
+        )
+        refresh_search_documents(profile_ids=[search_profile.id])
+
+
+@receiver(post_save, sender=EmployeeProfile)
+def employee_profile_search_document(sender, instance, created, update_fields=None, **kwargs):
+    """Designation, location and experience are copied into the search document"""
+    from .search_documents import EMPLOYEE_SOURCE_FIELDS, refresh_search_documents
+    if created or (update_fields is not None and not set(update_fields) & set(EMPLOYEE_SOURCE_FIELDS)):
+        return
+    refresh_search_documents(employee_ids=[instance.id])
+
+
 @receiver(post_save, sender=EmployeeSettings)
 def employee_settings_saved(sender, instance, **kwargs):
     """Clear cache and broadcast update when settings are saved"""
@@ -0,0 +1,135 @@
+# backend/employee_dashboard/search_documents.py
+
+"""
+Maintenance of denormalized candidate search documents.
+
+``refresh_search_documents`` rebuilds the ``CandidateSearchDocument`` rows
+of the given profiles from their sources in a fixed number of queries,
+whether it is called for one candidate from a signal or for a batch of
+thousands from ``rebuild_candidate_search``. On PostgreSQL the weighted
+``search_vector`` is computed by the database in the same pass.
+
+``search_documents_refreshed`` is sent with the ``profile_ids`` of every
+incremental refresh, e.g. to match saved searches against changed
+candidates.
+"""
+from collections import defaultdict
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchVector
+from django.db import connection
+from django.dispatch import Signal
+from django.utils import timezone
+
+from shared_services.boolean_query import normalize_search_text
+
+search_documents_refreshed = Signal()
+
+# Text search configuration without stemming or stop words, so a vector
+# lexeme is the same token the boolean query compiler searches for
+SEARCH_CONFIG = 'simple'
+
+# Profile fields copied into the document; saving any other field skips the refresh
+PROFILE_SOURCE_FIELDS = (
+    'key_skills', 'skill_ids', 'department', 'industry', 'present_ctc', 'expected_ctc',
+    'notice_period', 'preferred_location', 'actively_looking', 'is_searchable', 'last_active',
+)
+
+# Employee profile fields copied into the document
+EMPLOYEE_SOURCE_FIELDS = ('current_designation', 'current_position', 'location', 'experience_years')
+
+DOCUMENT_FIELDS = [
+    'employee', 'search_text', 'designation_text', 'location_text', 'preferred_location_text',
+    'skill_ids', 'department', 'experience_years', 'present_ctc', 'expected_ctc', 'notice_period',
+    'actively_looking', 'is_searchable', 'last_active', 'updated_at',
+]
+
+
+def supports_search_vector() -> bool:
+    return connection.vendor == 'postgresql'
+
+
+def search_vector():
+    """Weighted vector over the document's text columns: skills > designation > locations"""
+    return (
+        SearchVector('search_text', weight='A', config=SEARCH_CONFIG)
+        + SearchVector('designation_text', weight='B', config=SEARCH_CONFIG)
+        + SearchVector('location_text', 'preferred_location_text', weight='C', config=SEARCH_CONFIG)
+    )
+
+
+def build_search_document(document_model, row, skill_names):
+    """Unsaved document for one profile ``values()`` row and the employee's skill names"""
+    designation_text = normalize_search_text(
+        row['employee__current_designation'], row['employee__current_position']
+    )
+    return document_model(
+        profile_id=row['id'],
+        employee_id=row['employee_id'],
+        search_text=normalize_search_text(
+            row['key_skills'], row['employee__current_designation'], row['employee__current_position'],
+            row['department'], row['industry'], *skill_names
+        ),
+        designation_text=designation_text,
+        location_text=normalize_search_text(row['employee__location']),
+        preferred_location_text=normalize_search_text(row['preferred_location']),
+        skill_ids=row['skill_ids'] or [],
+        department=(row['department'] or '').strip().lower(),
+        experience_years=row['employee__experience_years'],
+        present_ctc=row['present_ctc'],
+        expected_ctc=row['expected_ctc'],
+        notice_period=row['notice_period'],
+        actively_looking=row['actively_looking'],
+        is_searchable=row['is_searchable'],
+        last_active=row['last_active'],
+        updated_at=timezone.now(),
+    )
+
+
+def refresh_search_documents(profile_ids=None, employee_ids=None, registry=None, notify=True) -> int:
+    """
+    Create or update the search documents of the selected profiles.
+
+    Profiles are selected by id and/or employee id; ``registry`` is the app
+    registry (historical in migrations). Bulk rebuilds pass ``notify=False``
+    to skip ``search_documents_refreshed``. Returns the number of documents
+    written.
+    """
+    registry = registry or apps
+    CandidateSearchProfile = registry.get_model('employee_dashboard', 'CandidateSearchProfile')
+    CandidateSearchDocument = registry.get_model('employee_dashboard', 'CandidateSearchDocument')
+    Skill = registry.get_model('employee_dashboard', 'Skill')
+
+    profiles = CandidateSearchProfile.objects.all()
+    if profile_ids is not None:
+        profiles = profiles.filter(id__in=profile_ids)
+    if employee_ids is not None:
+        profiles = profiles.filter(employee_id__in=employee_ids)
+    rows = list(profiles.values(
+        'id', 'employee_id', *PROFILE_SOURCE_FIELDS,
+        *(f'employee__{field}' for field in EMPLOYEE_SOURCE_FIELDS),
+    ))
+    if not rows:
+        return 0
+
+    skill_names = defaultdict(list)
+    skills = Skill.objects.filter(employee_id__in=[row['employee_id'] for row in rows])
+    for employee_id, name in skills.values_list('employee_id', 'name'):
+        skill_names[employee_id].append(name)
+
+    documents = [
+        build_search_document(CandidateSearchDocument, row, skill_names[row['employee_id']])
+        for row in rows
+    ]
+    CandidateSearchDocument.objects.bulk_create(
+        documents, update_conflicts=True, unique_fields=['profile'], update_fields=DOCUMENT_FIELDS
+    )
+    if supports_search_vector():
+        CandidateSearchDocument.objects.filter(
+            profile_id__in=[row['id'] for row in rows]
+        ).update(search_vector=search_vector())
+    if notify:
+        search_documents_refreshed.send(
+            sender=CandidateSearchDocument, profile_ids=[row['id'] for row in rows]
+        )
+    return len(documents)
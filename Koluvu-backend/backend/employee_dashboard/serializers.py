@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth.models import User
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from shared_services.counters import PendingCountersListSerializer, PendingCountersMixin
 from .models import (
     EmployeeProfile, Education, Experience, Skill, Resume, ResumeTemplate, 
     ResumeSharingLink, CandidateSearchProfile, CandidateProject, CandidateAchievement,
@@ -384,13 +385,15 @@ class ResumeTemplateSerializer(serializers.ModelSerializer):
         ]
 
 
-class ResumeSharingLinkSerializer(serializers.ModelSerializer):
+class ResumeSharingLinkSerializer(PendingCountersMixin, serializers.ModelSerializer):
     """Serializer for resume sharing links"""
     resume_title = serializers.CharField(source='resume.title', read_only=True)
     share_url = serializers.SerializerMethodField()
+    pending_counters = {'view_count': 'resume_share_views'}
     
     class Meta:
         model = ResumeSharingLink
+        list_serializer_class = PendingCountersListSerializer
         fields = [
             'id', 'link_id', 'resume_title', 'share_url', 'is_active', 
             'view_count', 'password_protected', 'expires_at', 'created_at'
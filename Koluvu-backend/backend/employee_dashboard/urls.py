@@ -37,6 +37,7 @@ from .views import (
     resume_templates_list,
     generate_resume_pdf,
     create_resume_sharing_link,
+    shared_resume,
     # Job-related views
     applications_list,
     location_based_jobs,
@@ -120,6 +121,7 @@ urlpatterns = [
     path('resume-builder/templates/', resume_templates_list, name='resume_templates_list'),
     path('resume-builder/resumes/<int:resume_id>/generate-pdf/', generate_resume_pdf, name='generate_resume_pdf'),
     path('resume-builder/resumes/<int:resume_id>/create-sharing-link/', create_resume_sharing_link, name='create_resume_sharing_link'),
+    path('shared-resume/<str:link_id>/', shared_resume, name='shared_resume'),
     
     # Employee Settings URLs
     path('settings/', EmployeeSettingsView.as_view(), name='employee_settings'),
@@ -1,6 +1,6 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.decorators import api_view, permission_classes, authentication_classes
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from django.contrib.auth import authenticate
@@ -885,31 +885,6 @@ def applications_list(request):
         )
 
 
-@api_view(['GET'])
-@authentication_classes([JWTAuthentication])
-@permission_classes([IsAuthenticated])
-def location_based_jobs(request):
-    """Get location-based job recommendations"""
-    try:
-        profile, created = EmployeeProfile.objects.get_or_create(user=request.user)
-        user_location = profile.location or 'Not specified'
-        
-        # TODO: Implement job matching logic based on location
-        # For now, return empty list with proper structure
-        return Response({
-            'jobs': [],
-            'user_location': user_location,
-            'search_radius': 50,  # km
-            'total_count': 0,
-            'message': 'Location-based job matching feature coming soon'
-        })
-    except Exception as e:
-        return Response(
-            {'error': f'Failed to fetch location-based jobs: {str(e)}'}, 
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-
 @api_view(['GET'])
 @authentication_classes([JWTAuthentication])
 @permission_classes([IsAuthenticated])
@@ -1331,6 +1306,59 @@ def create_resume_sharing_link(request, resume_id):
         )
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def shared_resume(request, link_id):
+    """
+    Public read of a shared resume. Password protected links take the
+    password in the X-Share-Password header.
+    
+    Clients holding the current version of the resume get a 304 before it
+    is loaded; every read counts as a view of the link.
+    """
+    from django.contrib.auth.hashers import check_password
+    from django.utils import timezone
+    from shared_services.http_cache import (
+        not_modified_response, private_cache_control, public_cache_control,
+        set_conditional_headers, weak_etag,
+    )
+    from .serializers import ResumeBuilderSerializer
+    
+    sharing_link = ResumeSharingLink.objects.filter(link_id=link_id, is_active=True).only(
+        'id', 'resume_id', 'password_protected', 'password', 'expires_at'
+    ).first()
+    if sharing_link is None or (sharing_link.expires_at and sharing_link.expires_at < timezone.now()):
+        return Response(
+            {'error': 'Shared resume not found or link expired'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    if sharing_link.password_protected:
+        password = request.headers.get('X-Share-Password', '')
+        if not password or not check_password(password, sharing_link.password):
+            return Response(
+                {'error': 'Password required'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        # Shared caches must not serve a protected resume to others
+        cache_control = private_cache_control()
+    else:
+        cache_control = public_cache_control()
+    
+    updated_at = Resume.objects.filter(id=sharing_link.resume_id).values_list('updated_at', flat=True).first()
+    etag = weak_etag('shared_resume', sharing_link.resume_id, updated_at)
+    
+    sharing_link.increment_views()
+    
+    response = not_modified_response(request, etag, updated_at, cache_control)
+    if response is not None:
+        return response
+    
+    resume = Resume.objects.get(id=sharing_link.resume_id)
+    serializer = ResumeBuilderSerializer(resume, context={'request': request})
+    return set_conditional_headers(Response(serializer.data), etag, updated_at, cache_control)
+
+
 # ================== JOB RELATED VIEWS ==================
 
 @api_view(['GET'])
@@ -1366,20 +1394,68 @@ def employee_applications(request):
 @authentication_classes([JWTAuthentication])
 @permission_classes([IsAuthenticated])
 def location_based_jobs(request):
-    """Get jobs based on employee's location"""
+    """
+    Open jobs within ``radius`` km (default 50) of the employee's location,
+    or of the ``location`` query parameter; nearest and newest first
+    """
+    import math
+    from shared_services.geo import geocode
+    from employer_dashboard.job_search_service import jobs_near, public_job_list_projection
+    from employer_dashboard.serializers import PublicJobListSerializer
+    
     try:
         profile, created = EmployeeProfile.objects.get_or_create(user=request.user)
         
-        # TODO: Implement actual job matching based on location
-        # For now, return empty data structure
-        jobs = []
+        try:
+            radius = float(request.query_params.get('radius', 50))
+            if not math.isfinite(radius):
+                raise ValueError('radius must be finite')
+            radius = min(max(radius, 1), 500)
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get('page_size', 20)), 1), 100)
+        except ValueError:
+            return Response(
+                {'error': 'radius, page and page_size must be numbers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        location = request.query_params.get('location', '').strip()
+        if location:
+            coordinates = geocode(location)
+        else:
+            location = profile.location
+            if profile.latitude is not None:
+                coordinates = (profile.latitude, profile.longitude)
+            else:
+                coordinates = geocode(location)
+        
+        if coordinates is None:
+            return Response({
+                'jobs': [],
+                'total_count': 0,
+                'location': location or 'Not specified',
+                'radius': radius,  # km
+                'message': 'Add a city to your location to see jobs near you'
+            })
+        
+        jobs = jobs_near(*coordinates, radius)
+        total_count = jobs.count()
+        offset = (page - 1) * page_size
+        page_jobs = list(public_job_list_projection(jobs)[offset:offset + page_size])
+        
+        results = PublicJobListSerializer(page_jobs, many=True).data
+        for job, data in zip(page_jobs, results):
+            data['distance_km'] = round(job.distance_km, 1)
         
         return Response({
-            'jobs': jobs,
-            'total_count': 0,
-            'location': profile.location or 'Not specified',
-            'radius': 50,  # km
-            'message': 'Location-based job matching will be available soon'
+            'jobs': results,
+            'total_count': total_count,
+            'page': page,
+            'page_size': page_size,
+            'location': location,
+            'latitude': coordinates[0],
+            'longitude': coordinates[1],
+            'radius': radius,  # km
         })
         
     except Exception as e:
@@ -0,0 +1,100 @@
+# backend/employer_dashboard/application_scoring_service.py
+
+import logging
+from typing import Any, Dict
+
+from django.db import close_old_connections, connection, transaction
+
+from shared_services.ats import document_cache
+from shared_services.ats.extraction import get_extraction_pool
+from shared_services.ats.services import ATSAnalyzerService
+from .models import Job, JobApplication
+
+logger = logging.getLogger(__name__)
+
+
+def resume_source(application):
+    """Local path of the stored resume, or its bytes for remote storage backends"""
+    try:
+        return application.resume.path
+    except NotImplementedError:
+        application.resume.open('rb')
+        try:
+            return application.resume.read()
+        finally:
+            application.resume.close()
+
+
+def queue_application_scoring(application: JobApplication):
+    """
+    Extract the resume text of a freshly created application in the
+    extraction pool and fill in its ATS score once that finishes.
+
+    Must be called after the application row is committed.
+    """
+    if not application.resume:
+        JobApplication.objects.filter(id=application.id).update(ats_status='failed')
+        return
+
+    file_type = application.resume_file_name.lower().rsplit('.', 1)[-1]
+    application_id = application.id
+    digest = application.resume_sha256
+
+    # The same resume uploaded to another job has already been parsed
+    cached = document_cache.lookup(digest)
+    if cached is not None:
+        complete_application_scoring(application_id, cached)
+        return
+
+    def _on_extracted(result: Dict[str, Any]):
+        # Runs on the pool's management thread with its own DB connection
+        close_old_connections()
+        try:
+            document_cache.store(digest, file_type, result)
+            complete_application_scoring(application_id, result)
+        finally:
+            connection.close()
+
+    try:
+        get_extraction_pool().submit(resume_source(application), file_type, callback=_on_extracted)
+    except Exception as e:
+        logger.error(f"Could not queue resume extraction for application {application_id}: {str(e)}")
+        JobApplication.objects.filter(id=application_id).update(ats_status='failed')
+
+
+def complete_application_scoring(application_id: int, result: Dict[str, Any]):
+    """Store extracted resume text and the resulting ATS score on an application"""
+    resume_text = result.get('text') or ''
+    if result.get('error'):
+        logger.warning(f"Resume extraction failed for application {application_id}: {result['error']}")
+
+    if not resume_text:
+        # Transient failures stay pending for process_pending_resumes to retry
+        if not result.get('transient'):
+            JobApplication.objects.filter(id=application_id).update(ats_status='failed')
+        return
+
+    job = Job.objects.filter(applications__id=application_id).only(
+        'id', 'skills', 'requirements', 'ats_keywords',
+        'ats_keyword_profile', 'ats_keyword_version'
+    ).first()
+    if job is None:
+        return
+
+    match_result = ATSAnalyzerService().match_resume_to_job(resume_text, job)
+    JobApplication.objects.filter(id=application_id).update(
+        resume_text=resume_text,
+        ats_score=match_result.get('ats_score', 0),
+        matching_keywords=match_result.get('matching_keywords', []),
+        missing_keywords=match_result.get('missing_keywords', []),
+        ats_status='completed',
+    )
+    logger.info(
+        f"ATS Analysis - Application: {application_id}, Score: {match_result.get('ats_score', 0)}, "
+        f"Matched: {match_result.get('matched_count', 0)}"
+    )
+
+
+def schedule_application_scoring(application: JobApplication):
+    """Queue scoring once the surrounding transaction commits"""
+    transaction.on_commit(lambda: queue_application_scoring(application))
@@ -6,13 +6,17 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.db import transaction
+from django.db.models import Avg
 from django.shortcuts import get_object_or_404
 import logging
 
 from .models import Job, JobApplication, EmployerProfile
 from employee_dashboard.models import EmployeeProfile
 from .serializers import JobApplicationSerializer, ApplicantDetailSerializer
-from shared_services.ats.services import ATSAnalyzerService
+from shared_services.ats.ranking import build_job_document, rank_documents
+from .ats_rescoring_service import request_job_rescoring
+from .application_scoring_service import schedule_application_scoring
+from shared_services.ats.upload_handlers import get_upload_digest
 
 logger = logging.getLogger(__name__)
 
@@ -79,34 +83,6 @@ class JobApplyView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Extract text from resume and calculate ATS score
-            ats_service = ATSAnalyzerService()
-            resume_text = ""
-            ats_score = 0
-            matching_keywords = []
-            missing_keywords = []
-            
-            try:
-                # Extract text from PDF
-                if file_ext == 'pdf':
-                    resume_text = ats_service.extract_text_from_pdf(resume_file)
-                    resume_file.seek(0)  # Reset file pointer for saving
-                
-                # Match resume to job requirements
-                if resume_text:
-                    match_result = ats_service.match_resume_to_job(resume_text, job)
-                    ats_score = match_result.get('ats_score', 0)
-                    matching_keywords = match_result.get('matching_keywords', [])
-                    missing_keywords = match_result.get('missing_keywords', [])
-                    
-                    logger.info(f"ATS Analysis - Score: {ats_score}, Matched: {len(matching_keywords)}, Missing: {len(missing_keywords)}")
-                else:
-                    logger.warning(f"Could not extract text from resume: {resume_file.name}")
-                    
-            except Exception as e:
-                logger.error(f"Error in ATS analysis: {str(e)}")
-                # Continue with application even if ATS fails
-            
             # Parse screening answers if string
             if isinstance(screening_answers, str):
                 import json
@@ -126,30 +102,26 @@ class JobApplyView(APIView):
                     resume=resume_file,
                     resume_file_name=resume_file.name,
                     resume_file_size=resume_file.size,
+                    resume_sha256=get_upload_digest(request, 'resume', resume_file),
                     cover_letter=cover_letter,
                     screening_answers=screening_answers,
-                    ats_score=ats_score,
-                    matching_keywords=matching_keywords,
-                    missing_keywords=missing_keywords,
+                    ats_status='pending',
                     status='pending'
                 )
                 
-                # Extract and save keywords to job if not already done
-                if job.ats_keywords:
-                    try:
-                        job.extract_keywords_from_description()
-                        job.save()
-                    except Exception as e:
-                        logger.error(f"Error extracting job keywords: {str(e)}")
+                # Resume parsing and ATS scoring run in the extraction pool;
+                # the score is filled in once the worker finishes
+                schedule_application_scoring(application)
+            
+            job.increment_applications()
             
             serializer = JobApplicationSerializer(application)
             return Response({
                 "message": "Application submitted successfully!",
                 "application": serializer.data,
                 "ats_analysis": {
-                    "score": ats_score,
-                    "matched_keywords_count": len(matching_keywords),
-                    "missing_keywords_count": len(missing_keywords)
+                    "status": application.ats_status,
+                    "score": application.ats_score
                 }
             }, status=status.HTTP_201_CREATED)
             
@@ -181,7 +153,7 @@ class JobApplicantsListView(generics.ListAPIView):
             # Get all applications for this job, ordered by ATS score
             queryset = JobApplication.objects.filter(job=job).select_related(
                 'employee', 'employee__user'
-            ).order_by('-ats_score', '-applied_at')
+            ).defer('resume_text').order_by('-ats_score', '-applied_at')
             
             return queryset
             
@@ -201,8 +173,7 @@ class JobApplicantsListView(generics.ListAPIView):
         
         avg_ats_score = 0
         if total_count > 0:
-            total_score = sum([app.ats_score for app in queryset])
-            avg_ats_score = round(total_score / total_count, 2)
+            avg_ats_score = round(queryset.aggregate(avg=Avg('ats_score'))['avg'] or 0, 2)
         
         return Response({
             "count": total_count,
@@ -218,6 +189,89 @@ class JobApplicantsListView(generics.ListAPIView):
         })
 
 
+class JobApplicantsRankingView(APIView):
+    """
+    Rank all applicants for a job by TF-IDF similarity of their resume text
+    to the job (employer only)
+    GET /api/employer/jobs/<id>/applicants/ranked/?limit=50&terms=10
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, job_id):
+        try:
+            employer_profile = EmployerProfile.objects.get(user=request.user)
+        except EmployerProfile.DoesNotExist:
+            return Response(
+                {"error": "Employer profile not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        job = get_object_or_404(Job, id=job_id, employer=employer_profile)
+        
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 500)
+            top_terms = min(max(int(request.query_params.get('terms', 10)), 0), 50)
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "limit and terms must be integers"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Only the id and text columns are needed to score every applicant
+        documents = list(JobApplication.objects.filter(job=job).values_list('id', 'resume_text'))
+        top = rank_documents(build_job_document(job), documents, top_terms=top_terms, limit=limit)
+        
+        applications = JobApplication.objects.filter(
+            id__in=[entry['key'] for entry in top]
+        ).select_related('employee', 'employee__user', 'job', 'job__employer').defer('resume_text').in_bulk()
+        
+        results = []
+        for rank, entry in enumerate(top, start=1):
+            application = applications.get(entry['key'])
+            if application is None:
+                continue
+            results.append({
+                "rank": rank,
+                "relevance_score": entry['score'],
+                "term_contributions": entry['terms'],
+                "application": JobApplicationSerializer(application).data,
+            })
+        
+        return Response({
+            "count": len(documents),
+            "results": results
+        })
+
+
+class JobApplicantsRescoreView(APIView):
+    """
+    Queue re-computing the ATS scores of every applicant of a job after the
+    job's skills, requirements or ATS keywords change (employer only);
+    responds 202 and the scores are updated in the background
+    POST /api/employer/jobs/<id>/applicants/rescore/
+    """
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request, job_id):
+        try:
+            employer_profile = EmployerProfile.objects.get(user=request.user)
+        except EmployerProfile.DoesNotExist:
+            return Response(
+                {"error": "Employer profile not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        job = get_object_or_404(Job, id=job_id, employer=employer_profile)
+        
+        request_job_rescoring(job)
+        
+        return Response({
+            "message": "Re-scoring of the applicants has been queued",
+            "job_id": job.id,
+            "applications": JobApplication.objects.filter(job=job).count()
+        }, status=status.HTTP_202_ACCEPTED)
+
+
 class ApplicantDetailView(generics.RetrieveUpdateAPIView):
     """
     Get full applicant details with employee profile (employer only)
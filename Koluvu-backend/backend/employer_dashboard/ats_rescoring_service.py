@@ -0,0 +1,216 @@
+# backend/employer_dashboard/ats_rescoring_service.py
+
+import time
+import logging
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from shared_services.ats.services import ATSAnalyzerService
+from .models import Job, JobApplication
+
+logger = logging.getLogger(__name__)
+
+SCORE_FIELDS = ['ats_score', 'matching_keywords', 'missing_keywords']
+
+
+def score_chunk(rows: List[tuple], job_keywords: Dict[int, Dict[str, int]]) -> List[tuple]:
+    """
+    Score a chunk of ``(application_id, job_id, resume_text)`` rows.
+
+    Runs inside worker processes, so it only works on plain data and never
+    touches the database.
+    """
+    analyzer = ATSAnalyzerService()
+    results = []
+    for application_id, job_id, resume_text in rows:
+        match = analyzer.match_resume_to_keywords(resume_text, job_keywords.get(job_id, {}))
+        results.append((
+            application_id,
+            match['ats_score'],
+            match['matching_keywords'],
+            match['missing_keywords'],
+        ))
+    return results
+
+
+class ATSRescoringService:
+    """Recompute JobApplication ATS scores in chunks, optionally across a process pool"""
+
+    def __init__(self, workers: int = 1, chunk_size: int = 500,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.workers = max(int(workers or 1), 1)
+        self.chunk_size = max(int(chunk_size or 500), 1)
+        self.progress = progress
+        self.analyzer = ATSAnalyzerService()
+        self._job_keywords: Dict[int, Dict[str, int]] = {}
+
+    def rescore(self, queryset=None) -> Dict[str, Any]:
+        """
+        Re-score every application in ``queryset`` (all applications by default).
+
+        Applications without extracted resume text are skipped and keep
+        their current score.
+
+        Returns:
+            Run statistics: totals, elapsed seconds and throughput
+        """
+        if queryset is None:
+            queryset = JobApplication.objects.all()
+
+        scorable = queryset.exclude(resume_text='')
+        stats = {
+            'total': queryset.count(),
+            'scorable': scorable.count(),
+            'scored': 0,
+            'skipped': 0,
+            'elapsed_seconds': 0.0,
+            'per_second': 0.0,
+        }
+        stats['skipped'] = stats['total'] - stats['scorable']
+        started = time.monotonic()
+
+        if self.workers > 1:
+            self._run_pool(scorable, stats, started)
+        else:
+            for rows, keywords in self._iter_chunks(scorable):
+                self._write(score_chunk(rows, keywords), stats, started)
+
+        self._update_timing(stats, started)
+        logger.info(
+            f"ATS re-scoring finished - scored: {stats['scored']}, skipped: {stats['skipped']}, "
+            f"{stats['per_second']} applications/sec"
+        )
+        return stats
+
+    def _run_pool(self, scorable, stats, started):
+        chunks = self._iter_chunks(scorable)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            return
+        # The first submit forks the workers, after the first chunk query has
+        # opened a connection; close it so no worker inherits it
+        connections.close_all()
+
+        max_in_flight = self.workers * 2
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for rows, keywords in itertools.chain([first_chunk], chunks):
+                pending.add(executor.submit(score_chunk, rows, keywords))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self._write(future.result(), stats, started)
+
+            for future in pending:
+                self._write(future.result(), stats, started)
+
+    def _iter_chunks(self, scorable):
+        """Yield ``(rows, job_keywords)`` chunks using keyset pagination on id"""
+        last_id = 0
+        while True:
+            rows = list(
+                scorable.filter(id__gt=last_id)
+                .order_by('id')
+                .values_list('id', 'job_id', 'resume_text')[:self.chunk_size]
+            )
+            if not rows:
+                return
+
+            last_id = rows[-1][0]
+            job_ids = {job_id for _, job_id, _ in rows}
+            yield rows, self._keywords_for(job_ids)
+
+    def _keywords_for(self, job_ids) -> Dict[int, Dict[str, int]]:
+        """Job keyword profiles for a chunk, loading each job at most once per run"""
+        missing = [job_id for job_id in job_ids if job_id not in self._job_keywords]
+        if missing:
+            jobs = Job.objects.filter(id__in=missing).only(
+                'id', 'skills', 'requirements', 'ats_keywords',
+                'ats_keyword_profile', 'ats_keyword_version'
+            )
+            for job in jobs:
+                self._job_keywords[job.id] = self.analyzer.get_job_keywords(job)
+
+        return {job_id: self._job_keywords.get(job_id, {}) for job_id in job_ids}
+
+    def _write(self, results, stats, started):
+        applications = [
+            JobApplication(
+                id=application_id,
+                ats_score=ats_score,
+                matching_keywords=matching_keywords,
+                missing_keywords=missing_keywords,
+            )
+            for application_id, ats_score, matching_keywords, missing_keywords in results
+        ]
+        JobApplication.objects.bulk_update(applications, SCORE_FIELDS, batch_size=self.chunk_size)
+
+        stats['scored'] += len(applications)
+        self._update_timing(stats, started)
+        if self.progress:
+            self.progress(stats)
+
+    def _update_timing(self, stats, started):
+        elapsed = time.monotonic() - started
+        stats['elapsed_seconds'] = round(elapsed, 2)
+        stats['per_second'] = round(stats['scored'] / elapsed, 1) if elapsed > 0 else 0.0
+
+
+_executor_lock = threading.Lock()
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ats-rescore')
+        return _executor
+
+
+def request_job_rescoring(job: Job):
+    """
+    Queue re-scoring of every applicant of a job.
+
+    The request is recorded on the job, so ``rescore_applications
+    --requested`` picks it up if the process stops before it runs, and is
+    handed to a background thread once the surrounding transaction commits.
+    """
+    Job.objects.filter(id=job.id).update(rescore_requested_at=timezone.now())
+    transaction.on_commit(lambda: _get_executor().submit(_rescore_in_background, [job.id]))
+
+
+def _rescore_in_background(job_ids):
+    try:
+        rescore_requested_jobs(job_ids)
+    except Exception as e:
+        logger.error(f"Queued ATS re-scoring of jobs {job_ids} failed: {str(e)}")
+    finally:
+        connections.close_all()
+
+
+def rescore_requested_jobs(job_ids: Optional[Iterable[int]] = None, **service_options) -> Dict[str, Any]:
+    """
+    Re-score the applicants of jobs with a pending re-scoring request (only
+    ``job_ids`` when given) and clear the requests.
+
+    A request made again while its job is being re-scored is kept for the
+    next run.
+    """
+    requested = Job.objects.filter(rescore_requested_at__isnull=False)
+    if job_ids is not None:
+        requested = requested.filter(id__in=list(job_ids))
+
+    totals = {'jobs': 0, 'scored': 0, 'skipped': 0}
+    for job_id, requested_at in requested.order_by('id').values_list('id', 'rescore_requested_at'):
+        stats = ATSRescoringService(**service_options).rescore(JobApplication.objects.filter(job_id=job_id))
+        Job.objects.filter(id=job_id, rescore_requested_at=requested_at).update(rescore_requested_at=None)
+        totals['jobs'] += 1
+        totals['scored'] += stats['scored']
+        totals['skipped'] += stats['skipped']
+    return totals
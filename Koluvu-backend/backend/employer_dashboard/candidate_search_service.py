@@ -0,0 +1,504 @@
+# backend/employer_dashboard/candidate_search_service.py
+
+"""
+Candidate search predicates and saved-search percolation.
+
+``CandidateSearch`` compiles boolean search criteria once into a single
+``Q`` over ``CandidateSearchDocument`` rows. The search view applies it to
+the whole pool; saved searches store the compiled predicate as JSON and
+are matched the other way round: when one candidate's search document
+changes, ``percolate_candidates`` looks up only the saved searches whose
+index keys (query terms, locations, department) occur in that document
+and evaluates their predicates against that single row. Saving a profile
+only queues that work (``request_percolation``); it runs on a background
+thread after the save commits, or from ``percolate_saved_searches``.
+
+Result pages are keyset-paginated over (score, last_active, profile id):
+the cursor holds the last row's sort key, so every page is a bounded
+``WHERE ... ORDER BY ... LIMIT`` and deep pages need no OFFSET.
+"""
+import base64
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import connection, connections, transaction
+from django.db.models import BooleanField, Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Least
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from employee_dashboard.search_documents import SEARCH_CONFIG, supports_search_vector
+from shared_services.ats.skills import skill_spellings
+from shared_services.boolean_query import (
+    Not, Operation, Term, compile_query, compile_search_query, normalize_search_text, parse_boolean_query
+)
+
+logger = logging.getLogger(__name__)
+
+# Saved searches evaluated per query during percolation
+PERCOLATE_BATCH_SIZE = 100
+
+# Index key matching every candidate, for searches without a required token
+MATCH_ALL_KEY = '*'
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+# Totals up to this many rows are counted exactly, larger ones estimated
+EXACT_COUNT_LIMIT = 1000
+
+# Stable result order; profile_id breaks ties so the keyset is unique
+RESULT_ORDERING = (
+    F('search_match_score').desc(),
+    F('last_active').desc(nulls_last=True),
+    F('profile_id').asc(),
+)
+
+
+class InvalidCursor(ValueError):
+    """The pagination cursor is malformed"""
+
+
+def parse_experience_range(experience_str):
+    """Parse experience range string to min and max years"""
+    if '0-1' in experience_str:
+        return 0, 1
+    elif '1-3' in experience_str:
+        return 1, 3
+    elif '3-5' in experience_str:
+        return 3, 5
+    elif '5+' in experience_str:
+        return 5, None
+    return None, None
+
+
+def parse_salary_range(salary_str):
+    """Parse salary range string to min and max in lakhs"""
+    if '0-3' in salary_str:
+        return 0, 300000
+    elif '3-6' in salary_str:
+        return 300000, 600000
+    elif '6-10' in salary_str:
+        return 600000, 1000000
+    elif '10-15' in salary_str:
+        return 1000000, 1500000
+    elif '15+' in salary_str:
+        return 1500000, None
+    return None, None
+
+
+def parse_text_filter(value):
+    """A free-text filter such as a location, matched as one whole-word phrase"""
+    text = normalize_search_text(value).strip()
+    return Term(text) if text else None
+
+
+class CandidateSearch:
+    """
+    Boolean candidate search criteria (``BooleanSearchRequestSerializer``
+    data) compiled against ``CandidateSearchDocument``.
+
+    Raises BooleanQueryError when the query is invalid.
+    """
+
+    def __init__(self, criteria):
+        self.criteria = dict(criteria)
+        query = (self.criteria.get('query') or '').strip()
+        self.query = parse_boolean_query(query) if query else None
+        self.location = parse_text_filter(self.criteria.get('location'))
+        self.designation = parse_text_filter(self.criteria.get('designation'))
+        self.department = (self.criteria.get('department') or '').strip().lower()
+
+    def predicate(self) -> Q:
+        """Exact filter over the search document columns"""
+        criteria = self.criteria
+        predicate = Q(is_searchable=True)
+
+        # Location filter
+        if self.location is not None:
+            predicate &= (
+                compile_query(self.location, field='location_text') |
+                compile_query(self.location, field='preferred_location_text')
+            )
+
+        # Department filter
+        if self.department:
+            predicate &= Q(department=self.department)
+
+        # Designation filter
+        if self.designation is not None:
+            predicate &= compile_query(self.designation, field='designation_text')
+
+        # Experience filter
+        experience = criteria.get('experience')
+        if experience:
+            exp_min, exp_max = parse_experience_range(experience)
+            if exp_min is not None:
+                predicate &= Q(experience_years__gte=exp_min)
+            if exp_max is not None:
+                predicate &= Q(experience_years__lte=exp_max)
+
+        # Notice period filter
+        notice_period = criteria.get('notice_period')
+        if notice_period:
+            predicate &= Q(notice_period__icontains=notice_period)
+
+        # Salary range filter
+        salary_range = criteria.get('salary_range')
+        if salary_range:
+            sal_min, sal_max = parse_salary_range(salary_range)
+            if sal_min is not None:
+                predicate &= Q(expected_ctc__gte=sal_min) | Q(expected_ctc__isnull=True)
+            if sal_max is not None:
+                predicate &= Q(expected_ctc__lte=sal_max) | Q(expected_ctc__isnull=True)
+
+        # Actively looking filter
+        if criteria.get('actively_looking'):
+            predicate &= Q(actively_looking=True)
+
+        # Boolean query filter
+        if self.query is not None:
+            predicate &= compile_query(self.query, field='search_text', expand=skill_spellings)
+
+        return predicate
+
+    def search_query(self):
+        """Full-text prefilter for the GIN-indexed search vector, or None"""
+        search_query = None
+        for node, expand in ((self.location, None), (self.designation, None), (self.query, skill_spellings)):
+            if node is None:
+                continue
+            compiled = compile_search_query(node, expand=expand, config=SEARCH_CONFIG)
+            if compiled is not None:
+                search_query = compiled if search_query is None else search_query & compiled
+        return search_query
+
+    def filter(self, queryset):
+        """
+        Apply the search to a document queryset, narrowing it through the
+        search vector before the exact token predicates are checked
+        """
+        queryset = queryset.filter(self.predicate())
+        search_query = self.search_query() if supports_search_vector() else None
+        if search_query is not None:
+            queryset = queryset.filter(search_vector=search_query)
+        return queryset
+
+    def annotate_match_scores(self, queryset, now=None):
+        """
+        Annotate each candidate with a match score computed by the database.
+        Pages of one search pass the same ``now`` so recency bonuses, and
+        with them the sort order, stay fixed across pages.
+        """
+        # This is a simplified scoring system
+        # In production, you'd want a more sophisticated algorithm
+        now = now or timezone.now()
+        score = Value(70)  # Base score
+
+        # Location match
+        if self.location is not None:
+            score += Case(
+                When(compile_query(self.location, field='location_text'), then=Value(10)),
+                When(compile_query(self.location, field='preferred_location_text'), then=Value(5)),
+                default=Value(0),
+            )
+
+        # Department exact match
+        if self.department:
+            score += Case(When(department=self.department, then=Value(10)), default=Value(0))
+
+        # Actively looking bonus
+        score += Case(When(actively_looking=True, then=Value(5)), default=Value(0))
+
+        # Recent activity bonus
+        score += Case(
+            When(last_active__gt=now - timedelta(days=7), then=Value(5)),
+            When(last_active__gt=now - timedelta(days=30), then=Value(2)),
+            default=Value(0),
+        )
+
+        # Cap score at 100
+        return queryset.annotate(
+            search_match_score=Least(score, Value(100), output_field=IntegerField())
+        )
+
+    def index_keys(self):
+        """
+        Percolation keys: a candidate can only match when its document has
+        at least one of them. The smallest required clause is used.
+        """
+        clauses = _required_clauses(self.query) if self.query is not None else []
+        if self.designation is not None:
+            clauses.append({_token_key(self.designation.text)})
+        if self.location is not None:
+            clauses.append({_location_key(self.location.text)})
+        if self.department:
+            clauses.append({f'dept:{self.department}'})
+        if not clauses:
+            return {MATCH_ALL_KEY}
+        # Fewer keys means fewer candidates percolated; prefer query terms on ties
+        return min(clauses, key=len)
+
+
+def _token_key(text):
+    return f't:{text.split()[0]}'
+
+
+def _location_key(text):
+    return f'loc:{text.split()[0]}'
+
+
+def _required_clauses(node):
+    """
+    Sets of index keys a matching document must hit at least one key of,
+    for each clause the query requires
+    """
+    if isinstance(node, Term):
+        variants = [node.text] + [
+            normalize_search_text(variant).strip() for variant in skill_spellings(node.text)
+        ]
+        return [{_token_key(variant) for variant in variants if variant}]
+    if isinstance(node, Not):
+        return []
+    if isinstance(node, Operation) and node.operator == 'AND':
+        clauses = []
+        for child in node.children:
+            clauses.extend(_required_clauses(child))
+        return clauses
+
+    # OR: one of the children has to match, so any child's keys will do
+    keys = set()
+    for child in node.children:
+        child_clauses = _required_clauses(child)
+        if not child_clauses:
+            return []
+        keys |= min(child_clauses, key=len)
+    return [keys]
+
+
+def document_index_keys(document):
+    """Every index key a search document hits"""
+    keys = {MATCH_ALL_KEY}
+    keys.update(f't:{token}' for token in document.search_text.split())
+    keys.update(f't:{token}' for token in document.designation_text.split())
+    keys.update(f'loc:{token}' for token in document.location_text.split())
+    keys.update(f'loc:{token}' for token in document.preferred_location_text.split())
+    if document.department:
+        keys.add(f'dept:{document.department}')
+    return keys
+
+
+def serialize_predicate(predicate):
+    """JSON representation of a ``Q`` tree whose leaves hold plain values"""
+    return {
+        'connector': predicate.connector,
+        'negated': predicate.negated,
+        'children': [
+            serialize_predicate(child) if isinstance(child, Q) else [child[0], child[1]]
+            for child in predicate.children
+        ],
+    }
+
+
+def deserialize_predicate(data):
+    children = [
+        deserialize_predicate(child) if isinstance(child, dict) else tuple(child)
+        for child in data.get('children', [])
+    ]
+    return Q(*children, _connector=data.get('connector', Q.AND), _negated=data.get('negated', False))
+
+
+def percolate_candidates(profile_ids):
+    """
+    Match the search documents of the given profiles against all active
+    saved searches and add new matches to each search's inbox.
+
+    Returns the number of (search, candidate) matches found.
+    """
+    CandidateSearchDocument = apps.get_model('employee_dashboard', 'CandidateSearchDocument')
+    SavedCandidateSearch = apps.get_model('employer_dashboard', 'SavedCandidateSearch')
+    SavedCandidateSearchKey = apps.get_model('employer_dashboard', 'SavedCandidateSearchKey')
+    SavedCandidateSearchMatch = apps.get_model('employer_dashboard', 'SavedCandidateSearchMatch')
+
+    documents = CandidateSearchDocument.objects.filter(profile_id__in=profile_ids, is_searchable=True).only(
+        'profile_id', 'search_text', 'designation_text', 'location_text', 'preferred_location_text', 'department'
+    )
+    matches = []
+    predicates = {}
+    for document in documents:
+        search_ids = set(
+            SavedCandidateSearchKey.objects.filter(
+                key__in=document_index_keys(document), search__is_active=True
+            ).values_list('search_id', flat=True)
+        )
+        if not search_ids:
+            continue
+
+        missing = search_ids - predicates.keys()
+        if missing:
+            for search_id, predicate in SavedCandidateSearch.objects.filter(id__in=missing).values_list('id', 'predicate'):
+                predicates[search_id] = deserialize_predicate(predicate)
+
+        # One query per batch evaluates every candidate search against this row
+        search_ids = sorted(search_id for search_id in search_ids if search_id in predicates)
+        for start in range(0, len(search_ids), PERCOLATE_BATCH_SIZE):
+            batch = search_ids[start:start + PERCOLATE_BATCH_SIZE]
+            row = CandidateSearchDocument.objects.filter(profile_id=document.profile_id).values(**{
+                f'search_{search_id}': Case(
+                    When(predicates[search_id], then=Value(True)), default=Value(False), output_field=BooleanField()
+                )
+                for search_id in batch
+            }).first() or {}
+            matches.extend(
+                SavedCandidateSearchMatch(search_id=search_id, candidate_id=document.profile_id)
+                for search_id in batch if row.get(f'search_{search_id}')
+            )
+
+    if matches:
+        # Candidates already in a search's inbox stay as they are
+        SavedCandidateSearchMatch.objects.bulk_create(matches, ignore_conflicts=True)
+        SavedCandidateSearch.objects.filter(
+            id__in={match.search_id for match in matches}
+        ).update(last_matched_at=timezone.now())
+        logger.info(f"Percolated {len(profile_ids)} candidates into {len(matches)} saved search matches")
+    return len(matches)
+
+
+_executor_lock = threading.Lock()
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='percolate')
+        return _executor
+
+
+def request_percolation(profile_ids):
+    """
+    Queue matching the given profiles against saved searches.
+
+    The request is recorded on their search documents, so
+    ``percolate_saved_searches`` picks it up if the process stops before it
+    runs, and is handed to a background thread once the surrounding
+    transaction commits.
+    """
+    CandidateSearchDocument = apps.get_model('employee_dashboard', 'CandidateSearchDocument')
+    profile_ids = list(profile_ids)
+    requested_at = timezone.now()
+    CandidateSearchDocument.objects.filter(profile_id__in=profile_ids).update(percolation_requested_at=requested_at)
+    transaction.on_commit(
+        lambda: _get_executor().submit(_percolate_in_background, profile_ids, requested_at)
+    )
+
+
+def _percolate_in_background(profile_ids, requested_at):
+    try:
+        percolate_requested_candidates(profile_ids, requested_at)
+    except Exception as e:
+        logger.error(f"Queued percolation of candidates {profile_ids} failed: {str(e)}")
+    finally:
+        connections.close_all()
+
+
+def percolate_requested_candidates(profile_ids, requested_at) -> int:
+    """
+    Percolate the given profiles and clear their percolation requests made
+    up to ``requested_at``; a request made again meanwhile is kept for the
+    next run. Returns the number of matches found.
+    """
+    CandidateSearchDocument = apps.get_model('employee_dashboard', 'CandidateSearchDocument')
+    matches = percolate_candidates(profile_ids)
+    CandidateSearchDocument.objects.filter(
+        profile_id__in=profile_ids, percolation_requested_at__lte=requested_at
+    ).update(percolation_requested_at=None)
+    return matches
+
+
+def percolate_pending_candidates(batch_size=PERCOLATE_BATCH_SIZE) -> dict:
+    """Percolate every search document with a pending request, in batches of ``batch_size`` profiles"""
+    CandidateSearchDocument = apps.get_model('employee_dashboard', 'CandidateSearchDocument')
+    pending = CandidateSearchDocument.objects.filter(percolation_requested_at__isnull=False).order_by('profile_id')
+    totals = {'candidates': 0, 'matches': 0}
+    last_id = None
+    while True:
+        batch = pending if last_id is None else pending.filter(profile_id__gt=last_id)
+        rows = list(batch.values_list('profile_id', 'percolation_requested_at')[:batch_size])
+        if not rows:
+            break
+        profile_ids = [profile_id for profile_id, _ in rows]
+        last_id = profile_ids[-1]
+        totals['matches'] += percolate_requested_candidates(profile_ids, max(requested_at for _, requested_at in rows))
+        totals['candidates'] += len(profile_ids)
+    return totals
+
+
+def encode_cursor(score, last_active, profile_id, scored_at) -> str:
+    """Opaque cursor for the row after which the next page starts"""
+    key = [score, last_active.isoformat() if last_active else None, profile_id, scored_at.isoformat()]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    ``(score, last_active, profile_id, scored_at)`` from ``encode_cursor``;
+    raises InvalidCursor
+    """
+    try:
+        score, last_active, profile_id, scored_at = json.loads(
+            base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        )
+        if last_active is not None:
+            last_active = parse_datetime(last_active)
+            if last_active is None:
+                raise ValueError('invalid last_active')
+        scored_at = parse_datetime(scored_at)
+        if scored_at is None:
+            raise ValueError('invalid scored_at')
+        return int(score), last_active, int(profile_id), scored_at
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursor('Invalid cursor') from e
+
+
+def after_cursor(queryset, score, last_active, profile_id):
+    """Rows of a score-annotated queryset that sort after the given key in ``RESULT_ORDERING``"""
+    same_score = Q(search_match_score=score)
+    if last_active is None:
+        # NULL last_active sorts last, so only the tie-breaker is left
+        later = same_score & Q(last_active__isnull=True, profile_id__gt=profile_id)
+    else:
+        later = same_score & (
+            Q(last_active__lt=last_active) | Q(last_active__isnull=True) |
+            Q(last_active=last_active, profile_id__gt=profile_id)
+        )
+    return queryset.filter(Q(search_match_score__lt=score) | later)
+
+
+def approximate_count(queryset, limit=EXACT_COUNT_LIMIT):
+    """
+    ``(count, is_approximate)`` for a queryset. Counting stops after
+    ``limit`` rows; beyond that PostgreSQL's planner estimate is used.
+    """
+    queryset = queryset.order_by()
+    count = queryset[:limit + 1].count()
+    if count <= limit:
+        return count, False
+    if connection.vendor == 'postgresql':
+        plan = queryset.explain(format='json')
+        try:
+            # Text or decoded JSON depending on the Django version; a list
+            # holding the plan object, or the plan object itself
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            plan = plan[0] if isinstance(plan, list) else plan
+            count = max(int(plan['Plan']['Plan Rows']), count)
+        except (ValueError, LookupError, TypeError):
+            logger.warning('Unexpected EXPLAIN output, reporting the exact count limit as the total')
+    return count, True
+
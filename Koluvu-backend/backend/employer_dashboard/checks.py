@@ -0,0 +1,39 @@
+# backend/employer_dashboard/checks.py
+
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.checks import Tags, Warning, register
+from django.db import DatabaseError
+from django.utils import timezone
+
+# Days a job may stay active past its deadline before the sweep counts as missing
+EXPIRY_GRACE_DAYS = 1
+
+
+@register(Tags.database)
+def check_expired_jobs_swept(app_configs, databases=None, **kwargs):
+    """
+    Warn when active jobs are well past their deadline, i.e. ``expire_jobs``
+    is not scheduled. Runs with ``check --database default`` and ``migrate``.
+    """
+    if not databases or 'default' not in databases:
+        return []
+
+    Job = apps.get_model('employer_dashboard', 'Job')
+    cutoff = timezone.localdate() - timedelta(days=EXPIRY_GRACE_DAYS)
+    try:
+        overdue = Job.objects.filter(status='active', application_deadline__lt=cutoff).count()
+    except DatabaseError:
+        # Not migrated yet
+        return []
+    if not overdue:
+        return []
+    return [Warning(
+        f'{overdue} active job(s) passed their application deadline more than {EXPIRY_GRACE_DAYS} day(s) ago.',
+        hint=(
+            'Schedule "manage.py expire_jobs" (e.g. hourly from cron) or keep "manage.py expire_jobs --loop 3600" '
+            'running; the public job board treats every active job as open.'
+        ),
+        id='employer_dashboard.W001',
+    )]
@@ -14,6 +14,8 @@ import logging
 
 from .models import EmployerProfile, Job, JobApplication, Message
 from .serializers import EmployerProfileSerializer
+from .job_analytics import employer_view_summary
+from shared_services.http_cache import not_modified_response, private_cache_control, set_conditional_headers, weak_etag
 
 logger = logging.getLogger(__name__)
 
@@ -58,15 +60,15 @@ class DashboardStatsView(APIView):
                 logger.error(f"Error counting pending applications: {e}")
                 pending_applications_count = 0
             
-            # Today's views - simplified
+            # Today's views across all jobs
             try:
-                today_views_count = Job.objects.filter(
-                    employer=employer_profile, 
-                    created_at__date=today
-                ).count()
+                today_views = employer_view_summary(employer_profile)
+                today_views_count = today_views['views']
+                today_unique_viewers = today_views['unique_viewers']
             except Exception as e:
                 logger.error(f"Error counting today's views: {e}")
                 today_views_count = 0
+                today_unique_viewers = 0
             
             # Weekly stats
             try:
@@ -103,6 +105,7 @@ class DashboardStatsView(APIView):
                 'total_applications_count': total_applications_count,
                 'pending_applications_count': pending_applications_count,
                 'today_views_count': today_views_count,
+                'today_unique_viewers': today_unique_viewers,
                 'weekly_applications_count': weekly_applications,
                 'monthly_applications_count': monthly_applications,
                 'unread_messages_count': unread_messages_count,
@@ -140,18 +143,43 @@ class DashboardStatsView(APIView):
         return round((completed_fields / len(fields_to_check)) * 100)
 
 
+def employer_profile_etag(user, *extra):
+    """
+    ETag of the serialized employer profile of ``user``, or None without one.
+    
+    Besides ``updated_at`` it covers the user fields and login metadata that
+    are saved without touching ``updated_at``, and the date, since the days
+    until the next name change are part of the body. No Last-Modified is
+    sent for the same reason.
+    """
+    row = EmployerProfile.objects.filter(user=user).values_list(
+        'id', 'updated_at', 'last_login_ip', 'last_login_location',
+        'user__username', 'user__email', 'user__first_name', 'user__last_name'
+    ).first()
+    if row is None:
+        return None
+    return weak_etag('employer_profile', *row, timezone.now().date(), *extra)
+
+
 class CompanyProfileView(APIView):
     """Get company profile information"""
     permission_classes = [IsAuthenticated]
     
     def get(self, request):
+        etag = employer_profile_etag(request.user)
+        if etag:
+            not_modified = not_modified_response(request, etag, cache_control=private_cache_control())
+            if not_modified is not None:
+                return not_modified
+        
         try:
             employer_profile = get_object_or_404(EmployerProfile, user=request.user)
             serializer = EmployerProfileSerializer(employer_profile)
-            return Response({
+            response = Response({
                 'success': True,
                 'data': serializer.data
             })
+            return set_conditional_headers(response, etag, cache_control=private_cache_control()) if etag else response
         except EmployerProfile.DoesNotExist:
             return Response({
                 'success': False,
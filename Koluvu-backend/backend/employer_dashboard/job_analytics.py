@@ -0,0 +1,227 @@
+# backend/employer_dashboard/job_analytics.py
+
+"""
+Per-job, per-day view analytics.
+
+Each job-day is one ``JobViewDay`` row holding the total views, views per
+referrer bucket and a HyperLogLog sketch of the distinct viewers, so the
+storage per job-day is fixed however many views it gets. Viewers are
+identified by user id, or by IP address and user agent when anonymous;
+only their hashes reach the sketch registers, never the identifiers.
+
+Views are aggregated in memory by each process and merged into the rows
+by a timer ``COUNTER_FLUSH_INTERVAL`` seconds after the first buffered
+view, with one locked read-merge-write per job-day. Sketches merge by
+register-wise maximum, so the buffers of different processes combine into
+the same counts as unbuffered writes. Weekly and monthly figures merge the
+daily sketches.
+
+Anonymous viewers are identified by ``REMOTE_ADDR``. Behind reverse
+proxies, set ``TRUSTED_PROXY_COUNT`` to the number of proxies appending to
+X-Forwarded-For; the client address is read that many entries from the
+right, so addresses a client puts in the header itself are never trusted.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from urllib.parse import urlparse
+
+from django.apps import apps
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.utils import timezone
+
+from shared_services.hyperloglog import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+MAX_RANGE_DAYS = 90
+
+# Referrer host fragments -> bucket
+REFERRER_BUCKETS = {
+    'search': ('google.', 'bing.', 'duckduckgo.', 'yahoo.', 'baidu.', 'yandex.'),
+    'social': ('linkedin.', 'facebook.', 'fb.', 'twitter.', 'x.com', 't.co', 'instagram.', 'whatsapp.', 'reddit.'),
+    'jobs': ('indeed.', 'naukri.', 'glassdoor.', 'monster.', 'foundit.', 'shine.'),
+}
+
+_buffer_lock = threading.Lock()
+_buffer = {'started': None, 'days': {}}
+
+
+def viewer_key(request) -> str:
+    """Stable identifier of the viewer of a request"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    return f"anon:{client_ip(request)}|{request.META.get('HTTP_USER_AGENT', '')}"
+
+
+def client_ip(request) -> str:
+    """
+    Address of the client: ``REMOTE_ADDR``, or the X-Forwarded-For entry
+    added by the outermost of ``TRUSTED_PROXY_COUNT`` trusted proxies
+    """
+    proxies = getattr(settings, 'TRUSTED_PROXY_COUNT', 0)
+    forwarded = [ip.strip() for ip in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if ip.strip()]
+    if proxies > 0 and forwarded:
+        return forwarded[-min(proxies, len(forwarded))]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def referrer_bucket(request) -> str:
+    """
+    Traffic source of a request: an explicit ``utm_source``/``ref`` query
+    parameter, else the Referer host classified as internal, search,
+    social, jobs or other; ``direct`` without either
+    """
+    source = (request.GET.get('utm_source') or request.GET.get('ref') or '').strip().lower()
+    if source:
+        # Sources are bare site names ("linkedin"); match them like hosts
+        host = f'{source}.'
+    else:
+        referer = request.META.get('HTTP_REFERER', '')
+        if not referer:
+            return 'direct'
+        host = (urlparse(referer).hostname or '').lower()
+        if not host:
+            return 'direct'
+        internal_hosts = {request.get_host().split(':')[0].lower()}
+        frontend_url = getattr(settings, 'FRONTEND_URL', '')
+        if frontend_url:
+            internal_hosts.add((urlparse(frontend_url).hostname or '').lower())
+        if host in internal_hosts:
+            return 'internal'
+
+    for bucket, fragments in REFERRER_BUCKETS.items():
+        if any(fragment in host for fragment in fragments):
+            return bucket
+    return 'other'
+
+
+def record_job_view(request, job_id):
+    """Buffer one view of a job; the first view of a buffer schedules its flush"""
+    key = (job_id, timezone.localdate())
+    viewer = viewer_key(request)
+    bucket = referrer_bucket(request)
+
+    with _buffer_lock:
+        day = _buffer['days'].get(key)
+        if day is None:
+            day = _buffer['days'][key] = {'views': 0, 'sketch': HyperLogLog(), 'referrers': Counter()}
+        day['views'] += 1
+        day['sketch'].add(viewer)
+        day['referrers'][bucket] += 1
+        if _buffer['started'] is None:
+            _buffer['started'] = time.monotonic()
+            _schedule_flush()
+
+
+def _schedule_flush():
+    timer = threading.Timer(max(getattr(settings, 'COUNTER_FLUSH_INTERVAL', 5), 1), _flush_in_background)
+    timer.daemon = True
+    timer.start()
+
+
+def _flush_in_background():
+    try:
+        flush_job_views()
+    except Exception:
+        logger.exception('Failed to flush buffered job views')
+    finally:
+        connections.close_all()
+
+
+def _merge_day(JobViewDay, job_id, date, day):
+    """Add one buffered job-day to its row under a row lock"""
+    with transaction.atomic():
+        # Create the row if missing without failing on a concurrent insert,
+        # then lock whichever row won
+        JobViewDay.objects.bulk_create([JobViewDay(job_id=job_id, date=date)], ignore_conflicts=True)
+        row = JobViewDay.objects.select_for_update().get(job_id=job_id, date=date)
+        row.views += day['views']
+        row.viewers_sketch = HyperLogLog.from_bytes(row.viewers_sketch).merge(day['sketch']).to_bytes()
+        referrers = Counter(row.referrers or {})
+        referrers.update(day['referrers'])
+        row.referrers = dict(referrers)
+        row.save()
+
+
+def flush_job_views() -> int:
+    """Merge this process's buffered views into the database; returns job-days written"""
+    with _buffer_lock:
+        days = _buffer['days']
+        _buffer['days'] = {}
+        _buffer['started'] = None
+    if not days:
+        return 0
+
+    JobViewDay = apps.get_model('employer_dashboard', 'JobViewDay')
+    Job = apps.get_model('employer_dashboard', 'Job')
+    existing_jobs = set(Job.objects.filter(id__in={job_id for job_id, _ in days}).values_list('id', flat=True))
+
+    written = 0
+    for (job_id, date), day in days.items():
+        if job_id not in existing_jobs:
+            continue
+        try:
+            _merge_day(JobViewDay, job_id, date, day)
+            written += 1
+        except (IntegrityError, JobViewDay.DoesNotExist):
+            # The job was deleted since the buffer was checked
+            logger.warning(f'Dropped buffered views of deleted job {job_id} on {date}')
+    return written
+
+
+atexit.register(flush_job_views)
+
+
+def _summarize(rows):
+    sketch = HyperLogLog()
+    referrers = Counter()
+    views = 0
+    for row in rows:
+        views += row.views
+        sketch.merge(HyperLogLog.from_bytes(row.viewers_sketch))
+        referrers.update(row.referrers or {})
+    return {
+        'views': views,
+        'unique_viewers': sketch.count(),
+        'referrers': dict(referrers.most_common()),
+    }
+
+
+def job_view_analytics(job, days=7):
+    """Daily and total views, unique viewers and referrers of a job over the last ``days`` days"""
+    JobViewDay = apps.get_model('employer_dashboard', 'JobViewDay')
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    rows = list(JobViewDay.objects.filter(job=job, date__gte=start).order_by('date'))
+
+    by_date = {row.date: row for row in rows}
+    daily = []
+    for offset in range(days):
+        date = start + timedelta(days=offset)
+        row = by_date.get(date)
+        daily.append({
+            'date': date.isoformat(),
+            'views': row.views if row else 0,
+            'unique_viewers': HyperLogLog.from_bytes(row.viewers_sketch).count() if row else 0,
+        })
+
+    return {
+        'job_id': job.id,
+        'from': start.isoformat(),
+        'to': today.isoformat(),
+        'totals': _summarize(rows),
+        'daily': daily,
+    }
+
+
+def employer_view_summary(employer, date=None):
+    """Views and unique viewers across all jobs of an employer on one day (today by default)"""
+    JobViewDay = apps.get_model('employer_dashboard', 'JobViewDay')
+    rows = JobViewDay.objects.filter(job__employer=employer, date=date or timezone.localdate())
+    return _summarize(rows.only('views', 'viewers_sketch', 'referrers'))
@@ -0,0 +1,158 @@
+# backend/employer_dashboard/job_expiry.py
+
+"""
+Expiry of jobs whose application deadline has passed.
+
+``sweep_expired_jobs`` moves active jobs past their deadline out of the
+active status in batches, with one UPDATE per outcome and one bulk insert
+of notifications per batch, following each employer's settings:
+
+- ``auto_repost_expired_jobs``: the job stays active and its deadline moves
+  ``application_deadline_days`` days past today.
+- ``auto_close_expired_jobs`` (the default): the job is closed.
+- neither: the job is marked expired and waits in the employer's expired
+  jobs list to be reactivated or archived.
+
+Run it periodically (``expire_jobs`` command) so that ``status='active'``
+alone means a job is open; the public job board relies on it. The
+``employer_dashboard.W001`` database check (``check --database default``,
+``migrate``) warns when jobs stay active long past their deadline.
+"""
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import transaction
+from django.utils import timezone
+
+from .public_job_cache import invalidate_public_jobs
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+
+# Defaults of EmployerSettings, for employers who never saved settings
+DEFAULT_AUTO_CLOSE = True
+DEFAULT_AUTO_REPOST = False
+DEFAULT_DEADLINE_DAYS = 30
+
+# Days a manually reactivated job stays open when its deadline has passed
+REACTIVATION_DAYS = 30
+
+
+def _notification(Notification, row, outcome, new_deadline=None):
+    job_id, user_id, title = row
+    if outcome == 'reposted':
+        return Notification(
+            recipient_id=user_id,
+            job_id=job_id,
+            type='job_update',
+            title='Job Reposted',
+            message=f'"{title}" reached its application deadline and was reposted until {new_deadline:%B %d, %Y}.',
+            metadata={'action': 'reposted', 'application_deadline': new_deadline.isoformat()},
+        )
+    return Notification(
+        recipient_id=user_id,
+        job_id=job_id,
+        type='job_expired',
+        title='Job Closed' if outcome == 'closed' else 'Job Expired',
+        message=(
+            f'"{title}" reached its application deadline and was closed.' if outcome == 'closed'
+            else f'"{title}" reached its application deadline. Reactivate or archive it from your expired jobs.'
+        ),
+        metadata={'action': outcome},
+    )
+
+
+def sweep_expired_jobs(today=None, batch_size=DEFAULT_BATCH_SIZE, notify=True):
+    """
+    Apply the employer's expiry settings to active jobs whose deadline is
+    before ``today``; returns the number of jobs reposted, closed and expired.
+
+    Each batch locks its jobs, skipping rows another sweep or an employer
+    edit holds, and notifies only the jobs it updated; skipped jobs are
+    left for the next sweep.
+    """
+    Job = apps.get_model('employer_dashboard', 'Job')
+    Notification = apps.get_model('employer_dashboard', 'Notification')
+    today = today or timezone.localdate()
+    summary = {'reposted': 0, 'closed': 0, 'expired': 0}
+
+    due = Job.objects.filter(status='active', application_deadline__lt=today).order_by('id')
+    last_id = 0
+    while True:
+        batch = list(due.filter(id__gt=last_id).values_list(
+            'id', 'employer__user_id', 'title',
+            'employer__settings__auto_repost_expired_jobs',
+            'employer__settings__auto_close_expired_jobs',
+            'employer__settings__application_deadline_days',
+        )[:batch_size])
+        if not batch:
+            break
+        last_id = batch[-1][0]
+
+        reposts = defaultdict(list)
+        outcomes = {'closed': [], 'expired': []}
+        for job_id, user_id, title, auto_repost, auto_close, deadline_days in batch:
+            row = (job_id, user_id, title)
+            if DEFAULT_AUTO_REPOST if auto_repost is None else auto_repost:
+                days = max(deadline_days or DEFAULT_DEADLINE_DAYS, 1)
+                reposts[today + timedelta(days=days)].append(row)
+            elif DEFAULT_AUTO_CLOSE if auto_close is None else auto_close:
+                outcomes['closed'].append(row)
+            else:
+                outcomes['expired'].append(row)
+
+        now = timezone.now()
+        notifications = []
+        with transaction.atomic():
+            # Jobs still due once locked; others changed since the batch was read
+            locked = set(due.filter(id__in=[row[0] for row in batch]).select_for_update(
+                skip_locked=True
+            ).values_list('id', flat=True))
+
+            for new_deadline, rows in reposts.items():
+                rows = [row for row in rows if row[0] in locked]
+                if not rows:
+                    continue
+                summary['reposted'] += Job.objects.filter(
+                    id__in=[row[0] for row in rows]
+                ).update(application_deadline=new_deadline, updated_at=now)
+                notifications.extend(_notification(Notification, row, 'reposted', new_deadline) for row in rows)
+
+            for outcome, rows in outcomes.items():
+                rows = [row for row in rows if row[0] in locked]
+                if not rows:
+                    continue
+                summary[outcome] += Job.objects.filter(
+                    id__in=[row[0] for row in rows]
+                ).update(status=outcome, updated_at=now)
+                notifications.extend(_notification(Notification, row, outcome) for row in rows)
+
+            if notify:
+                Notification.objects.bulk_create(notifications, batch_size=batch_size)
+
+    if any(summary.values()):
+        invalidate_public_jobs()
+        logger.info(
+            f"Expired jobs swept: {summary['reposted']} reposted, "
+            f"{summary['closed']} closed, {summary['expired']} expired"
+        )
+    return summary
+
+
+def reactivate_jobs(jobs, today=None) -> int:
+    """
+    Make ``jobs`` active again, moving deadlines that have passed
+    ``REACTIVATION_DAYS`` days past today; returns the number of jobs
+    """
+    today = today or timezone.localdate()
+    now = timezone.now()
+    with transaction.atomic():
+        count = jobs.exclude(application_deadline__lt=today).update(status='active', updated_at=now)
+        count += jobs.filter(application_deadline__lt=today).update(
+            status='active', application_deadline=today + timedelta(days=REACTIVATION_DAYS), updated_at=now
+        )
+    invalidate_public_jobs()
+    return count
@@ -0,0 +1,308 @@
+# backend/employer_dashboard/job_search_service.py
+
+"""
+Ranked full-text search over jobs.
+
+Each job stores a weighted ``search_vector`` (title > skills > description
+> company name) that ``Job.save`` refreshes whenever one of those fields is
+written. Searches are compiled into a prefix ``tsquery`` so partially typed
+words match while the user is still typing, filtered through the GIN index
+and ordered by ``search_rank``.
+
+The public job board filters are applied by ``apply_public_job_filters``
+for both the job list and the facet counts. Each facet value is counted
+with the same filter that selecting it applies to the list, and the counts
+are cached briefly per normalized filter set. Job lists load
+only the columns of a job card through ``public_job_list_projection``.
+Radius searches over geocoded jobs go through ``jobs_near``.
+"""
+import hashlib
+import json
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import Count, F, FloatField, Q, Value
+from django.db.models.functions import Floor, Lower, Trim
+
+from employee_dashboard.search_documents import supports_search_vector
+from shared_services.geo import within_radius
+
+# No stemming or stop words: prefixes of any word, skill names included, match
+JOB_SEARCH_CONFIG = 'simple'
+
+# Fields the search vector is built from
+JOB_SEARCH_SOURCE_FIELDS = ('title', 'skills', 'description', 'company_name')
+
+MAX_SEARCH_TERMS = 10
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def job_search_vector():
+    return (
+        SearchVector('title', weight='A', config=JOB_SEARCH_CONFIG)
+        + SearchVector('skills', weight='B', config=JOB_SEARCH_CONFIG)
+        + SearchVector('description', weight='C', config=JOB_SEARCH_CONFIG)
+        + SearchVector('company_name', weight='D', config=JOB_SEARCH_CONFIG)
+    )
+
+
+def refresh_job_search_vectors(queryset):
+    """Recompute the search vector of every job in the queryset in one UPDATE"""
+    if supports_search_vector():
+        queryset.update(search_vector=job_search_vector())
+
+
+def build_job_search_query(text):
+    """
+    Prefix query matching jobs that contain every word of ``text``, or None
+    when it has no searchable words
+    """
+    words = _WORD_RE.findall((text or '').lower())[:MAX_SEARCH_TERMS]
+    if not words:
+        return None
+    # Words are [a-z0-9]+, so they are safe in a raw tsquery
+    return SearchQuery(' & '.join(f'{word}:*' for word in words), search_type='raw', config=JOB_SEARCH_CONFIG)
+
+
+def search_jobs(queryset, text, rank=True):
+    """
+    Filter jobs by a search box value and, with ``rank``, annotate
+    ``search_rank``. Without PostgreSQL full-text search this falls back to
+    substring matching with a constant rank.
+    """
+    if not supports_search_vector():
+        queryset = queryset.filter(
+            Q(title__icontains=text) |
+            Q(description__icontains=text) |
+            Q(skills__icontains=text) |
+            Q(employer__company_name__icontains=text)
+        )
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField())) if rank else queryset
+
+    query = build_job_search_query(text)
+    if query is None:
+        return queryset.none()
+    queryset = queryset.filter(search_vector=query)
+    return queryset.annotate(search_rank=SearchRank(F('search_vector'), query)) if rank else queryset
+
+
+# Query parameters of the public job board filters
+PUBLIC_JOB_FILTER_PARAMS = (
+    'search', 'location', 'job_type', 'employment_type', 'industry', 'exp_min', 'exp_max', 'salary_min',
+)
+
+# Facet name -> the filter parameters it is counted without, so every
+# value shows how many jobs selecting it instead would return
+PUBLIC_JOB_FACET_PARAMS = {
+    'location': ('location',),
+    'job_type': ('job_type',),
+    'employment_type': ('employment_type',),
+    'industry': ('industry',),
+    'experience': ('exp_min', 'exp_max'),
+    'salary': ('salary_min',),
+}
+
+# Most frequent values returned for free-text facets
+MAX_FACET_VALUES = 20
+
+
+def public_jobs():
+    """
+    Open jobs. Jobs past their application deadline are taken out of the
+    active status by ``job_expiry.sweep_expired_jobs``.
+    """
+    Job = apps.get_model('employer_dashboard', 'Job')
+    return Job.objects.filter(status='active')
+
+
+# Jobs whose distances fall in the same band are ranked newest first
+DISTANCE_BAND_KM = 5
+
+
+def jobs_near(latitude, longitude, radius_km, queryset=None):
+    """
+    Open jobs within ``radius_km`` of a point, annotated with
+    ``distance_km``; nearest band of ``DISTANCE_BAND_KM`` first, newest
+    first within a band
+    """
+    queryset = public_jobs() if queryset is None else queryset
+    return within_radius(
+        queryset.filter(latitude__isnull=False), latitude, longitude, radius_km
+    ).annotate(
+        distance_band=Floor(F('distance_km') / DISTANCE_BAND_KM)
+    ).order_by('distance_band', '-created_at', '-id')
+
+
+# Job and employer columns rendered by PublicJobListSerializer
+PUBLIC_JOB_LIST_COLUMNS = (
+    'id', 'title', 'company_name', 'job_type', 'location', 'industry',
+    'employment_type', 'salary_min', 'salary_max', 'salary_currency',
+    'experience_min', 'experience_max', 'experience_level',
+    'education_level', 'status', 'application_deadline',
+    'created_at', 'views_count', 'applications_count', 'urgency',
+    'job_brief', 'skills', 'company_size', 'interview_method', 'gender_preference',
+    'employer_logo', 'employer_logo_url',
+    'employer', 'employer__company_name', 'employer__company_logo', 'employer__company_logo_url',
+)
+
+
+def public_job_list_projection(queryset):
+    """
+    Load only the columns of a job card, leaving descriptions, FAQs,
+    screening questions and other large fields out of list queries
+    """
+    return queryset.select_related('employer').only(*PUBLIC_JOB_LIST_COLUMNS)
+
+
+def normalize_public_job_filters(params):
+    """
+    The public job filters present in ``params``, stripped and lowercased
+    (all text filters are case-insensitive), in a stable order
+    """
+    filters = {}
+    for name in PUBLIC_JOB_FILTER_PARAMS:
+        value = (params.get(name) or '').strip()
+        if value:
+            filters[name] = value if name == 'search' else value.lower()
+    return filters
+
+
+def public_job_filter_q(params):
+    """``Q`` of the public job board filters in ``params`` other than the search"""
+    q = Q()
+
+    # Filter by location
+    location = params.get('location')
+    if location:
+        q &= Q(location__icontains=location)
+
+    # Filter by job type
+    job_type = params.get('job_type')
+    if job_type:
+        q &= Q(job_type__icontains=job_type)
+
+    # Filter by employment type
+    employment_type = params.get('employment_type')
+    if employment_type:
+        q &= Q(employment_type__icontains=employment_type)
+
+    # Filter by industry
+    industry = params.get('industry')
+    if industry:
+        q &= Q(industry__icontains=industry)
+
+    # Filter by experience
+    exp_min = params.get('exp_min')
+    exp_max = params.get('exp_max')
+    if exp_min:
+        q &= Q(experience_min__gte=int(exp_min))
+    if exp_max:
+        q &= Q(experience_max__lte=int(exp_max))
+
+    # Filter by salary
+    salary_min = params.get('salary_min')
+    if salary_min:
+        q &= Q(salary_min__gte=float(salary_min))
+
+    return q
+
+
+def apply_public_job_filters(queryset, params, skip=(), rank=True):
+    """Apply the public job board filters in ``params`` except those named in ``skip``"""
+    params = {name: value for name, value in params.items() if name not in skip}
+
+    # Full-text search by title, skills, description or company, ranked by relevance
+    search = params.get('search')
+    if search:
+        queryset = search_jobs(queryset, search, rank=rank)
+
+    return queryset.filter(public_job_filter_q(params))
+
+
+# Experience facet buckets: label, exp_min, exp_max
+EXPERIENCE_FACET_BUCKETS = (
+    ('0-1 years', 0, 1),
+    ('1-3 years', 1, 3),
+    ('3-5 years', 3, 5),
+    ('5+ years', 5, None),
+)
+
+# Salary facet buckets: label, salary_min
+SALARY_FACET_BUCKETS = (
+    ('3+ LPA', 300000),
+    ('6+ LPA', 600000),
+    ('10+ LPA', 1000000),
+    ('15+ LPA', 1500000),
+)
+
+TEXT_FACETS = ('location', 'job_type', 'employment_type', 'industry')
+
+
+def _facet_buckets(facet, queryset):
+    """``(value, params)`` of the buckets of a facet; ``params`` select the bucket"""
+    if facet == 'experience':
+        return [
+            (label, {'exp_min': str(exp_min), **({'exp_max': str(exp_max)} if exp_max is not None else {})})
+            for label, exp_min, exp_max in EXPERIENCE_FACET_BUCKETS
+        ]
+    if facet == 'salary':
+        return [(label, {'salary_min': str(salary_min)}) for label, salary_min in SALARY_FACET_BUCKETS]
+
+    # Most frequent values, normalized like the filter values
+    values = queryset.exclude(**{facet: ''}).annotate(
+        value=Lower(Trim(facet))
+    ).values('value').annotate(count=Count('id')).order_by('-count', 'value').values_list('value', flat=True)
+    return [(value, {facet: value}) for value in values[:MAX_FACET_VALUES]]
+
+
+def count_public_job_facets(filters):
+    """
+    Counts per value of every facet under ``filters`` (normalized). Each
+    value comes with the filter ``params`` selecting it and is counted with
+    exactly those filters, so its count is the number of jobs the list
+    returns once it is selected. Two queries per free-text facet (values,
+    then counts) and one per range facet.
+    """
+    facets = {}
+    for facet, skip in PUBLIC_JOB_FACET_PARAMS.items():
+        queryset = apply_public_job_filters(public_jobs(), filters, skip=skip, rank=False).order_by()
+        buckets = _facet_buckets(facet, queryset)
+        counts = queryset.aggregate(**{
+            f'bucket_{index}': Count('id', filter=public_job_filter_q(params))
+            for index, (_, params) in enumerate(buckets)
+        }) if buckets else {}
+        values = [
+            {'value': value, 'count': counts[f'bucket_{index}'], 'params': params}
+            for index, (value, params) in enumerate(buckets)
+        ]
+        if facet in TEXT_FACETS:
+            values.sort(key=lambda bucket: (-bucket['count'], bucket['value']))
+        facets[facet] = values
+    return facets
+
+
+def get_public_job_facets(params):
+    """
+    ``(filters, facets)`` for request query params, cached for
+    ``PUBLIC_JOB_FACETS_CACHE_TTL`` seconds per normalized filter set and
+    public jobs version when response caching is on
+    """
+    from .public_job_cache import get_public_jobs_cache, get_public_jobs_version, response_caching_enabled
+
+    filters = normalize_public_job_filters(params)
+    if not response_caching_enabled():
+        return filters, count_public_job_facets(filters)
+
+    digest = hashlib.sha256(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    cache_key = f'public_job_facets:{get_public_jobs_version()}:{digest}'
+
+    jobs_cache = get_public_jobs_cache()
+    facets = jobs_cache.get(cache_key)
+    if facets is None:
+        facets = count_public_job_facets(filters)
+        jobs_cache.set(cache_key, facets, getattr(settings, 'PUBLIC_JOB_FACETS_CACHE_TTL', 60))
+    return filters, facets
+
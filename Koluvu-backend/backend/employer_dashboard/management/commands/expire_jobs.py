@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+from employer_dashboard.job_expiry import DEFAULT_BATCH_SIZE, sweep_expired_jobs
+
+
+class Command(BaseCommand):
+    help = 'Repost, close or expire active jobs whose application deadline has passed'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help='Jobs updated per batch'
+        )
+        parser.add_argument(
+            '--no-notify', action='store_true',
+            help='Do not notify employers about their swept jobs'
+        )
+        parser.add_argument(
+            '--loop', type=int, metavar='SECONDS',
+            help='Keep sweeping every SECONDS seconds'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            summary = sweep_expired_jobs(batch_size=options['batch_size'], notify=not options['no_notify'])
+            self.stdout.write(', '.join(f'{outcome}: {count}' for outcome, count in summary.items()))
+            if not options['loop']:
+                break
+            time.sleep(options['loop'])
+
+        self.stdout.write(self.style.SUCCESS('Successfully swept expired jobs'))
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+from employer_dashboard.candidate_search_service import PERCOLATE_BATCH_SIZE, percolate_pending_candidates
+
+
+class Command(BaseCommand):
+    help = 'Match candidates with a pending percolation request against saved searches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=PERCOLATE_BATCH_SIZE,
+            help='Candidates percolated per batch'
+        )
+        parser.add_argument(
+            '--loop', type=int, metavar='SECONDS',
+            help='Keep percolating every SECONDS seconds'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            totals = percolate_pending_candidates(batch_size=options['batch_size'])
+            self.stdout.write(f"Percolated {totals['candidates']} candidates into {totals['matches']} matches")
+            if not options['loop']:
+                break
+            time.sleep(options['loop'])
+
+        self.stdout.write(self.style.SUCCESS('Successfully percolated pending candidates'))
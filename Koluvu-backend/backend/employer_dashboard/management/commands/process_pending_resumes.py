@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from employer_dashboard.models import JobApplication
+from employer_dashboard.application_scoring_service import resume_source, complete_application_scoring
+from shared_services.ats import document_cache
+from shared_services.ats.extraction import get_extraction_pool
+
+
+class Command(BaseCommand):
+    help = 'Extract and score applications whose resume is still pending (e.g. after a restart)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than', type=int, default=10,
+            help='Only pick up applications pending for at least this many minutes'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['older_than'])
+        applications = JobApplication.objects.filter(
+            ats_status='pending',
+            applied_at__lte=cutoff
+        ).only('id', 'resume', 'resume_file_name', 'resume_sha256').order_by('id')
+
+        pool = get_extraction_pool()
+        futures = []
+        completed = 0
+        for application in applications.iterator():
+            if not application.resume:
+                JobApplication.objects.filter(id=application.id).update(ats_status='failed')
+                continue
+
+            cached = document_cache.lookup(application.resume_sha256)
+            if cached is not None:
+                complete_application_scoring(application.id, cached)
+                completed += 1
+                continue
+
+            file_type = application.resume_file_name.lower().rsplit('.', 1)[-1]
+            futures.append((application.id, application.resume_sha256, file_type,
+                            pool.submit(resume_source(application), file_type)))
+
+        self.stdout.write(f'Processing {len(futures)} pending resumes...')
+
+        for application_id, digest, file_type, future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker failed, not the document; leave it pending for the next run
+                self.stderr.write(f'Could not extract resume of application {application_id}: {e}')
+                continue
+            document_cache.store(digest, file_type, result)
+            complete_application_scoring(application_id, result)
+            completed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully processed {completed} pending resumes')
+        )
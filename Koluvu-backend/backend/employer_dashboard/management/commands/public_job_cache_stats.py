@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from employer_dashboard.public_job_cache import bump_public_jobs_version, cache_stats, response_caching_enabled
+
+
+class Command(BaseCommand):
+    help = 'Show hit ratios of the public job response cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset', action='store_true',
+            help='Reset the hit and miss counters after showing them'
+        )
+        parser.add_argument(
+            '--invalidate', action='store_true',
+            help='Bump the public jobs version, dropping every cached response'
+        )
+
+    def handle(self, *args, **options):
+        if not response_caching_enabled():
+            self.stdout.write(self.style.WARNING(
+                "Response caching is off: CACHES['public_jobs'] is not shared between processes "
+                "(set PUBLIC_JOBS_CACHE_URL)"
+            ))
+            return
+
+        stats = cache_stats(reset=options['reset'])
+
+        self.stdout.write(f"Version: {stats['version']}")
+        for scope, counters in stats['endpoints'].items():
+            self.stdout.write(
+                f"{scope:<12} hits={counters['hits']:<8} misses={counters['misses']:<8} "
+                f"hit_ratio={counters['hit_ratio']:.2%}"
+            )
+
+        if options['invalidate']:
+            version = bump_public_jobs_version()
+            self.stdout.write(self.style.SUCCESS(f'Invalidated cached responses (version {version})'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Done'))
@@ -0,0 +1,73 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from employer_dashboard.models import Job, JobApplication
+from employer_dashboard.ats_rescoring_service import ATSRescoringService, rescore_requested_jobs
+
+
+class Command(BaseCommand):
+    help = 'Re-compute ATS scores for job applications using a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--job', type=int, action='append', dest='job_ids',
+            help='Only re-score applications for this job id (can be repeated)'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='Number of worker processes (default: CPU count)'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=1000,
+            help='Applications scored and written per batch'
+        )
+        parser.add_argument(
+            '--requested', action='store_true',
+            help='Only re-score jobs whose re-scoring was requested from the dashboard and has not run yet'
+        )
+
+    def handle(self, *args, **options):
+        if options['requested']:
+            totals = rescore_requested_jobs(
+                options['job_ids'], workers=options['workers'], chunk_size=options['chunk_size']
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Successfully re-scored {totals['scored']} applications of {totals['jobs']} requested job(s); "
+                    f"skipped {totals['skipped']} without resume text"
+                )
+            )
+            return
+
+        queryset = JobApplication.objects.all()
+
+        job_ids = options['job_ids']
+        if job_ids:
+            found = set(Job.objects.filter(id__in=job_ids).values_list('id', flat=True))
+            unknown = sorted(set(job_ids) - found)
+            if unknown:
+                raise CommandError(f'Job(s) not found: {", ".join(map(str, unknown))}')
+            queryset = queryset.filter(job_id__in=job_ids)
+
+        def report(stats):
+            self.stdout.write(
+                f"Scored {stats['scored']}/{stats['scorable']} "
+                f"({stats['per_second']} applications/sec, {stats['elapsed_seconds']}s)"
+            )
+
+        self.stdout.write(f"Re-scoring applications with {options['workers']} worker(s)...")
+
+        service = ATSRescoringService(
+            workers=options['workers'],
+            chunk_size=options['chunk_size'],
+            progress=report,
+        )
+        stats = service.rescore(queryset)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully re-scored {stats['scored']} applications in {stats['elapsed_seconds']}s "
+                f"({stats['per_second']} applications/sec); "
+                f"skipped {stats['skipped']} without resume text"
+            )
+        )
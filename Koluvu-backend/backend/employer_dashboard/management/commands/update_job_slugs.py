@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.utils.text import slugify
-from employer_dashboard.models import Job, EmployerProfile
+from employer_dashboard.models import Job, EmployerProfile, JobNumberSequence
 
 
 class Command(BaseCommand):
@@ -15,10 +15,7 @@ class Command(BaseCommand):
         
         for employer in employers:
             jobs = Job.objects.filter(employer=employer).order_by('created_at')
-            job_count = 0
-            
             for job in jobs:
-                job_count += 1
                 updated = False
                 
                 # Update company slug
@@ -33,7 +30,7 @@ class Command(BaseCommand):
                 
                 # Update job number
                 if job.job_number == 0:
-                    job.job_number = job_count
+                    job.job_number = JobNumberSequence.next_number(employer)
                     updated = True
                 
                 if updated:
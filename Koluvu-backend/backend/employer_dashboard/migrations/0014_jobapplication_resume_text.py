@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0013_alter_jobapplication_options_job_company_slug_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_text',
+            field=models.TextField(blank=True, default='', help_text='Text extracted from the resume for ranking'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0014_jobapplication_resume_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='ats_keyword_profile',
+            field=models.JSONField(blank=True, default=dict, help_text='Compiled ATS keywords mapped to their weight'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='ats_keyword_version',
+            field=models.CharField(blank=True, default='', help_text='Hash of the compiled ATS keyword profile', max_length=64),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0015_job_ats_keyword_profile'),
+    ]
+
+    operations = [
+        # Existing applications were scored synchronously when they were submitted
+        migrations.AddField(
+            model_name='jobapplication',
+            name='ats_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed')], default='completed', help_text='Progress of resume extraction and ATS scoring', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='jobapplication',
+            name='ats_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', help_text='Progress of resume extraction and ATS scoring', max_length=20),
+        ),
+    ]
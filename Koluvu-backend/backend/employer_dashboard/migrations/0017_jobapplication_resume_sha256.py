@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0016_jobapplication_ats_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='resume_sha256',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='SHA-256 of the uploaded resume bytes', max_length=64),
+        ),
+    ]
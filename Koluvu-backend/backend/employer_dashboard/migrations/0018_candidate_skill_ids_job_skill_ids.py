@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0017_jobapplication_resume_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list, help_text='Sorted canonical skill ids resolved from skills'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee_dashboard', '0015_candidatesearchdocument'),
+        ('employer_dashboard', '0018_candidate_skill_ids_job_skill_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedCandidateSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('criteria', models.JSONField(default=dict)),
+                ('predicate', models.JSONField(default=dict, editable=False)),
+                ('is_active', models.BooleanField(default=True)),
+                ('last_matched_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('employer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_candidate_searches', to='employer_dashboard.employerprofile')),
+            ],
+            options={
+                'db_table': 'employer_saved_candidate_searches',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedCandidateSearchKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=150)),
+                ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='index_keys', to='employer_dashboard.savedcandidatesearch')),
+            ],
+            options={
+                'db_table': 'employer_saved_candidate_search_keys',
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedCandidateSearchMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_seen', models.BooleanField(default=False)),
+                ('matched_at', models.DateTimeField(auto_now_add=True)),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_search_matches', to='employee_dashboard.candidatesearchprofile')),
+                ('search', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='employer_dashboard.savedcandidatesearch')),
+            ],
+            options={
+                'db_table': 'employer_saved_candidate_search_matches',
+                'ordering': ['-matched_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='savedcandidatesearch',
+            index=models.Index(fields=['employer', 'is_active'], name='employer_sa_employe_ac4e54_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='savedcandidatesearchkey',
+            index=models.Index(fields=['key'], name='employer_sa_key_04b28d_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='savedcandidatesearchkey',
+            unique_together={('search', 'key')},
+        ),
+        migrations.AddIndex(
+            model_name='savedcandidatesearchmatch',
+            index=models.Index(fields=['search', 'is_seen', '-matched_at'], name='employer_sa_search__e658c7_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='savedcandidatesearchmatch',
+            unique_together={('search', 'candidate')},
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:13
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def populate_search_vectors(apps, schema_editor):
+    # Vector as defined when this migration was written (job_search_vector),
+    # frozen here so later changes to the service do not alter history
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Job = apps.get_model('employer_dashboard', 'Job')
+    Job.objects.update(search_vector=(
+        SearchVector('title', weight='A', config='simple')
+        + SearchVector('skills', weight='B', config='simple')
+        + SearchVector('description', weight='C', config='simple')
+        + SearchVector('company_name', weight='D', config='simple')
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0019_saved_candidate_searches'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+        ),
+        migrations.RunPython(populate_search_vectors, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0020_job_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobViewDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('viewers_sketch', models.BinaryField(default=b'')),
+                ('referrers', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_days', to='employer_dashboard.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date', 'job'], name='employer_da_date_378345_idx')],
+                'unique_together': {('job', 'date')},
+            },
+        ),
+    ]
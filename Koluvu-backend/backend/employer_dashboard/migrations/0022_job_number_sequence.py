@@ -0,0 +1,54 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def number_jobs(apps, schema_editor):
+    Job = apps.get_model('employer_dashboard', 'Job')
+    JobNumberSequence = apps.get_model('employer_dashboard', 'JobNumberSequence')
+
+    last_numbers = dict(
+        Job.objects.values('employer_id').annotate(last=Max('job_number')).values_list('employer_id', 'last')
+    )
+
+    # Renumber unnumbered jobs and later jobs sharing a public URL with an earlier one
+    taken = set()
+    jobs = Job.objects.order_by('id').values_list('id', 'employer_id', 'company_slug', 'title_slug', 'job_number')
+    for job_id, employer_id, company_slug, title_slug, job_number in jobs.iterator():
+        url = (company_slug, title_slug, job_number)
+        if job_number == 0 or url in taken:
+            while url in taken or url[2] == 0:
+                last_numbers[employer_id] += 1
+                url = (company_slug, title_slug, last_numbers[employer_id])
+            Job.objects.filter(id=job_id).update(job_number=url[2])
+        taken.add(url)
+
+    JobNumberSequence.objects.bulk_create(
+        JobNumberSequence(employer_id=employer_id, last_number=last_number)
+        for employer_id, last_number in last_numbers.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0021_job_view_days'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobNumberSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_number', models.PositiveIntegerField(default=0)),
+                ('employer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='job_number_sequence', to='employer_dashboard.employerprofile')),
+            ],
+        ),
+        migrations.RunPython(number_jobs, reverse_code=migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='job',
+            constraint=models.UniqueConstraint(fields=('company_slug', 'title_slug', 'job_number'), name='unique_job_public_url'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-18 11:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0022_job_number_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('latitude__isnull', False), ('status', 'active')), fields=['latitude', 'longitude'], name='job_active_geo_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employer_dashboard', '0023_geocoded_locations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='rescore_requested_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='When re-scoring of the applicants was queued', null=True),
+        ),
+    ]
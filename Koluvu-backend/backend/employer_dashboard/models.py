@@ -1,7 +1,12 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db.models import Q
+from django.db.models import F, Max, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from employee_dashboard.search_documents import search_documents_refreshed
 
 
 class EmployerProfile(models.Model):
@@ -296,6 +301,9 @@ class Job(models.Model):
         ('executive', 'Executive'),
     ]
     
+    # Fields the compiled ATS keyword profile is derived from
+    KEYWORD_PROFILE_SOURCE_FIELDS = ('skills', 'requirements', 'ats_keywords')
+    
     employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE, related_name='jobs')
     
     # ===== BASIC JOB INFORMATION =====
@@ -307,6 +315,9 @@ class Job(models.Model):
     
     # 3. Location
     location = models.CharField(max_length=255, help_text="Job Location")
+    # Coordinates geocoded from location (shared_services.geo), null when unknown
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
     
     # 4. Industry Type
     industry = models.CharField(max_length=100, blank=True, help_text="Industry Type")
@@ -357,6 +368,7 @@ class Job(models.Model):
     
     # 16. Skills Required
     skills = models.JSONField(default=list, blank=True, help_text="Required Skills as JSON array")
+    skill_ids = models.JSONField(default=list, blank=True, help_text="Sorted canonical skill ids resolved from skills")
     skills_required = models.JSONField(default=list, blank=True, help_text="Required Skills (deprecated - use skills)")
     
     # 17. Language Proficiency Required
@@ -368,6 +380,12 @@ class Job(models.Model):
     
     # 19. ATS Keywords
     ats_keywords = models.TextField(blank=True, default='', help_text="ATS Keywords for resume matching")
+    ats_keyword_profile = models.JSONField(default=dict, blank=True,
+                                          help_text="Compiled ATS keywords mapped to their weight")
+    ats_keyword_version = models.CharField(max_length=64, blank=True, default='',
+                                          help_text="Hash of the compiled ATS keyword profile")
+    rescore_requested_at = models.DateTimeField(null=True, blank=True, editable=False,
+                                               help_text="When re-scoring of the applicants was queued")
     
     # ===== EMPLOYER DETAILS =====
     # 17. Employer's Name (from employer profile)
@@ -438,6 +456,9 @@ class Job(models.Model):
     company_slug = models.SlugField(max_length=100, blank=True, help_text="Company name slug for URL")
     title_slug = models.SlugField(max_length=150, blank=True, help_text="Job title slug for URL")
     job_number = models.IntegerField(default=0, help_text="Sequential job number for this company")
+    
+    # Weighted full-text vector over title, skills, description and company name (PostgreSQL)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ['-created_at']
@@ -446,8 +467,23 @@ class Job(models.Model):
             models.Index(fields=['employer', 'status']),
             models.Index(fields=['job_type', 'status']),
             models.Index(fields=['industry', 'status']),
+            GinIndex(fields=['search_vector'], name='job_search_vector_gin'),
+            # Bounding-box scans of radius searches over open jobs
+            models.Index(
+                fields=['latitude', 'longitude'], name='job_active_geo_idx',
+                condition=Q(status='active', latitude__isnull=False)
+            ),
+        ]
+        constraints = [
+            # Backs the jobs/<company_slug>/<title_slug>/<job_number>/ lookup
+            models.UniqueConstraint(
+                fields=['company_slug', 'title_slug', 'job_number'], name='unique_job_public_url'
+            ),
         ]
 
+    # Job numbers tried when another employer's job already has the same URL
+    JOB_NUMBER_ATTEMPTS = 5
+
     def __str__(self):
         return f"{self.title} at {self.company_name}"
     
@@ -474,10 +510,9 @@ class Job(models.Model):
             self.title_slug = slugify(self.title)
         
         # Set job number if creating new job
-        if not self.pk:  # New job
-            # Get count of jobs from this employer (including all statuses)
-            job_count = Job.objects.filter(employer=self.employer).count()
-            self.job_number = job_count + 1
+        creating = not self.pk
+        if creating:
+            self.job_number = JobNumberSequence.next_number(self.employer)
         if not self.company_name:
             self.company_name = self.employer.company_name
         if not self.employer_name:
@@ -502,17 +537,80 @@ class Job(models.Model):
             elif self.employer.company_logo_url:
                 self.employer_logo_url = self.employer.company_logo_url
         
-        super().save(*args, **kwargs)
+        # Recompile the ATS keyword profile so the apply path only has to read it
+        update_fields = kwargs.get('update_fields')
+        if self.refresh_keyword_profile(update_fields) and update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'ats_keyword_profile', 'ats_keyword_version'}
+        
+        # Geocode the location from the offline gazetteer
+        if update_fields is None or 'location' in update_fields:
+            from shared_services.geo import geocode
+            self.latitude, self.longitude = geocode(self.location) or (None, None)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(kwargs['update_fields']) | {'latitude', 'longitude'}
+        
+        # Resolve free-text skills to canonical skill ids
+        if update_fields is None or 'skills' in update_fields:
+            from shared_services.ats.skills import resolve_skill_ids
+            self.skill_ids = resolve_skill_ids(self.skills)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(kwargs['update_fields']) | {'skill_ids'}
+        
+        if creating:
+            self._insert_with_free_job_number(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+        
+        # The search vector is computed by the database from the saved row
+        from .job_search_service import JOB_SEARCH_SOURCE_FIELDS, refresh_job_search_vectors
+        if update_fields is None or set(update_fields) & set(JOB_SEARCH_SOURCE_FIELDS):
+            refresh_job_search_vectors(Job.objects.filter(pk=self.pk))
+    
+    def _insert_with_free_job_number(self, *args, **kwargs):
+        """
+        Insert a new job. Numbers are unique per employer, but two employers
+        with the same company slug can post the same title; the job then
+        takes the employer's next number.
+        """
+        for attempt in range(self.JOB_NUMBER_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                url_taken = Job.objects.filter(
+                    company_slug=self.company_slug, title_slug=self.title_slug, job_number=self.job_number
+                ).exists()
+                if not url_taken or attempt == self.JOB_NUMBER_ATTEMPTS - 1:
+                    raise
+                self.job_number = JobNumberSequence.next_number(self.employer)
+    
+    def refresh_keyword_profile(self, update_fields=None):
+        """
+        Recompile the ATS keyword profile when its source fields are being saved.
+        Returns True if the profile changed.
+        """
+        if update_fields is not None and not set(update_fields) & set(self.KEYWORD_PROFILE_SOURCE_FIELDS):
+            return False
+        
+        from shared_services.ats.services import ATSAnalyzerService
+        profile, version = ATSAnalyzerService().build_job_keyword_profile(self)
+        if version == self.ats_keyword_version:
+            return False
+        
+        self.ats_keyword_profile = profile
+        self.ats_keyword_version = version
+        return True
     
     def increment_views(self):
-        """Increment job view count"""
-        self.views_count += 1
-        self.save(update_fields=['views_count'])
+        """Increment job view count (buffered, see shared_services.counters)"""
+        from shared_services.counters import increment
+        increment('job_views', self.pk)
     
     def increment_applications(self):
-        """Increment applications count"""
-        self.applications_count += 1
-        self.save(update_fields=['applications_count'])
+        """Increment applications count (buffered, see shared_services.counters)"""
+        from shared_services.counters import increment
+        increment('job_applications', self.pk)
     
     def get_employer_logo(self):
         """Get employer logo with fallback"""
@@ -544,6 +642,36 @@ class Job(models.Model):
         return list(keywords)
 
 
+class JobNumberSequence(models.Model):
+    """
+    Last job number handed out to an employer. Numbers are taken by
+    incrementing this row, which locks it until the transaction ends, so
+    concurrent posts by one employer get distinct numbers.
+    """
+    employer = models.OneToOneField(EmployerProfile, on_delete=models.CASCADE, related_name='job_number_sequence')
+    last_number = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.employer.company_name}: {self.last_number}"
+
+    @classmethod
+    def next_number(cls, employer):
+        """Reserve and return the employer's next job number"""
+        sequence = cls.objects.filter(employer=employer)
+        with transaction.atomic():
+            if not sequence.update(last_number=F('last_number') + 1):
+                # First number from this row; continue after existing jobs
+                last_number = Job.objects.filter(employer=employer).aggregate(last=Max('job_number'))['last'] or 0
+                try:
+                    with transaction.atomic():
+                        cls.objects.create(employer=employer, last_number=last_number + 1)
+                    return last_number + 1
+                except IntegrityError:
+                    # Created by a concurrent post
+                    sequence.update(last_number=F('last_number') + 1)
+            return sequence.values_list('last_number', flat=True).get()
+
+
 class JobApplication(models.Model):
     """Job application model - Enhanced with employee link and ATS scoring"""
     STATUS_CHOICES = [
@@ -554,6 +682,12 @@ class JobApplication(models.Model):
         ('hired', 'Hired'),
     ]
     
+    ATS_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
     # Foreign Keys
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications')
     employee = models.ForeignKey('employee_dashboard.EmployeeProfile', on_delete=models.CASCADE, 
@@ -568,6 +702,9 @@ class JobApplication(models.Model):
     resume = models.FileField(upload_to='application_resumes/', null=True, blank=True)
     resume_file_name = models.CharField(max_length=255, blank=True, default='')
     resume_file_size = models.IntegerField(default=0, help_text='File size in bytes')
+    resume_text = models.TextField(blank=True, default='', help_text='Text extracted from the resume for ranking')
+    resume_sha256 = models.CharField(max_length=64, blank=True, default='', db_index=True,
+                                     help_text='SHA-256 of the uploaded resume bytes')
     cover_letter = models.TextField(blank=True, default='')
     
     # Screening Questions
@@ -576,6 +713,8 @@ class JobApplication(models.Model):
     
     # ATS Scoring
     ats_score = models.FloatField(default=0.0, help_text='ATS match score 0-100')
+    ats_status = models.CharField(max_length=20, choices=ATS_STATUS_CHOICES, default='pending',
+                                  help_text='Progress of resume extraction and ATS scoring')
     matching_keywords = models.JSONField(default=list, blank=True, 
                                         help_text='Keywords matched from job requirements')
     missing_keywords = models.JSONField(default=list, blank=True,
@@ -610,6 +749,29 @@ class JobApplication(models.Model):
             self.save(update_fields=['viewed_by_employer', 'viewed_at'])
 
 
+class JobViewDay(models.Model):
+    """
+    View analytics of one job on one day: total views, a HyperLogLog sketch
+    of the distinct viewers (fixed size, see shared_services.hyperloglog)
+    and views per referrer bucket. Written in batches by job_analytics.
+    """
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='view_days')
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    viewers_sketch = models.BinaryField(default=b'')
+    referrers = models.JSONField(default=dict, blank=True)  # Bucket -> views
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['job', 'date']
+        indexes = [
+            models.Index(fields=['date', 'job']),
+        ]
+
+    def __str__(self):
+        return f"{self.job.title} - {self.date}: {self.views} views"
+
+
 class Candidate(models.Model):
     """Candidate model for interview scheduling"""
     name = models.CharField(max_length=255)
@@ -618,6 +780,7 @@ class Candidate(models.Model):
     current_position = models.CharField(max_length=255, blank=True)
     experience_years = models.IntegerField(default=0)
     skills = models.TextField(blank=True)  # Comma separated
+    skill_ids = models.JSONField(default=list, blank=True)  # Sorted canonical skill ids
     resume = models.FileField(upload_to='candidate_resumes/', null=True, blank=True)
     application = models.ForeignKey(JobApplication, on_delete=models.CASCADE, null=True, blank=True, related_name='candidate_profile')
     employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE, related_name='candidates')
@@ -627,6 +790,93 @@ class Candidate(models.Model):
     def __str__(self):
         return f"{self.name} - {self.current_position}"
 
+    def save(self, *args, **kwargs):
+        """Resolve free-text skills to canonical skill ids"""
+        from shared_services.ats.skills import resolve_skill_ids
+        self.skill_ids = resolve_skill_ids(self.skills)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'skill_ids'}
+        super().save(*args, **kwargs)
+
+
+class SavedCandidateSearch(models.Model):
+    """Boolean candidate search saved by a recruiter, matched incrementally as candidates change"""
+    employer = models.ForeignKey(EmployerProfile, on_delete=models.CASCADE, related_name='saved_candidate_searches')
+    name = models.CharField(max_length=255)
+    criteria = models.JSONField(default=dict)  # Boolean search request body
+    predicate = models.JSONField(default=dict, editable=False)  # Compiled from criteria, see candidate_search_service
+    is_active = models.BooleanField(default=True)
+    last_matched_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'employer_saved_candidate_searches'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['employer', 'is_active']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} - {self.employer.company_name}"
+
+    def save(self, *args, **kwargs):
+        """
+        Compile the criteria into the stored predicate and refresh the
+        percolation index. Raises BooleanQueryError for an invalid query.
+        """
+        from .candidate_search_service import CandidateSearch, serialize_predicate
+        search = CandidateSearch(self.criteria)
+        self.predicate = serialize_predicate(search.predicate())
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'predicate'}
+        super().save(*args, **kwargs)
+
+        keys = search.index_keys()
+        self.index_keys.exclude(key__in=keys).delete()
+        SavedCandidateSearchKey.objects.bulk_create(
+            [SavedCandidateSearchKey(search=self, key=key) for key in keys], ignore_conflicts=True
+        )
+
+
+class SavedCandidateSearchKey(models.Model):
+    """Inverted index entry: candidates whose search document has this key may match the search"""
+    search = models.ForeignKey(SavedCandidateSearch, on_delete=models.CASCADE, related_name='index_keys')
+    key = models.CharField(max_length=150)  # e.g. "t:python", "loc:hyderabad", "dept:it" or "*"
+
+    class Meta:
+        db_table = 'employer_saved_candidate_search_keys'
+        unique_together = ['search', 'key']
+        indexes = [
+            models.Index(fields=['key']),
+        ]
+
+    def __str__(self):
+        return f"{self.key} -> {self.search_id}"
+
+
+class SavedCandidateSearchMatch(models.Model):
+    """Inbox entry for a candidate that started matching a saved search"""
+    search = models.ForeignKey(SavedCandidateSearch, on_delete=models.CASCADE, related_name='matches')
+    candidate = models.ForeignKey(
+        'employee_dashboard.CandidateSearchProfile', on_delete=models.CASCADE, related_name='saved_search_matches'
+    )
+    is_seen = models.BooleanField(default=False)
+    matched_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'employer_saved_candidate_search_matches'
+        ordering = ['-matched_at']
+        unique_together = ['search', 'candidate']
+        indexes = [
+            models.Index(fields=['search', 'is_seen', '-matched_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate_id} matched {self.search_id}"
+
 
 class Interviewer(models.Model):
     """Interviewer model"""
@@ -1074,6 +1324,11 @@ class FeedbackTemplate(models.Model):
 
     def __str__(self):
         return f"{self.name} - {self.employer.company_name}"
+    
+    def increment_usage(self):
+        """Count a feedback form created from this template (buffered)"""
+        from shared_services.counters import increment
+        increment('feedback_template_usage', self.pk)
 
 
 class FeedbackReminder(models.Model):
@@ -1783,4 +2038,29 @@ class EmployerSettings(models.Model):
             settings.set_default_notification_preferences()
             settings.save()
         
-        return settings
\ No newline at end of file
+        return settings
+
+
+@receiver(search_documents_refreshed)
+def percolate_saved_searches(sender, profile_ids, **kwargs):
+    """Queue matching changed candidates against saved searches once the change commits"""
+    from .candidate_search_service import request_percolation
+    request_percolation(profile_ids)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_public_job_cache(sender, instance, update_fields=None, **kwargs):
+    """Drop cached public job pages unless only a counter was saved"""
+    from .public_job_cache import COUNTER_FIELDS, invalidate_public_jobs
+    if update_fields is None or not set(update_fields) <= COUNTER_FIELDS:
+        invalidate_public_jobs()
+
+
+@receiver(post_save, sender=EmployerProfile)
+@receiver(post_delete, sender=EmployerProfile)
+def invalidate_public_company_cache(sender, instance, update_fields=None, **kwargs):
+    """Company names and logos appear on every public job page"""
+    from .public_job_cache import PRIVATE_EMPLOYER_FIELDS, invalidate_public_jobs
+    if update_fields is None or not set(update_fields) <= PRIVATE_EMPLOYER_FIELDS:
+        invalidate_public_jobs()
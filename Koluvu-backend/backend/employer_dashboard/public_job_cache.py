@@ -0,0 +1,163 @@
+# backend/employer_dashboard/public_job_cache.py
+
+"""
+Shared response cache for the anonymous job board endpoints.
+
+Responses are cached per endpoint under the normalized host, path and query
+parameters, prefixed with a public jobs version. Every write that can change
+what those endpoints show (saving or deleting a job or an employer profile,
+bulk job actions) bumps the version once its transaction commits, so all
+cached pages become unreachable at once and expire from the cache on their
+own. View counter updates do not bump the version; the counts shown are at
+most ``PUBLIC_JOBS_CACHE_TTL`` seconds old.
+
+The version only invalidates every process when they all share the
+cache, so responses are cached only when ``CACHES['public_jobs']`` is a
+shared backend (``PUBLIC_JOBS_CACHE_URL``); otherwise every request is
+served from the database.
+
+Hits and misses are counted per endpoint; ``cache_stats`` reports the hit
+ratios (see the ``public_job_cache_stats`` command).
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+from rest_framework.response import Response
+
+from shared_services.shared_cache import is_shared_cache
+
+PUBLIC_JOBS_VERSION_KEY = 'public_jobs_version'
+HITS_KEY = 'public_jobs_cache_hits'
+MISSES_KEY = 'public_jobs_cache_misses'
+
+# Endpoints whose responses are cached
+CACHE_SCOPES = ('job_list', 'recent_jobs', 'job_detail', 'companies')
+
+# Job fields written by counters only; saving just these keeps cached pages
+COUNTER_FIELDS = {'views_count', 'applications_count'}
+
+# Employer profile fields never shown on public pages
+PRIVATE_EMPLOYER_FIELDS = {'last_login_ip', 'last_login_location'}
+
+
+def get_public_jobs_cache():
+    return caches['public_jobs'] if 'public_jobs' in settings.CACHES else cache
+
+
+def response_caching_enabled() -> bool:
+    """Responses are cached only in a cache shared by every server process"""
+    return is_shared_cache('public_jobs')
+
+
+def _seed_version() -> int:
+    # A fresh, time-based version never collides with pages cached under a
+    # version whose key has since been evicted
+    jobs_cache = get_public_jobs_cache()
+    jobs_cache.add(PUBLIC_JOBS_VERSION_KEY, int(time.time() * 1000), None)
+    return jobs_cache.get(PUBLIC_JOBS_VERSION_KEY)
+
+
+def get_public_jobs_version() -> int:
+    version = get_public_jobs_cache().get(PUBLIC_JOBS_VERSION_KEY)
+    if version is None:
+        version = _seed_version()
+    return version
+
+
+def bump_public_jobs_version() -> int:
+    """Invalidate every cached public job response"""
+    if not response_caching_enabled():
+        return None
+    try:
+        return get_public_jobs_cache().incr(PUBLIC_JOBS_VERSION_KEY)
+    except ValueError:
+        _seed_version()
+        return get_public_jobs_cache().incr(PUBLIC_JOBS_VERSION_KEY)
+
+
+def invalidate_public_jobs():
+    """Bump the version after the current transaction commits"""
+    transaction.on_commit(bump_public_jobs_version)
+
+
+def response_cache_key(request, scope: str) -> str:
+    """
+    Cache key of a request: the version, the endpoint scope and a digest of
+    the host, path and sorted query parameters
+    """
+    params = sorted(
+        (name, sorted(value for value in values if value))
+        for name, values in request.query_params.lists()
+        if any(values)
+    )
+    digest = hashlib.sha256(json.dumps([request.get_host(), request.path, params]).encode()).hexdigest()
+    return f'public_jobs:{get_public_jobs_version()}:{scope}:{digest}'
+
+
+def _incr(key: str):
+    jobs_cache = get_public_jobs_cache()
+    try:
+        jobs_cache.incr(key)
+    except ValueError:
+        jobs_cache.set(key, 1, None)
+
+
+def get_cached_response(request, scope: str):
+    """Cached payload of a request, or None on a miss or when response caching is off"""
+    if not response_caching_enabled():
+        return None
+    payload = get_public_jobs_cache().get(response_cache_key(request, scope))
+    _incr(f'{HITS_KEY}:{scope}' if payload is not None else f'{MISSES_KEY}:{scope}')
+    return payload
+
+
+def cache_response(request, scope: str, payload):
+    if not response_caching_enabled():
+        return
+    get_public_jobs_cache().set(
+        response_cache_key(request, scope), payload, getattr(settings, 'PUBLIC_JOBS_CACHE_TTL', 300)
+    )
+
+
+def cache_stats(reset: bool = False):
+    """Hits, misses and hit ratio per endpoint, and the current version"""
+    jobs_cache = get_public_jobs_cache()
+    keys = [f'{prefix}:{scope}' for scope in CACHE_SCOPES for prefix in (HITS_KEY, MISSES_KEY)]
+    counters = jobs_cache.get_many(keys)
+    if reset:
+        jobs_cache.delete_many(keys)
+
+    endpoints = {}
+    for scope in CACHE_SCOPES:
+        hits = counters.get(f'{HITS_KEY}:{scope}', 0)
+        misses = counters.get(f'{MISSES_KEY}:{scope}', 0)
+        lookups = hits + misses
+        endpoints[scope] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / lookups, 4) if lookups else 0.0,
+        }
+    return {
+        'version': get_public_jobs_version(),
+        'endpoints': endpoints,
+    }
+
+
+class CachedPublicListMixin:
+    """Serve a public list view from the response cache; set ``cache_scope``"""
+    cache_scope = None
+
+    def list(self, request, *args, **kwargs):
+        payload = get_cached_response(request, self.cache_scope)
+        if payload is not None:
+            return Response(payload, headers={'X-Cache': 'HIT'})
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache_response(request, self.cache_scope, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
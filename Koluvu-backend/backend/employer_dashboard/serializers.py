@@ -5,8 +5,12 @@ from .models import (
     Interviewer, Interview, InterviewNote, InterviewTimeSlot,
     ProxyScanSession, ProxyDetectionRule, ProxyAlert,
     InterviewFeedback, FeedbackTemplate, FeedbackReminder,
-    EmployerSettings
+    EmployerSettings, SavedCandidateSearch, SavedCandidateSearchMatch
 )
+from employee_dashboard.serializers import BooleanSearchRequestSerializer, CandidateSearchProfileSerializer
+from shared_services.boolean_query import BooleanQueryError
+from shared_services.counters import PendingCountersListSerializer, PendingCountersMixin
+from .candidate_search_service import CandidateSearch
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -82,11 +86,12 @@ class EmployerProfileSerializer(serializers.ModelSerializer):
         ]
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(PendingCountersMixin, serializers.ModelSerializer):
     employer_name = serializers.CharField(source='employer.company_name', read_only=True)
     employer_profile_picture = serializers.SerializerMethodField()
     employer_logo_display = serializers.SerializerMethodField()
     public_url = serializers.SerializerMethodField()
+    pending_counters = {'views_count': 'job_views', 'applications_count': 'job_applications'}
     
     def get_employer_profile_picture(self, obj):
         return obj.employer.get_profile_picture()
@@ -100,6 +105,7 @@ class JobSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Job
+        list_serializer_class = PendingCountersListSerializer
         fields = '__all__'
         read_only_fields = [
             'id', 'created_at', 'updated_at', 'views_count', 
@@ -261,16 +267,18 @@ class JobSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class JobListSerializer(serializers.ModelSerializer):
+class JobListSerializer(PendingCountersMixin, serializers.ModelSerializer):
     """Simplified serializer for job listings"""
     employer_name = serializers.CharField(source='employer.company_name', read_only=True)
     employer_logo_display = serializers.SerializerMethodField()
+    pending_counters = {'views_count': 'job_views', 'applications_count': 'job_applications'}
     
     def get_employer_logo_display(self, obj):
         return obj.get_employer_logo()
     
     class Meta:
         model = Job
+        list_serializer_class = PendingCountersListSerializer
         fields = [
             'id', 'title', 'company_name', 'job_type', 'location', 'industry',
             'employment_type', 'salary_min', 'salary_max', 'salary_currency',
@@ -289,6 +297,32 @@ class JobListSerializer(serializers.ModelSerializer):
         ]
 
 
+class PublicJobListSerializer(PendingCountersMixin, serializers.ModelSerializer):
+    """
+    Job card for the public job lists: only the columns selected by
+    ``public_job_list_projection``, none of the large text and JSON fields
+    """
+    employer_name = serializers.CharField(source='employer.company_name', read_only=True)
+    employer_logo_display = serializers.SerializerMethodField()
+    pending_counters = {'views_count': 'job_views', 'applications_count': 'job_applications'}
+    
+    def get_employer_logo_display(self, obj):
+        return obj.get_employer_logo()
+    
+    class Meta:
+        model = Job
+        list_serializer_class = PendingCountersListSerializer
+        fields = [
+            'id', 'title', 'company_name', 'job_type', 'location', 'industry',
+            'employment_type', 'salary_min', 'salary_max', 'salary_currency',
+            'experience_min', 'experience_max', 'experience_level',
+            'education_level', 'status', 'application_deadline',
+            'created_at', 'views_count', 'applications_count',
+            'employer_name', 'employer_logo_display', 'urgency',
+            'job_brief', 'skills', 'company_size', 'interview_method', 'gender_preference',
+        ]
+
+
 class JobApplicationSerializer(serializers.ModelSerializer):
     job_title = serializers.CharField(source='job.title', read_only=True)
     company_name = serializers.CharField(source='job.employer.company_name', read_only=True)
@@ -319,12 +353,12 @@ class JobApplicationSerializer(serializers.ModelSerializer):
             'employee', 'employee_name', 'employee_email', 'employee_phone',
             'candidate_name', 'candidate_email', 'candidate_phone', 
             'resume', 'resume_file_name', 'resume_file_size', 'cover_letter',
-            'screening_answers', 'ats_score', 'matching_keywords', 'missing_keywords',
+            'screening_answers', 'ats_score', 'ats_status', 'matching_keywords', 'missing_keywords',
             'status', 'viewed_by_employer', 'viewed_at',
             'applied_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'employee', 'ats_score', 'matching_keywords', 'missing_keywords',
+            'id', 'employee', 'ats_score', 'ats_status', 'matching_keywords', 'missing_keywords',
             'resume_file_name', 'resume_file_size', 'viewed_by_employer', 'viewed_at',
             'applied_at', 'updated_at'
         ]
@@ -409,12 +443,12 @@ class ApplicantDetailSerializer(serializers.ModelSerializer):
             'candidate_name', 'candidate_email', 'candidate_phone',
             'resume', 'resume_url', 'resume_file_name', 'resume_file_size',
             'cover_letter', 'screening_answers',
-            'ats_score', 'matching_keywords', 'missing_keywords',
+            'ats_score', 'ats_status', 'matching_keywords', 'missing_keywords',
             'status', 'viewed_by_employer', 'viewed_at',
             'applied_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'employee', 'employee_profile', 'ats_score', 'matching_keywords', 
+            'id', 'employee', 'employee_profile', 'ats_score', 'ats_status', 'matching_keywords', 
             'missing_keywords', 'resume_file_name', 'resume_file_size', 
             'viewed_by_employer', 'viewed_at', 'applied_at', 'updated_at'
         ]
@@ -432,6 +466,43 @@ class CandidateSerializer(serializers.ModelSerializer):
         ]
 
 
+class SavedCandidateSearchSerializer(serializers.ModelSerializer):
+    """Saved boolean candidate search; criteria take the boolean search request body"""
+    unseen_count = serializers.IntegerField(read_only=True, default=0)
+    
+    class Meta:
+        model = SavedCandidateSearch
+        fields = [
+            'id', 'name', 'criteria', 'is_active', 'unseen_count',
+            'last_matched_at', 'created_at', 'updated_at'
+        ]
+        read_only_fields = ['id', 'last_matched_at', 'created_at', 'updated_at']
+    
+    def validate_criteria(self, value):
+        serializer = BooleanSearchRequestSerializer(data=value)
+        if not serializer.is_valid():
+            raise serializers.ValidationError(serializer.errors)
+        criteria = dict(serializer.validated_data)
+        try:
+            CandidateSearch(criteria)
+        except BooleanQueryError as e:
+            raise serializers.ValidationError({'query': [str(e)]})
+        return criteria
+
+
+class SavedCandidateSearchMatchSerializer(serializers.ModelSerializer):
+    """Saved search inbox entry with the matching candidate"""
+    candidate = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = SavedCandidateSearchMatch
+        fields = ['id', 'candidate', 'is_seen', 'matched_at']
+        read_only_fields = fields
+    
+    def get_candidate(self, obj):
+        return CandidateSearchProfileSerializer(obj.candidate, context=self.context).data
+
+
 class InterviewerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Interviewer
@@ -673,10 +744,13 @@ class InterviewFeedbackCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class FeedbackTemplateSerializer(serializers.ModelSerializer):
+class FeedbackTemplateSerializer(PendingCountersMixin, serializers.ModelSerializer):
     """Serializer for feedback templates"""
+    pending_counters = {'usage_count': 'feedback_template_usage'}
+    
     class Meta:
         model = FeedbackTemplate
+        list_serializer_class = PendingCountersListSerializer
         fields = [
             'id', 'name', 'description', 'template_data', 'is_default',
             'is_active', 'usage_count', 'created_at', 'updated_at'
@@ -0,0 +1 @@
+# tests package for employer_dashboard
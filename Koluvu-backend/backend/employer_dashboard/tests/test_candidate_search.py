@@ -0,0 +1,104 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from employee_dashboard.models import CandidateSearchDocument, CandidateSearchProfile, EmployeeProfile
+from ..candidate_search_service import RESULT_ORDERING, CandidateSearch, approximate_count
+from ..models import EmployerProfile
+
+User = get_user_model()
+
+
+class CandidateSearchTestCase(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        users = [User.objects.create(username=f'candidate{i}') for i in range(4)]
+        locations = ['Hyderabad', 'Pune', 'Hyderabad', 'Chennai']
+        # bulk_create skips the profile's settings signals
+        employees = EmployeeProfile.objects.bulk_create([
+            EmployeeProfile(user=user, location=location, current_designation='Backend Developer', experience_years=1)
+            for user, location in zip(users, locations)
+        ])
+        profiles = [
+            # location 10 + department 10 + active 5 + last week 5
+            dict(department='IT', actively_looking=True, last_active=now - timedelta(days=1)),
+            # preferred location 5 + department 10 + last month 2
+            dict(department='IT', preferred_location='Hyderabad', last_active=now - timedelta(days=20)),
+            # location 10 + department 10 + active 5, never active
+            dict(department='IT', actively_looking=True, last_active=None),
+            # location 0 + department 10 + active 5 + last week 5
+            dict(department='IT', actively_looking=True, last_active=now - timedelta(days=2)),
+        ]
+        self.profiles = []
+        for employee, fields in zip(employees, profiles):
+            last_active = fields.pop('last_active')
+            profile = CandidateSearchProfile.objects.create(employee=employee, key_skills='Python, Django', **fields)
+            # last_active is auto_now on the profile; set the searched copy directly
+            CandidateSearchDocument.objects.filter(profile=profile).update(last_active=last_active)
+            self.profiles.append(profile)
+        self.now = now
+
+    def ranked(self, criteria):
+        search = CandidateSearch(criteria)
+        queryset = search.annotate_match_scores(search.filter(CandidateSearchDocument.objects.all()), now=self.now)
+        return list(queryset.order_by(*RESULT_ORDERING).values_list('profile_id', 'search_match_score'))
+
+    def test_match_scores_order_results(self):
+        ranked = self.ranked({'query': 'python', 'location': 'hyderabad', 'department': 'IT'})
+        first, second, third, fourth = self.profiles
+        self.assertEqual(ranked, [(first.id, 100), (third.id, 95), (second.id, 87)])
+
+    def test_ties_break_on_recent_activity_then_id(self):
+        ranked = self.ranked({'department': 'IT'})
+        first, second, third, fourth = self.profiles
+        # 70 base + 10 department + 5 active + 5 last week
+        self.assertEqual(ranked[:2], [(first.id, 90), (fourth.id, 90)])
+        self.assertEqual([profile_id for profile_id, _ in ranked], [first.id, fourth.id, third.id, second.id])
+
+    def test_search_does_not_write_scores(self):
+        user = User.objects.create_user(username='employer', password='pass1234')
+        EmployerProfile.objects.create(user=user, company_name='Acme')
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        criteria = {'query': 'python', 'location': 'hyderabad', 'department': 'IT', 'designation': 'developer',
+                    'experience': '0-1 years', 'notice_period': '', 'salary_range': '10-15 LPA'}
+        res = client.post('/api/employer/candidates/boolean-search/', criteria, format='json')
+        self.assertEqual(res.status_code, 200, res.json())
+        self.assertEqual([c['match_score'] for c in res.json()['candidates']], [100, 95, 87])
+        self.assertFalse(CandidateSearchProfile.objects.exclude(match_score=0).exists())
+
+    def test_employee_saves_refresh_the_document_only_for_copied_fields(self):
+        employee = self.profiles[0].employee
+        with mock.patch('employee_dashboard.search_documents.refresh_search_documents') as refresh:
+            employee.bio = 'Engineer'
+            employee.save(update_fields=['bio'])
+            refresh.assert_not_called()
+
+        employee.location = 'Chennai'
+        employee.save(update_fields=['location'])
+        document = CandidateSearchDocument.objects.get(profile=self.profiles[0])
+        self.assertEqual(document.location_text, ' chennai ')
+
+    def test_large_counts_use_the_planner_estimate(self):
+        documents = CandidateSearchDocument.objects.all()
+        self.assertEqual(approximate_count(documents, limit=10), (4, False))
+
+        plan = {'Plan': {'Node Type': 'Seq Scan', 'Plan Rows': 12000}}
+        outputs = [plan, [plan], json.dumps([plan])]
+        postgresql = mock.patch('employer_dashboard.candidate_search_service.connection', vendor='postgresql')
+        for output in outputs:
+            with self.subTest(output=type(output).__name__), postgresql:
+                with mock.patch.object(QuerySet, 'explain', return_value=output) as explain:
+                    self.assertEqual(approximate_count(documents, limit=1), (12000, True))
+                explain.assert_called_once_with(format='json')
+
+        with postgresql, mock.patch.object(QuerySet, 'explain', return_value={'Plan': {}}):
+            with self.assertLogs('employer_dashboard.candidate_search_service', 'WARNING'):
+                self.assertEqual(approximate_count(documents, limit=1), (2, True))
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from employee_dashboard.models import EmployeeProfile
+from shared_services.geo import geocode, within_radius
+from ..job_search_service import jobs_near
+from ..models import EmployerProfile, Job
+
+User = get_user_model()
+
+LOCATION_BASED_URL = '/api/employee/jobs/location-based/'
+
+
+class GeoSearchTestCase(TestCase):
+    def setUp(self):
+        self.employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        self.bengaluru = geocode('Bengaluru')
+
+    def create_job(self, title, location, **fields):
+        return Job.objects.create(
+            employer=self.employer, title=title, description='Build APIs', status='active', location=location, **fields
+        )
+
+    def place_job(self, job, km_north, age_days=0):
+        # One degree of latitude is about 111 km
+        Job.objects.filter(id=job.id).update(
+            latitude=self.bengaluru[0] + km_north / 111.2, longitude=self.bengaluru[1],
+            created_at=timezone.now() - timedelta(days=age_days),
+        )
+
+
+class JobGeocodingTestCase(GeoSearchTestCase):
+    def test_job_save_geocodes_location(self):
+        job = self.create_job('Backend Developer', 'Bangalore, Karnataka')
+        self.assertEqual((job.latitude, job.longitude), self.bengaluru)
+
+        job.location = 'Chennai'
+        job.save(update_fields=['location'])
+        job.refresh_from_db()
+        self.assertEqual((job.latitude, job.longitude), geocode('Chennai'))
+
+        job.location = 'Remote'
+        job.save()
+        job.refresh_from_db()
+        self.assertIsNone(job.latitude)
+
+    def test_employee_profile_save_geocodes_location(self):
+        # bulk_create skips the profile's settings signals
+        profile, = EmployeeProfile.objects.bulk_create([EmployeeProfile(user=User.objects.create(username='candidate'))])
+        profile.location = 'Hybrid - Gurgaon'
+        profile.save(update_fields=['location'])
+        profile.refresh_from_db()
+        self.assertEqual((profile.latitude, profile.longitude), geocode('Gurugram'))
+
+        # Writes that leave the location alone keep the coordinates
+        EmployeeProfile.objects.filter(id=profile.id).update(latitude=1.0)
+        profile.refresh_from_db()
+        profile.bio = 'Engineer'
+        profile.save(update_fields=['bio'])
+        profile.refresh_from_db()
+        self.assertEqual(profile.latitude, 1.0)
+
+    def test_geocode_locations_command_only_writes_changed_rows(self):
+        jobs = [self.create_job(f'Developer {index}', 'Bengaluru') for index in range(3)]
+        remote = self.create_job('Remote Developer', 'Remote')
+        Job.objects.filter(id__in=[jobs[0].id, jobs[1].id]).update(latitude=None, longitude=None)
+        Job.objects.filter(id=remote.id).update(latitude=1.0, longitude=1.0)
+
+        out = StringIO()
+        with self.assertNumQueries(4):
+            # Job: one read and two flushes for three changed rows; EmployeeProfile: one read
+            call_command('geocode_locations', batch_size=2, stdout=out)
+        self.assertIn('Job: 3 of 4 located, 3 updated', out.getvalue())
+        self.assertEqual(set(Job.objects.values_list('latitude', 'longitude')), {self.bengaluru, (None, None)})
+
+
+class RadiusQueryTestCase(GeoSearchTestCase):
+    def test_within_radius_computes_distances_in_sql(self):
+        local = self.create_job('Local', 'Bengaluru')
+        chennai = self.create_job('Chennai', 'Chennai')
+        self.create_job('Remote', 'Remote')
+
+        near = within_radius(Job.objects.all(), *self.bengaluru, 50)
+        self.assertEqual([job.id for job in near], [local.id])
+        self.assertAlmostEqual(near[0].distance_km, 0, places=3)
+
+        far = {job.id: job.distance_km for job in within_radius(Job.objects.all(), *self.bengaluru, 400)}
+        self.assertEqual(set(far), {local.id, chennai.id})
+        self.assertAlmostEqual(far[chennai.id], 290, delta=5)
+
+    def test_jobs_near_orders_by_distance_band_then_recency(self):
+        old_near = self.create_job('Old near', 'Bengaluru')
+        new_near = self.create_job('New near', 'Bengaluru')
+        farther = self.create_job('Farther', 'Bengaluru')
+        outside = self.create_job('Outside', 'Bengaluru')
+        closed = self.create_job('Closed', 'Bengaluru')
+        self.place_job(old_near, 1, age_days=5)
+        self.place_job(new_near, 3, age_days=1)
+        self.place_job(farther, 12, age_days=0)
+        self.place_job(outside, 60)
+        Job.objects.filter(id=closed.id).update(status='closed')
+
+        jobs = list(jobs_near(*self.bengaluru, 50))
+        # 1 and 3 km share the first 5 km band, so the newer job leads
+        self.assertEqual([job.id for job in jobs], [new_near.id, old_near.id, farther.id])
+        self.assertAlmostEqual(jobs[2].distance_km, 12, delta=0.1)
+
+
+class LocationBasedJobsTestCase(GeoSearchTestCase):
+    def setUp(self):
+        super().setUp()
+        user = User.objects.create(username='candidate')
+        # bulk_create skips the profile's settings signals
+        self.profile, = EmployeeProfile.objects.bulk_create([EmployeeProfile(
+            user=user, location='Bengaluru', latitude=self.bengaluru[0], longitude=self.bengaluru[1],
+        )])
+        self.client = APIClient()
+        self.client.force_authenticate(user=user)
+
+        self.jobs = [self.create_job(f'Developer {index}', 'Bengaluru') for index in range(3)]
+        for index, job in enumerate(self.jobs):
+            self.place_job(job, index * 10)
+        self.chennai_job = self.create_job('Chennai Developer', 'Chennai')
+
+    def get(self, **params):
+        return self.client.get(LOCATION_BASED_URL, params)
+
+    def test_uses_profile_coordinates(self):
+        data = self.get().json()
+        self.assertEqual(data['total_count'], 3)
+        self.assertEqual([job['id'] for job in data['jobs']], [job.id for job in self.jobs])
+        self.assertEqual([job['distance_km'] for job in data['jobs']], [0.0, 10.0, 20.0])
+        self.assertEqual((data['latitude'], data['longitude'], data['radius']), (*self.bengaluru, 50.0))
+
+        data = self.get(radius=15).json()
+        self.assertEqual(data['total_count'], 2)
+
+    def test_location_parameter_overrides_profile(self):
+        data = self.get(location='Chennai').json()
+        self.assertEqual(data['location'], 'Chennai')
+        self.assertEqual([job['id'] for job in data['jobs']], [self.chennai_job.id])
+
+    def test_unknown_location_returns_no_jobs(self):
+        data = self.get(location='Atlantis').json()
+        self.assertEqual((data['jobs'], data['total_count']), ([], 0))
+        self.assertIn('message', data)
+
+    def test_pagination(self):
+        data = self.get(page=2, page_size=2).json()
+        self.assertEqual((data['total_count'], data['page'], data['page_size']), (3, 2, 2))
+        self.assertEqual([job['id'] for job in data['jobs']], [self.jobs[2].id])
+
+    def test_invalid_parameters_are_rejected(self):
+        for params in ({'radius': 'abc'}, {'radius': 'nan'}, {'radius': 'inf'}, {'page': 'x'}, {'page_size': '1.5'}):
+            with self.subTest(**params):
+                self.assertEqual(self.get(**params).status_code, 400)
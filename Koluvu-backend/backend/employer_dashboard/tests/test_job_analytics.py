@@ -0,0 +1,76 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from .. import job_analytics
+from ..job_analytics import client_ip, flush_job_views, job_view_analytics, record_job_view
+from ..models import EmployerProfile, Job, JobViewDay
+
+User = get_user_model()
+
+
+class ClientIpTestCase(TestCase):
+    def request(self, forwarded):
+        return RequestFactory().get('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR=forwarded)
+
+    def test_forwarded_for_is_ignored_without_trusted_proxies(self):
+        self.assertEqual(client_ip(self.request('203.0.113.9')), '10.0.0.1')
+
+    def test_trusted_proxies_are_counted_from_the_right(self):
+        # The client spoofed 1.2.3.4; two proxies appended the real address and their own
+        request = self.request('1.2.3.4, 203.0.113.9, 10.0.0.2')
+        with override_settings(TRUSTED_PROXY_COUNT=1):
+            self.assertEqual(client_ip(request), '10.0.0.2')
+        with override_settings(TRUSTED_PROXY_COUNT=2):
+            self.assertEqual(client_ip(request), '203.0.113.9')
+        with override_settings(TRUSTED_PROXY_COUNT=5):
+            self.assertEqual(client_ip(request), '1.2.3.4')
+
+
+class JobViewFlushTestCase(TestCase):
+    def setUp(self):
+        employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        self.job = Job.objects.create(employer=employer, title='Backend Developer', description='Build APIs', status='active')
+
+        schedule = mock.patch.object(job_analytics, '_schedule_flush')
+        self.schedule_flush = schedule.start()
+        self.addCleanup(schedule.stop)
+        self.addCleanup(flush_job_views)
+
+    def view(self, ip):
+        request = RequestFactory().get('/', REMOTE_ADDR=ip)
+        request.user = AnonymousUser()
+        record_job_view(request, self.job.id)
+
+    def test_first_view_schedules_one_flush(self):
+        self.view('10.0.0.1')
+        self.view('10.0.0.2')
+        self.schedule_flush.assert_called_once()
+
+        flush_job_views()
+        self.view('10.0.0.1')
+        self.assertEqual(self.schedule_flush.call_count, 2)
+
+    def test_flush_merges_into_existing_rows(self):
+        for ip in ('10.0.0.1', '10.0.0.1', '10.0.0.2'):
+            self.view(ip)
+        self.assertEqual(flush_job_views(), 1)
+
+        # A later buffer adds to the row the first flush wrote
+        self.view('10.0.0.3')
+        self.assertEqual(flush_job_views(), 1)
+
+        row = JobViewDay.objects.get(job=self.job, date=timezone.localdate())
+        self.assertEqual(row.views, 4)
+        self.assertEqual(row.referrers, {'direct': 4})
+        totals = job_view_analytics(self.job, days=1)['totals']
+        self.assertEqual((totals['views'], totals['unique_viewers']), (4, 3))
+
+    def test_row_written_by_another_process_is_merged(self):
+        JobViewDay.objects.create(job=self.job, date=timezone.localdate(), views=5)
+        self.view('10.0.0.1')
+        self.assertEqual(flush_job_views(), 1)
+        self.assertEqual(JobViewDay.objects.get(job=self.job).views, 6)
@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase
+
+from .. import job_expiry
+from ..checks import check_expired_jobs_swept
+from ..job_expiry import sweep_expired_jobs
+from ..models import EmployerProfile, EmployerSettings, Job, Notification
+
+User = get_user_model()
+
+TODAY = date(2026, 10, 18)
+
+
+class SweepExpiredJobsTestCase(TestCase):
+    def setUp(self):
+        self.jobs = {}
+        for name, settings in [
+            ('repost', dict(auto_repost_expired_jobs=True, application_deadline_days=15)),
+            ('close', None),  # Employers without settings close by default
+            ('expire', dict(auto_repost_expired_jobs=False, auto_close_expired_jobs=False)),
+        ]:
+            employer = EmployerProfile.objects.create(user=User.objects.create(username=name), company_name=name)
+            if settings:
+                EmployerSettings.objects.create(employer=employer, **settings)
+            self.jobs[name] = Job.objects.create(
+                employer=employer, title=f'{name} job', description='Build APIs', status='active',
+                application_deadline=TODAY - timedelta(days=1),
+            )
+        self.open_job = Job.objects.create(
+            employer=self.jobs['close'].employer, title='Open job', description='Build APIs', status='active',
+            application_deadline=TODAY,
+        )
+
+    def status(self, name):
+        job = self.jobs[name]
+        job.refresh_from_db()
+        return job.status, job.application_deadline
+
+    def test_each_employer_setting_is_applied(self):
+        summary = sweep_expired_jobs(today=TODAY, batch_size=2)
+
+        self.assertEqual(summary, {'reposted': 1, 'closed': 1, 'expired': 1})
+        self.assertEqual(self.status('repost'), ('active', TODAY + timedelta(days=15)))
+        self.assertEqual(self.status('close'), ('closed', TODAY - timedelta(days=1)))
+        self.assertEqual(self.status('expire'), ('expired', TODAY - timedelta(days=1)))
+        self.open_job.refresh_from_db()
+        self.assertEqual(self.open_job.status, 'active')
+
+        notifications = dict(Notification.objects.values_list('job_id', 'metadata__action'))
+        self.assertEqual(notifications, {
+            self.jobs['repost'].id: 'reposted', self.jobs['close'].id: 'closed', self.jobs['expire'].id: 'expired',
+        })
+
+        self.assertEqual(sweep_expired_jobs(today=TODAY), {'reposted': 0, 'closed': 0, 'expired': 0})
+        self.assertEqual(Notification.objects.count(), 3)
+
+    def test_jobs_changed_after_the_batch_is_read_are_not_notified(self):
+        atomic = transaction.atomic
+        closed_job = self.jobs['expire']
+
+        def employer_closes_job(*args, **kwargs):
+            Job.objects.filter(id=closed_job.id).update(status='closed')
+            return atomic(*args, **kwargs)
+
+        with mock.patch.object(job_expiry.transaction, 'atomic', side_effect=employer_closes_job):
+            summary = sweep_expired_jobs(today=TODAY)
+
+        self.assertEqual(summary, {'reposted': 1, 'closed': 1, 'expired': 0})
+        self.assertFalse(Notification.objects.filter(job=closed_job).exists())
+        self.assertEqual(Notification.objects.count(), 2)
+
+    def test_check_warns_about_unswept_jobs(self):
+        Job.objects.filter(id=self.jobs['close'].id).update(application_deadline=date.today() - timedelta(days=3))
+
+        self.assertEqual(check_expired_jobs_swept(None), [])
+        warnings = check_expired_jobs_swept(None, databases=['default'])
+        self.assertEqual([warning.id for warning in warnings], ['employer_dashboard.W001'])
+
+        sweep_expired_jobs()
+        self.assertEqual(check_expired_jobs_swept(None, databases=['default']), [])
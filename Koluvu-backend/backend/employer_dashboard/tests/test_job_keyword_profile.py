@@ -0,0 +1,48 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+
+from shared_services.ats.services import ATSAnalyzerService, JOB_KEYWORD_WEIGHTS
+from ..models import EmployerProfile, Job
+
+User = get_user_model()
+
+
+class JobKeywordProfileTestCase(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='employer', password='pass1234')
+        employer = EmployerProfile.objects.create(user=user, company_name='Acme')
+        self.job = Job.objects.create(
+            employer=employer, title='Backend Developer', description='Build APIs',
+            skills=['Python', 'Django'], requirements=['Experience with python and postgres'],
+            ats_keywords='REST, docker', status='active',
+        )
+
+    def test_profile_is_persisted_with_field_weights(self):
+        self.job.refresh_from_db()
+        profile = self.job.ats_keyword_profile
+        self.assertEqual(profile['python'], JOB_KEYWORD_WEIGHTS['skills'])
+        self.assertEqual(profile['docker'], JOB_KEYWORD_WEIGHTS['ats_keywords'])
+        self.assertEqual(profile['postgres'], JOB_KEYWORD_WEIGHTS['requirements'])
+        self.assertEqual(len(self.job.ats_keyword_version), 64)
+        self.assertEqual(ATSAnalyzerService().get_job_keywords(self.job), profile)
+
+    def test_unrelated_saves_keep_the_version(self):
+        version = self.job.ats_keyword_version
+        self.job.title = 'Senior Backend Developer'
+        self.job.save(update_fields=['title'])
+        self.job.save()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.ats_keyword_version, version)
+
+    def test_source_field_saves_recompile_the_profile(self):
+        version = self.job.ats_keyword_version
+        self.job.skills = ['Python', 'Django', 'Kubernetes']
+        self.job.save(update_fields=['skills'])
+        self.job.refresh_from_db()
+        self.assertNotEqual(self.job.ats_keyword_version, version)
+        self.assertIn('kubernetes', self.job.ats_keyword_profile)
+
+    def test_jobs_without_a_stored_profile_are_compiled_on_the_fly(self):
+        Job.objects.filter(id=self.job.id).update(ats_keyword_profile={}, ats_keyword_version='')
+        self.job.refresh_from_db()
+        self.assertEqual(ATSAnalyzerService().get_job_keywords(self.job)['django'], JOB_KEYWORD_WEIGHTS['skills'])
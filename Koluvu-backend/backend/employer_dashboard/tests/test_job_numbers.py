@@ -0,0 +1,135 @@
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection, connections
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models import QuerySet
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+
+from ..models import EmployerProfile, Job, JobNumberSequence
+
+User = get_user_model()
+
+
+def create_employer(username, company_name='Acme'):
+    return EmployerProfile.objects.create(user=User.objects.create(username=username), company_name=company_name)
+
+
+def create_job(employer, title='Backend Developer'):
+    return Job.objects.create(
+        employer=employer, company_name=employer.company_name, title=title, description='Build APIs', status='active'
+    )
+
+
+class JobNumberSequenceTestCase(TestCase):
+    def setUp(self):
+        self.employer = create_employer('employer')
+
+    def test_first_use_continues_after_existing_jobs(self):
+        create_job(self.employer)
+        JobNumberSequence.objects.all().delete()
+        self.assertEqual(JobNumberSequence.next_number(self.employer), 2)
+        self.assertEqual(JobNumberSequence.next_number(self.employer), 3)
+
+    def test_concurrent_first_use_takes_the_next_number(self):
+        update = QuerySet.update
+        calls = []
+
+        def update_after_concurrent_post(queryset, **kwargs):
+            if queryset.model is JobNumberSequence and not calls:
+                calls.append(kwargs)
+                # Another post creates the row between our UPDATE and INSERT
+                JobNumberSequence.objects.create(employer=self.employer, last_number=1)
+                return 0
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', autospec=True, side_effect=update_after_concurrent_post):
+            self.assertEqual(JobNumberSequence.next_number(self.employer), 2)
+        self.assertEqual(JobNumberSequence.objects.get(employer=self.employer).last_number, 2)
+
+    def test_url_taken_by_another_employer_takes_the_next_number(self):
+        first = create_job(self.employer)
+        # Same company slug and title, and the other employer's first number
+        second = create_job(create_employer('namesake'))
+
+        self.assertEqual((first.company_slug, first.title_slug, first.job_number), ('acme', 'backend-developer', 1))
+        self.assertEqual((second.company_slug, second.title_slug, second.job_number), ('acme', 'backend-developer', 2))
+        self.assertEqual(JobNumberSequence.objects.get(employer=second.employer).last_number, 2)
+
+    def test_retries_stop_after_the_attempt_limit(self):
+        create_job(self.employer)
+        namesake = create_employer('namesake')
+        with mock.patch.object(JobNumberSequence, 'next_number', return_value=1) as next_number:
+            with self.assertRaises(IntegrityError):
+                create_job(namesake)
+        # One number for the insert, one per retry
+        self.assertEqual(next_number.call_count, Job.JOB_NUMBER_ATTEMPTS)
+        self.assertFalse(Job.objects.filter(employer=namesake).exists())
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class ConcurrentJobNumberTestCase(TransactionTestCase):
+    def test_concurrent_posts_get_distinct_numbers(self):
+        employer = create_employer('employer')
+        numbers = []
+        barrier = threading.Barrier(4)
+
+        def post():
+            try:
+                barrier.wait()
+                numbers.append(JobNumberSequence.next_number(employer))
+            finally:
+                connections.close_all()
+
+        threads = [threading.Thread(target=post) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(numbers), [1, 2, 3, 4])
+
+
+class JobNumberMigrationTestCase(TransactionTestCase):
+    migrate_from = [('employer_dashboard', '0021_job_view_days')]
+    migrate_to = [('employer_dashboard', '0022_job_number_sequence')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        self.addCleanup(self.migrate_to_latest)
+        executor.migrate(self.migrate_from)
+        self.apps = executor.loader.project_state(self.migrate_from).apps
+
+    def migrate_to_latest(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_duplicate_urls_are_renumbered(self):
+        User = self.apps.get_model('auth', 'User')
+        EmployerProfile = self.apps.get_model('employer_dashboard', 'EmployerProfile')
+        Job = self.apps.get_model('employer_dashboard', 'Job')
+        acme = EmployerProfile.objects.create(user=User.objects.create(username='acme'), company_name='Acme')
+        namesake = EmployerProfile.objects.create(user=User.objects.create(username='namesake'), company_name='Acme')
+
+        url = dict(company_slug='acme', title_slug='backend-developer', description='Build APIs')
+        jobs = [
+            Job.objects.create(employer=acme, title='Backend Developer', job_number=1, **url),
+            Job.objects.create(employer=namesake, title='Backend Developer', job_number=1, **url),  # Same URL
+            Job.objects.create(employer=acme, title='Backend Developer', job_number=0, **url),  # Unnumbered
+            Job.objects.create(employer=namesake, title='Backend Developer', job_number=3, **url),
+        ]
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+        apps = executor.loader.project_state(self.migrate_to).apps
+        Job = apps.get_model('employer_dashboard', 'Job')
+        JobNumberSequence = apps.get_model('employer_dashboard', 'JobNumberSequence')
+
+        numbers = dict(Job.objects.values_list('id', 'job_number'))
+        # The earliest job keeps its URL; later duplicates move past each employer's last number
+        self.assertEqual([numbers[job.id] for job in jobs], [1, 4, 2, 3])
+        self.assertEqual(
+            dict(JobNumberSequence.objects.values_list('employer_id', 'last_number')),
+            {acme.id: 2, namesake.id: 4},
+        )
@@ -0,0 +1,56 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from employee_dashboard.models import CandidateSearchDocument, CandidateSearchProfile, EmployeeProfile
+from ..candidate_search_service import percolate_pending_candidates
+from ..models import EmployerProfile, SavedCandidateSearch, SavedCandidateSearchMatch
+
+User = get_user_model()
+
+
+class SavedSearchPercolationTestCase(TestCase):
+    def setUp(self):
+        self.employer_user = User.objects.create(username='employer')
+        employer = EmployerProfile.objects.create(user=self.employer_user, company_name='Acme')
+        self.search = SavedCandidateSearch.objects.create(employer=employer, name='Python', criteria={'query': 'python'})
+        # bulk_create skips the profile's settings signals
+        self.employee, = EmployeeProfile.objects.bulk_create([EmployeeProfile(user=User.objects.create(username='candidate'))])
+
+    def test_profile_save_queues_percolation(self):
+        with mock.patch('employer_dashboard.candidate_search_service._get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                profile = CandidateSearchProfile.objects.create(employee=self.employee, key_skills='Python, Django')
+                # Nothing is matched inside the saving transaction
+                get_executor.return_value.submit.assert_not_called()
+
+        get_executor.return_value.submit.assert_called_once()
+        self.assertFalse(SavedCandidateSearchMatch.objects.exists())
+        self.assertIsNotNone(CandidateSearchDocument.objects.get(profile=profile).percolation_requested_at)
+
+    def test_pending_candidates_are_percolated_once(self):
+        profile = CandidateSearchProfile.objects.create(employee=self.employee, key_skills='Python, Django')
+
+        self.assertEqual(percolate_pending_candidates(), {'candidates': 1, 'matches': 1})
+        self.assertTrue(SavedCandidateSearchMatch.objects.filter(search=self.search, candidate=profile).exists())
+        self.assertIsNone(CandidateSearchDocument.objects.get(profile=profile).percolation_requested_at)
+
+        self.assertEqual(percolate_pending_candidates(), {'candidates': 0, 'matches': 0})
+
+    def test_matches_are_marked_seen_by_id(self):
+        profile = CandidateSearchProfile.objects.create(employee=self.employee, key_skills='Python, Django')
+        percolate_pending_candidates()
+        match = SavedCandidateSearchMatch.objects.get(candidate=profile)
+        client = APIClient()
+        client.force_authenticate(user=self.employer_user)
+        url = f'/api/employer/candidates/saved-searches/{self.search.id}/matches/'
+
+        for ids in (['abc'], 'abc', [[1]]):
+            with self.subTest(ids=ids):
+                response = client.post(url, {'ids': ids}, format='json')
+                self.assertEqual(response.status_code, 400)
+
+        response = client.post(url, {'ids': [match.id]}, format='json')
+        self.assertEqual(response.json(), {'marked_seen': 1})
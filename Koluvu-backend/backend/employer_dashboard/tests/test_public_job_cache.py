@@ -0,0 +1,79 @@
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from ..models import EmployerProfile, Job
+from ..public_job_cache import bump_public_jobs_version, get_public_jobs_version
+
+User = get_user_model()
+
+JOB_LIST_URL = '/api/employer/jobs/public/'
+
+
+def public_jobs_cache(backend, **options):
+    return {**settings.CACHES, 'public_jobs': {'BACKEND': backend, **options}}
+
+
+class PublicJobCacheTestCase(TestCase):
+    def setUp(self):
+        # The file based cache stands in for a shared backend such as Redis
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared = override_settings(CACHES=public_jobs_cache(
+            'django.core.cache.backends.filebased.FileBasedCache', LOCATION=location
+        ))
+        shared.enable()
+        self.addCleanup(shared.disable)
+
+        employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        self.job = Job.objects.create(employer=employer, title='Backend Developer', description='Build APIs', status='active')
+        self.client = APIClient()
+
+    def titles(self, res):
+        return [job['title'] for job in res.json()['results']]
+
+    def test_job_save_bumps_the_version(self):
+        self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'HIT')
+
+        version = get_public_jobs_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.title = 'Platform Engineer'
+            self.job.save()
+        self.assertEqual(get_public_jobs_version(), version + 1)
+
+        res = self.client.get(JOB_LIST_URL)
+        self.assertEqual(res['X-Cache'], 'MISS')
+        self.assertEqual(self.titles(res), ['Platform Engineer'])
+
+    def test_version_bump_waits_for_commit(self):
+        self.client.get(JOB_LIST_URL)
+        with self.captureOnCommitCallbacks() as callbacks:
+            Job.objects.create(employer=self.job.employer, title='Data Engineer', description='ETL', status='active')
+            self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'HIT')
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.titles(self.client.get(JOB_LIST_URL)), ['Data Engineer', 'Backend Developer'])
+
+    def test_counter_saves_keep_cached_pages(self):
+        self.client.get(JOB_LIST_URL)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.views_count = 10
+            self.job.save(update_fields=['views_count'])
+        self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'HIT')
+
+    def test_manual_bump_invalidates(self):
+        self.client.get(JOB_LIST_URL)
+        bump_public_jobs_version()
+        self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'MISS')
+
+    @override_settings(CACHES=public_jobs_cache('django.core.cache.backends.locmem.LocMemCache'))
+    def test_process_local_cache_disables_response_caching(self):
+        self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(JOB_LIST_URL)['X-Cache'], 'MISS')
+        self.assertIsNone(bump_public_jobs_version())
@@ -0,0 +1,118 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from ..job_search_service import apply_public_job_filters, count_public_job_facets, public_jobs
+from ..models import EmployerProfile, Job
+
+User = get_user_model()
+
+
+class PublicJobFacetsTestCase(TestCase):
+    def setUp(self):
+        employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        jobs = [
+            dict(location='Pune', industry='IT', experience_min=0, experience_max=1, salary_min=400000),
+            dict(location=' pune ', industry='it', experience_min=1, experience_max=3, salary_min=700000),
+            dict(location='Pune, Maharashtra', industry='Finance', experience_min=2, experience_max=5, salary_min=None),
+            dict(location='Chennai', industry='IT', experience_min=6, experience_max=10, salary_min=1600000),
+        ]
+        for index, fields in enumerate(jobs):
+            Job.objects.create(employer=employer, title=f'Developer {index}', description='Build APIs', status='active', **fields)
+
+    def assertCountsMatchFilters(self, facets, filters=None):
+        for facet, buckets in facets.items():
+            for bucket in buckets:
+                with self.subTest(facet=facet, value=bucket['value']):
+                    selected = {**(filters or {}), **bucket['params']}
+                    self.assertEqual(
+                        bucket['count'], apply_public_job_filters(public_jobs(), selected, rank=False).count()
+                    )
+
+    def test_text_facets_group_normalized_values(self):
+        facets = count_public_job_facets({})
+        self.assertEqual(facets['location'], [
+            {'value': 'pune', 'count': 3, 'params': {'location': 'pune'}},
+            {'value': 'chennai', 'count': 1, 'params': {'location': 'chennai'}},
+            {'value': 'pune, maharashtra', 'count': 1, 'params': {'location': 'pune, maharashtra'}},
+        ])
+        self.assertEqual([(b['value'], b['count']) for b in facets['industry']], [('it', 3), ('finance', 1)])
+
+    def test_bucket_counts_match_selecting_them(self):
+        self.assertCountsMatchFilters(count_public_job_facets({}))
+        filters = {'industry': 'it'}
+        self.assertCountsMatchFilters(count_public_job_facets(filters), filters)
+
+    def test_range_buckets_map_onto_filters(self):
+        facets = count_public_job_facets({})
+        self.assertEqual(facets['experience'][0], {'value': '0-1 years', 'count': 1, 'params': {'exp_min': '0', 'exp_max': '1'}})
+        self.assertEqual(facets['experience'][-1], {'value': '5+ years', 'count': 1, 'params': {'exp_min': '5'}})
+        self.assertEqual(facets['salary'][0], {'value': '3+ LPA', 'count': 3, 'params': {'salary_min': '300000'}})
+
+
+class PublicJobListTestCase(TestCase):
+    def setUp(self):
+        employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        self.jobs = [
+            Job.objects.create(employer=employer, title=f'Python Developer {index}', description='Build APIs', status='active')
+            for index in range(5)
+        ]
+        self.client = APIClient()
+
+    def test_relevance_results_are_cursor_paginated(self):
+        res = self.client.get('/api/employer/jobs/public/', {'search': 'python', 'page_size': 2})
+        self.assertEqual(res.status_code, 200)
+        self.assertNotIn('count', res.json())
+
+        ids = []
+        while True:
+            data = res.json()
+            self.assertLessEqual(len(data['results']), 2)
+            ids.extend(job['id'] for job in data['results'])
+            if not data['next']:
+                break
+            res = self.client.get(data['next'])
+            self.assertEqual(res.status_code, 200)
+
+        # Equal ranks fall back to newest first
+        expected = sorted(self.jobs, key=lambda job: (job.created_at, job.id), reverse=True)
+        self.assertEqual(ids, [job.id for job in expected])
+
+    def test_invalid_cursor_is_not_found(self):
+        res = self.client.get('/api/employer/jobs/public/', {'search': 'python', 'cursor': 'not-a-cursor'})
+        self.assertEqual(res.status_code, 404)
+
+
+class PublicJobDetailConditionalTestCase(TestCase):
+    def setUp(self):
+        employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        self.job = Job.objects.create(employer=employer, title='Backend Developer', description='Build APIs', status='active')
+        self.url = f'/api/employer/jobs/public/{self.job.id}/'
+        self.client = APIClient()
+
+    def test_304_for_current_etag(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, 200)
+        etag = res['ETag']
+
+        res = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res.content, b'')
+        self.assertEqual(res['ETag'], etag)
+
+        self.job.title = 'Platform Engineer'
+        self.job.save()
+        res = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res['ETag'], etag)
+        self.assertEqual(res.json()['title'], 'Platform Engineer')
+
+    def test_304_if_not_modified_since(self):
+        last_modified = self.client.get(self.url)['Last-Modified']
+
+        res = self.client.get(self.url, headers={'If-Modified-Since': last_modified})
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res['Last-Modified'], last_modified)
+
+        res = self.client.get(self.url, headers={'If-Modified-Since': 'Thu, 01 Jan 2015 00:00:00 GMT'})
+        self.assertEqual(res.status_code, 200)
@@ -0,0 +1,85 @@
+from concurrent.futures import Future
+from unittest import mock
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from employee_dashboard.models import EmployeeProfile
+from ..models import EmployerProfile, Job, JobApplication
+from ..ats_rescoring_service import ATSRescoringService, rescore_requested_jobs, score_chunk
+
+User = get_user_model()
+
+
+class JobApplicantsRescoreTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='employer', password='pass1234')
+        self.employer = EmployerProfile.objects.create(user=self.user, company_name='Acme')
+        self.job = Job.objects.create(
+            employer=self.employer, title='Backend Developer', description='Build APIs',
+            skills=['Python', 'Django'], status='active',
+        )
+        candidate = User.objects.create_user(username='candidate', password='pass1234')
+        # bulk_create skips the profile's settings signals
+        employee, = EmployeeProfile.objects.bulk_create([EmployeeProfile(user=candidate)])
+        self.application = JobApplication.objects.create(
+            job=self.job, employee=employee,
+            candidate_name='Candidate', candidate_email='candidate@example.com',
+            resume_text='Python and Django developer', ats_score=0.0, ats_status='completed',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_rescore_is_queued(self):
+        with mock.patch('employer_dashboard.ats_rescoring_service._get_executor') as get_executor:
+            with self.captureOnCommitCallbacks(execute=True):
+                res = self.client.post(f'/api/employer/jobs/{self.job.id}/applicants/rescore/')
+
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(res.json()['applications'], 1)
+        get_executor.return_value.submit.assert_called_once()
+        self.job.refresh_from_db()
+        self.assertIsNotNone(self.job.rescore_requested_at)
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.ats_score, 0.0)
+
+    def test_requested_jobs_are_rescored_once(self):
+        Job.objects.filter(id=self.job.id).update(rescore_requested_at='2026-01-01T00:00:00Z')
+
+        totals = rescore_requested_jobs()
+        self.assertEqual(totals['jobs'], 1)
+        self.assertEqual(totals['scored'], 1)
+        self.application.refresh_from_db()
+        self.assertGreater(self.application.ats_score, 0)
+        self.job.refresh_from_db()
+        self.assertIsNone(self.job.rescore_requested_at)
+
+        self.assertEqual(rescore_requested_jobs()['jobs'], 0)
+
+    def test_pool_workers_start_after_connections_are_closed(self):
+        events = []
+
+        def submit(fn, *args):
+            events.append('submit')
+            future = Future()
+            future.set_result(score_chunk(*args))
+            return future
+
+        service = ATSRescoringService(workers=2)
+        iter_chunks = service._iter_chunks
+
+        def chunks(scorable):
+            for chunk in iter_chunks(scorable):
+                events.append('query')
+                yield chunk
+
+        with mock.patch.object(service, '_iter_chunks', side_effect=chunks), \
+                mock.patch('employer_dashboard.ats_rescoring_service.connections') as connections, \
+                mock.patch('employer_dashboard.ats_rescoring_service.ProcessPoolExecutor') as executor_class:
+            connections.close_all.side_effect = lambda: events.append('close')
+            executor_class.return_value.__enter__.return_value.submit.side_effect = submit
+            stats = service.rescore(JobApplication.objects.all())
+
+        self.assertEqual(events, ['query', 'close', 'submit'])
+        self.assertEqual(stats['scored'], 1)
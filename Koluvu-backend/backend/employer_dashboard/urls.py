@@ -18,10 +18,12 @@ from .views import (
     JobApplicationListView,
     JobApplicationDetailView,
     PublicJobListView,
+    PublicJobFacetsView,
     PublicJobDetailView,
     PublicJobDetailByIdView,
     PublicJobDetailBySlugView,
     JobStatsView,
+    JobViewAnalyticsView,
     RecentJobsView,
     JobBulkActionView,
     JobCloseView,
@@ -34,6 +36,9 @@ from .views import (
     ClosedJobsView,
     ClosedJobsBulkActionView,
     BooleanCandidateSearchView,
+    SavedCandidateSearchListCreateView,
+    SavedCandidateSearchDetailView,
+    SavedCandidateSearchMatchesView,
     # Interview Scheduler Views
     CandidateListCreateView,
     CandidateDetailView,
@@ -70,6 +75,8 @@ from .views import (
 from .application_views import (
     JobApplyView,
     JobApplicantsListView,
+    JobApplicantsRankingView,
+    JobApplicantsRescoreView,
     ApplicantDetailView,
     MyApplicationsListView,
 )
@@ -100,6 +107,7 @@ urlpatterns = [
     # Public endpoints
     path('companies/', CompaniesListView.as_view(), name='companies_list'),
     path('jobs/public/', PublicJobListView.as_view(), name='public_job_list'),
+    path('jobs/public/facets/', PublicJobFacetsView.as_view(), name='public_job_facets'),
     path('jobs/public/<int:pk>/', PublicJobDetailView.as_view(), name='public_job_detail'),
     path('jobs/single/', PublicJobDetailByIdView.as_view(), name='public_job_detail_by_id'),  # Deprecated
     path('jobs/<slug:company_slug>/<slug:title_slug>/<int:job_number>/', PublicJobDetailBySlugView.as_view(), name='public_job_detail_by_slug'),
@@ -130,6 +138,7 @@ urlpatterns = [
     path('jobs/expired-bulk-action/', ExpiredJobsBulkActionView.as_view(), name='expired_jobs_bulk_action'),
     path('jobs/closed-bulk-action/', ClosedJobsBulkActionView.as_view(), name='closed_jobs_bulk_action'),
     path('jobs/<int:pk>/', JobDetailView.as_view(), name='job_detail'),
+    path('jobs/<int:pk>/analytics/', JobViewAnalyticsView.as_view(), name='job_view_analytics'),
     path('jobs/<int:pk>/close/', JobCloseView.as_view(), name='job_close'),
     path('jobs/<int:pk>/activate/', JobActivateView.as_view(), name='job_activate'),
     path('jobs/<int:pk>/update-views/', JobViewCountUpdateView.as_view(), name='job_update_views'),
@@ -138,6 +147,8 @@ urlpatterns = [
     # Job Application Endpoints (NEW)
     path('jobs/<int:job_id>/apply/', JobApplyView.as_view(), name='job_apply'),  # Public/Employee - Submit application
     path('jobs/<int:job_id>/applicants/', JobApplicantsListView.as_view(), name='job_applicants_list'),  # Employer - View applicants
+    path('jobs/<int:job_id>/applicants/ranked/', JobApplicantsRankingView.as_view(), name='job_applicants_ranked'),  # Employer - TF-IDF ranking
+    path('jobs/<int:job_id>/applicants/rescore/', JobApplicantsRescoreView.as_view(), name='job_applicants_rescore'),  # Employer - Re-compute ATS scores
     
     # Applications (Protected - Employer only)
     path('applications/', JobApplicationListView.as_view(), name='application_list'),
@@ -146,6 +157,9 @@ urlpatterns = [
     
     # Boolean Search (Protected - Employer only)
     path('candidates/boolean-search/', BooleanCandidateSearchView.as_view(), name='boolean_candidate_search'),
+    path('candidates/saved-searches/', SavedCandidateSearchListCreateView.as_view(), name='saved_candidate_search_list_create'),
+    path('candidates/saved-searches/<int:pk>/', SavedCandidateSearchDetailView.as_view(), name='saved_candidate_search_detail'),
+    path('candidates/saved-searches/<int:pk>/matches/', SavedCandidateSearchMatchesView.as_view(), name='saved_candidate_search_matches'),
     
     # Interview Scheduler (Protected - Employer only)
     path('candidates/', CandidateListCreateView.as_view(), name='candidate_list_create'),
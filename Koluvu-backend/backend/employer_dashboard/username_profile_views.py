@@ -7,6 +7,8 @@ from django.contrib.auth.models import User
 from django.shortcuts import get_object_or_404
 from .models import EmployerProfile
 from .serializers import EmployerProfileSerializer
+from .dashboard_views import employer_profile_etag
+from shared_services.http_cache import not_modified_response, private_cache_control, set_conditional_headers
 
 
 class EmployerProfileView(APIView):
@@ -112,6 +114,13 @@ class UsernameBasedEmployerProfileView(APIView):
         if not target_user:
             return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
         
+        # The body depends on who asks (can_edit) and the username used
+        etag = employer_profile_etag(target_user, request.user.id, username)
+        if etag:
+            not_modified = not_modified_response(request, etag, cache_control=private_cache_control())
+            if not_modified is not None:
+                return not_modified
+        
         try:
             employer_profile = EmployerProfile.objects.get(user=target_user)
             serializer = EmployerProfileSerializer(employer_profile)
@@ -121,7 +130,8 @@ class UsernameBasedEmployerProfileView(APIView):
             profile_data['username'] = username
             profile_data['can_edit'] = target_user == request.user
             
-            return Response(profile_data)
+            response = Response(profile_data)
+            return set_conditional_headers(response, etag, cache_control=private_cache_control()) if etag else response
         except EmployerProfile.DoesNotExist:
             # Return basic user info even if no profile exists
             return Response({
@@ -2,17 +2,21 @@
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.views import APIView
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
-from django.db.models import Q, Count, F, Avg
+from django.db.models import Q, Count, Avg
 from django.db import IntegrityError
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.shortcuts import get_object_or_404
 from datetime import datetime, timedelta
 import re
 import json
+import base64
 import logging
 
 # Initialize logger
@@ -22,7 +26,8 @@ from .models import (
     EmployerProfile, Job, JobApplication, Candidate, Interviewer, 
     Interview, InterviewNote, InterviewTimeSlot, ProxyScanSession, 
     ProxyDetectionRule, ProxyAlert, InterviewFeedback, FeedbackTemplate, 
-    FeedbackReminder, Notification, Message, EmployerSettings
+    FeedbackReminder, Notification, Message, EmployerSettings,
+    SavedCandidateSearch, SavedCandidateSearchMatch
 )
 # Import username-based profile views
 from .username_profile_views import (
@@ -37,6 +42,7 @@ from .serializers import (
     EmployerProfileSerializer, 
     JobSerializer, 
     JobListSerializer,
+    PublicJobListSerializer,
     JobApplicationSerializer,
     CandidateSerializer,
     InterviewerSerializer,
@@ -58,14 +64,33 @@ from .serializers import (
     ProxyScanRequestSerializer,
     EmployerSettingsSerializer,
     EmployerSettingsUpdateSerializer,
-    ProxyStatisticsSerializer
+    ProxyStatisticsSerializer,
+    SavedCandidateSearchSerializer,
+    SavedCandidateSearchMatchSerializer
 )
 # Import from employee_dashboard for candidate search
-from employee_dashboard.models import CandidateSearchProfile
+from employee_dashboard.models import CandidateSearchProfile, CandidateSearchDocument
 from employee_dashboard.serializers import (
     CandidateSearchProfileSerializer,
     BooleanSearchRequestSerializer
 )
+from shared_services.boolean_query import BooleanQueryError
+from shared_services.counters import increment, pending_total
+from shared_services.http_cache import (
+    latest, not_modified_response, public_cache_control, set_conditional_headers, weak_etag,
+)
+from .job_search_service import (
+    apply_public_job_filters, get_public_job_facets, public_job_list_projection, public_jobs,
+)
+from .job_expiry import reactivate_jobs
+from .job_analytics import MAX_RANGE_DAYS, job_view_analytics, record_job_view
+from .public_job_cache import (
+    CachedPublicListMixin, cache_response, get_cached_response, invalidate_public_jobs,
+)
+from .candidate_search_service import (
+    CandidateSearch, InvalidCursor, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, RESULT_ORDERING,
+    after_cursor, approximate_count, decode_cursor, encode_cursor
+)
 # Import username-based profile views
 from .username_profile_views import (
     EmployerProfileView, UsernameBasedEmployerProfileView, 
@@ -541,8 +566,9 @@ def get_messages(request):
         }, status=500)
 
 
-class CompaniesListView(generics.ListAPIView):
+class CompaniesListView(CachedPublicListMixin, generics.ListAPIView):
     """List all companies (employer profiles) - public endpoint"""
+    cache_scope = 'companies'
     queryset = EmployerProfile.objects.filter(is_verified=True)
     serializer_class = EmployerProfileSerializer
     permission_classes = []  # Public endpoint
@@ -1333,90 +1359,213 @@ class JobApplicationDetailView(generics.RetrieveUpdateAPIView):
             return JobApplication.objects.none()
 
 
+class PublicJobCursorPagination(CursorPagination):
+    """
+    Keyset pagination over (created_at, id): pages are fetched with an
+    indexed range condition instead of COUNT(*) and OFFSET, so every page
+    costs the same however deep it is
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+    
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get('sort_by') == 'created_at':
+            return ('created_at', 'id')
+        return self.ordering
+
+
+class RecentJobsPagination(PublicJobCursorPagination):
+    page_size = 10
+
+
+class PublicJobRelevancePagination(BasePagination):
+    """
+    Keyset pagination of search results over (search_rank, created_at, id),
+    best match first. The cursor holds the last row's key, so a page is a
+    ``WHERE ... ORDER BY ... LIMIT`` at any depth; it only moves forward
+    (follow ``next``) and does not count the total.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            rank, created_at, job_id = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(search_rank__lt=rank) |
+                Q(search_rank=rank, created_at__lt=created_at) |
+                Q(search_rank=rank, created_at=created_at, id__lt=job_id)
+            )
+        
+        rows = list(queryset.order_by('-search_rank', '-created_at', '-id')[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+    
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+    
+    def encode_cursor(self, job):
+        key = [job.search_rank, job.created_at.isoformat(), job.id]
+        return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip('=')
+    
+    def decode_cursor(self, cursor):
+        try:
+            rank, created_at, job_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            created_at = parse_datetime(created_at)
+            if created_at is None:
+                raise ValueError('invalid created_at')
+            return float(rank), created_at, int(job_id)
+        except (TypeError, ValueError, UnicodeDecodeError):
+            raise NotFound('Invalid cursor')
+    
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': None,
+            'results': data,
+        })
+
+
 # Public Job Views for Employees
-class PublicJobListView(generics.ListAPIView):
-    """Public endpoint for employees to view active jobs"""
-    serializer_class = JobListSerializer
+class PublicJobListView(CachedPublicListMixin, generics.ListAPIView):
+    """
+    Public endpoint for employees to view active jobs.
+    
+    Date-ordered lists and searches ordered by relevance (the default when
+    ``search`` is given) are cursor paginated: follow ``next``. Salary and
+    title orderings keep page numbers.
+    """
+    serializer_class = PublicJobListSerializer
     permission_classes = [AllowAny]
+    cache_scope = 'job_list'
+    
+    def get_sort_by(self):
+        """Requested ordering; searches default to relevance"""
+        search = self.request.query_params.get('search', None)
+        sort_by = self.request.query_params.get('sort_by', 'relevance' if search else '-created_at')
+        if sort_by == 'relevance' and not search:
+            return '-created_at'
+        if sort_by not in ['relevance', 'created_at', '-created_at', 'salary_min', '-salary_min', 'title', '-title']:
+            return '-created_at'
+        return sort_by
+    
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            sort_by = self.get_sort_by()
+            if sort_by in ['created_at', '-created_at']:
+                self._paginator = PublicJobCursorPagination()
+            elif sort_by == 'relevance':
+                self._paginator = PublicJobRelevancePagination()
+            else:
+                self._paginator = PageNumberPagination()
+        return self._paginator
     
     def get_queryset(self):
         """Get all active jobs with filters"""
-        queryset = Job.objects.filter(
-            status='active',
-            application_deadline__gte=timezone.now().date()
-        ).select_related('employer')
-        
-        # Search by title, description, or skills
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(skills__icontains=search) |
-                Q(employer__company_name__icontains=search)
-            )
-        
-        # Filter by location
-        location = self.request.query_params.get('location', None)
-        if location:
-            queryset = queryset.filter(location__icontains=location)
-        
-        # Filter by job type
-        job_type = self.request.query_params.get('job_type', None)
-        if job_type:
-            queryset = queryset.filter(job_type__icontains=job_type)
+        queryset = public_job_list_projection(public_jobs())
         
-        # Filter by employment type
-        employment_type = self.request.query_params.get('employment_type', None)
-        if employment_type:
-            queryset = queryset.filter(employment_type__icontains=employment_type)
+        # Search, location, type, industry, experience and salary filters
+        queryset = apply_public_job_filters(queryset, self.request.query_params)
         
-        # Filter by industry
-        industry = self.request.query_params.get('industry', None)
-        if industry:
-            queryset = queryset.filter(industry__icontains=industry)
-        
-        # Filter by experience
-        exp_min = self.request.query_params.get('exp_min', None)
-        exp_max = self.request.query_params.get('exp_max', None)
-        if exp_min:
-            queryset = queryset.filter(experience_min__gte=int(exp_min))
-        if exp_max:
-            queryset = queryset.filter(experience_max__lte=int(exp_max))
-        
-        # Filter by salary
-        salary_min = self.request.query_params.get('salary_min', None)
-        if salary_min:
-            queryset = queryset.filter(salary_min__gte=float(salary_min))
-        
-        # Sort options
-        sort_by = self.request.query_params.get('sort_by', '-created_at')
-        if sort_by in ['created_at', '-created_at', 'salary_min', '-salary_min', 'title', '-title']:
-            queryset = queryset.order_by(sort_by)
+        # Date and relevance orderings are applied by the cursor paginators
+        sort_by = self.get_sort_by()
+        if sort_by in ['salary_min', '-salary_min', 'title', '-title']:
+            queryset = queryset.order_by(sort_by, '-id')
         
         return queryset
 
 
+class PublicJobFacetsView(APIView):
+    """
+    Public endpoint with job counts per location, job type, employment type,
+    industry, experience and salary bucket. Takes the same query parameters
+    as PublicJobListView; each facet is counted under every other filter.
+    """
+    permission_classes = [AllowAny]
+    
+    def get(self, request):
+        try:
+            filters, facets = get_public_job_facets(request.query_params)
+        except ValueError:
+            return Response({
+                'error': 'exp_min, exp_max and salary_min must be numbers'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'filters': filters,
+            'facets': facets
+        })
+
+
+def public_job_detail_response(request, **lookup):
+    """
+    Detail of the active job matching ``lookup``, or None if there is none.
+    
+    The view is counted first. Clients holding the current version get a
+    304 before anything is loaded; otherwise the detail comes from the
+    response cache or is serialized and cached.
+    """
+    row = Job.objects.filter(status='active', **lookup).values_list(
+        'id', 'updated_at', 'employer__updated_at'
+    ).first()
+    if row is None:
+        return None
+    job_id, job_updated_at, employer_updated_at = row
+    etag = weak_etag('job', job_id, job_updated_at, employer_updated_at)
+    last_modified = latest(job_updated_at, employer_updated_at)
+    cache_control = public_cache_control()
+    
+    # Increment view count
+    increment('job_views', job_id)
+    record_job_view(request, job_id)
+    
+    response = not_modified_response(request, etag, last_modified, cache_control)
+    if response is not None:
+        return response
+    
+    data = get_cached_response(request, 'job_detail')
+    if data is not None:
+        response = Response(data, headers={'X-Cache': 'HIT'})
+    else:
+        job = Job.objects.select_related('employer').filter(pk=job_id).first()
+        if job is None:
+            return None
+        data = JobSerializer(job).data
+        cache_response(request, 'job_detail', data)
+        response = Response(data, headers={'X-Cache': 'MISS'})
+    return set_conditional_headers(response, etag, last_modified, cache_control)
+
+
 class PublicJobDetailView(APIView):
     """Public endpoint to view job details and increment view count"""
     permission_classes = [AllowAny]
     
     def get(self, request, pk):
-        try:
-            job = Job.objects.select_related('employer').get(
-                pk=pk,
-                status='active'
-            )
-            
-            # Increment view count
-            job.increment_views()
-            
-            serializer = JobSerializer(job)
-            return Response(serializer.data)
-        except Job.DoesNotExist:
+        response = public_job_detail_response(request, pk=pk)
+        if response is None:
             return Response({
                 'error': 'Job not found or no longer active'
             }, status=status.HTTP_404_NOT_FOUND)
+        return response
 
 
 class PublicJobDetailByIdView(APIView):
@@ -1444,22 +1593,14 @@ class PublicJobDetailByIdView(APIView):
                 }, status=status.HTTP_400_BAD_REQUEST)
             
             # Get the job by ID
-            try:
-                job = Job.objects.select_related('employer').get(
-                    pk=job_id,
-                    status='active'
-                )
-            except Job.DoesNotExist:
+            response = public_job_detail_response(request, pk=job_id)
+            if response is None:
                 return Response({
                     'error': 'Job not found',
                     'details': f'No active job found with ID: {job_id}'
                 }, status=status.HTTP_404_NOT_FOUND)
             
-            # Increment view count
-            job.increment_views()
-            
-            serializer = JobSerializer(job)
-            return Response(serializer.data)
+            return response
             
         except Exception as e:
             return Response({
@@ -1475,24 +1616,19 @@ class PublicJobDetailBySlugView(APIView):
     def get(self, request, company_slug, title_slug, job_number):
         try:
             # Get the job by slug components
-            try:
-                job = Job.objects.select_related('employer').get(
-                    company_slug=company_slug,
-                    title_slug=title_slug,
-                    job_number=job_number,
-                    status='active'
-                )
-            except Job.DoesNotExist:
+            response = public_job_detail_response(
+                request,
+                company_slug=company_slug,
+                title_slug=title_slug,
+                job_number=job_number
+            )
+            if response is None:
                 return Response({
                     'error': 'Job not found',
                     'details': f'No active job found at: jobs/{company_slug}/{title_slug}/{job_number}'
                 }, status=status.HTTP_404_NOT_FOUND)
             
-            # Increment view count
-            job.increment_views()
-            
-            serializer = JobSerializer(job)
-            return Response(serializer.data)
+            return response
             
         except Exception as e:
             logger.error(f"Error retrieving job by slug: {str(e)}", exc_info=True)
@@ -1512,6 +1648,7 @@ class JobStatsView(APIView):
             
             jobs = Job.objects.filter(employer=employer_profile)
             
+            job_ids = list(jobs.values_list('id', flat=True))
             stats = {
                 'total_jobs': jobs.count(),
                 'active_jobs': jobs.filter(status='active').count(),
@@ -1525,7 +1662,7 @@ class JobStatsView(APIView):
                     job__employer=employer_profile,
                     status='pending'
                 ).count(),
-                'total_views': sum(job.views_count for job in jobs),
+                'total_views': sum(job.views_count for job in jobs) + pending_total('job_views', job_ids),
             }
             
             return Response(stats)
@@ -1535,16 +1672,34 @@ class JobStatsView(APIView):
             }, status=status.HTTP_404_NOT_FOUND)
 
 
-class RecentJobsView(generics.ListAPIView):
-    """Get recently posted jobs - public endpoint"""
-    serializer_class = JobListSerializer
+class JobViewAnalyticsView(APIView):
+    """Daily views, unique viewers and referrers of one of the employer's jobs"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, pk):
+        employer_profile = get_object_or_404(EmployerProfile, user=request.user)
+        job = get_object_or_404(Job, pk=pk, employer=employer_profile)
+        
+        try:
+            days = int(request.query_params.get('days', 7))
+        except ValueError:
+            return Response({
+                'error': 'days must be a number'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        days = min(max(days, 1), MAX_RANGE_DAYS)
+        
+        return Response(job_view_analytics(job, days))
+
+
+class RecentJobsView(CachedPublicListMixin, generics.ListAPIView):
+    """Get recently posted jobs, 10 per page - public endpoint"""
+    serializer_class = PublicJobListSerializer
     permission_classes = [AllowAny]
+    cache_scope = 'recent_jobs'
+    pagination_class = RecentJobsPagination
     
     def get_queryset(self):
-        return Job.objects.filter(
-            status='active',
-            application_deadline__gte=timezone.now().date()
-        ).select_related('employer').order_by('-created_at')[:10]
+        return public_job_list_projection(public_jobs())
 
 
 class JobBulkActionView(APIView):
@@ -1596,6 +1751,7 @@ class JobBulkActionView(APIView):
             # Perform action
             if action == 'close':
                 jobs.update(status='closed')
+                invalidate_public_jobs()
                 print(f"Successfully closed {found_job_count} jobs")
             elif action == 'delete':
                 count = jobs.count()
@@ -1606,9 +1762,11 @@ class JobBulkActionView(APIView):
                 })
             elif action == 'activate':
                 jobs.update(status='active')
+                invalidate_public_jobs()
                 print(f"Successfully activated {found_job_count} jobs")
             elif action == 'draft':
                 jobs.update(status='draft')
+                invalidate_public_jobs()
                 print(f"Successfully set {found_job_count} jobs to draft")
             else:
                 return Response({
@@ -1720,8 +1878,8 @@ class ActiveJobsView(generics.ListAPIView):
         
         # Add summary statistics
         total_active = queryset.count()
-        total_applications = sum(job.applications_count for job in queryset)
-        total_views = sum(job.views_count for job in queryset)
+        total_applications = sum(job['applications_count'] for job in serializer.data)
+        total_views = sum(job['views_count'] for job in serializer.data)
         
         return Response({
             'jobs': serializer.data,
@@ -1742,14 +1900,10 @@ class ExpiredJobsView(generics.ListAPIView):
         try:
             employer_profile = EmployerProfile.objects.get(user=self.request.user)
             
-            # Get jobs that are either marked as expired OR have passed deadline
-            today = timezone.now().date()
-            
+            # Jobs past their deadline are marked expired by the expiry sweep
             queryset = Job.objects.filter(
-                employer=employer_profile
-            ).filter(
-                Q(status='expired') |
-                Q(application_deadline__lt=today, status='active')
+                employer=employer_profile,
+                status='expired'
             ).select_related('employer').order_by('-created_at')
             
             # Search functionality
@@ -1771,8 +1925,8 @@ class ExpiredJobsView(generics.ListAPIView):
         
         # Add summary statistics - handle None values safely
         total_expired = queryset.count()
-        total_applications = sum(job.applications_count or 0 for job in queryset)
-        total_views = sum(job.views_count or 0 for job in queryset)
+        total_applications = sum(job['applications_count'] or 0 for job in serializer.data)
+        total_views = sum(job['views_count'] or 0 for job in serializer.data)
         
         return Response({
             'jobs': serializer.data,
@@ -1858,18 +2012,11 @@ class ExpiredJobsBulkActionView(APIView):
         
         # Perform action
         if action == 'reactivate':
-            # Reactivate and extend deadline
-            today = timezone.now().date()
-            from datetime import timedelta
-            
-            for job in jobs:
-                job.status = 'active'
-                if job.application_deadline and job.application_deadline < today:
-                    job.application_deadline = today + timedelta(days=30)
-                job.save()
+            # Reactivate and extend passed deadlines
+            count = reactivate_jobs(jobs)
             
             return Response({
-                'message': f'{jobs.count()} jobs reactivated successfully'
+                'message': f'{count} jobs reactivated successfully'
             })
         elif action == 'delete':
             count = jobs.count()
@@ -1879,6 +2026,7 @@ class ExpiredJobsBulkActionView(APIView):
             })
         elif action == 'archive':
             jobs.update(status='closed')
+            invalidate_public_jobs()
             return Response({
                 'message': f'{jobs.count()} jobs archived successfully'
             })
@@ -1921,8 +2069,8 @@ class ClosedJobsView(generics.ListAPIView):
         
         # Add summary statistics - handle None values safely
         total_closed = queryset.count()
-        total_applications = sum(job.applications_count or 0 for job in queryset)
-        total_views = sum(job.views_count or 0 for job in queryset)
+        total_applications = sum(job['applications_count'] or 0 for job in serializer.data)
+        total_views = sum(job['views_count'] or 0 for job in serializer.data)
         
         return Response({
             'jobs': serializer.data,
@@ -1975,18 +2123,11 @@ class ClosedJobsBulkActionView(APIView):
         
         # Perform action
         if action == 'reactivate':
-            # Reactivate and extend deadline if needed
-            today = timezone.now().date()
-            from datetime import timedelta
-            
-            for job in jobs:
-                job.status = 'active'
-                if job.application_deadline and job.application_deadline < today:
-                    job.application_deadline = today + timedelta(days=30)
-                job.save()
+            # Reactivate and extend passed deadlines
+            count = reactivate_jobs(jobs)
             
             return Response({
-                'message': f'{jobs.count()} jobs reactivated successfully'
+                'message': f'{count} jobs reactivated successfully'
             })
         elif action == 'delete':
             count = jobs.count()
@@ -2020,8 +2161,13 @@ class BooleanCandidateSearchView(APIView):
             "experience": "3-5 years",
             "notice_period": "30 Days",
             "salary_range": "10-15 LPA",
-            "actively_looking": true
+            "actively_looking": true,
+            "page_size": 50,
+            "cursor": "<next_cursor of the previous page>",
+            "include_total": true
         }
+        Results are ordered by (score, last_active, id); total_count is
+        exact up to 1000 matches and estimated beyond.
         """
         try:
             employer_profile = EmployerProfile.objects.get(user=request.user)
@@ -2040,85 +2186,67 @@ class BooleanCandidateSearchView(APIView):
         
         validated_data = serializer.validated_data
         
-        # Start with all searchable candidates
-        queryset = CandidateSearchProfile.objects.filter(
-            is_searchable=True
-        ).select_related('employee__user').prefetch_related(
-            'projects',
-            'achievement_details',
-            'employee__education',
-            'employee__experience',
-            'employee__skills'
-        )
-        
-        # Apply filters
-        
-        # Location filter
-        location = validated_data.get('location')
-        if location:
-            queryset = queryset.filter(
-                Q(employee__location__icontains=location) |
-                Q(preferred_location__icontains=location)
-            )
-        
-        # Department filter
-        department = validated_data.get('department')
-        if department:
-            queryset = queryset.filter(department__iexact=department)
+        try:
+            search = CandidateSearch(validated_data)
+        except BooleanQueryError as e:
+            return Response({
+                'error': 'Invalid search query',
+                'details': {'query': [str(e)]}
+            }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Designation filter
-        designation = validated_data.get('designation')
-        if designation:
-            queryset = queryset.filter(
-                Q(employee__current_designation__icontains=designation) |
-                Q(employee__current_position__icontains=designation)
-            )
+        # Pagination options live beside the search criteria in the body
+        try:
+            page_size = min(max(int(request.data.get('page_size', DEFAULT_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        except (TypeError, ValueError):
+            page_size = DEFAULT_PAGE_SIZE
+        cursor = request.data.get('cursor')
+        include_total = str(request.data.get('include_total', True)).lower() not in ('false', '0')
+        
+        scored_at = timezone.now()
+        cursor_key = None
+        if cursor:
+            try:
+                *cursor_key, scored_at = decode_cursor(str(cursor))
+            except InvalidCursor as e:
+                return Response({
+                    'error': 'Validation failed',
+                    'details': {'cursor': [str(e)]}
+                }, status=status.HTTP_400_BAD_REQUEST)
         
-        # Experience filter
-        experience = validated_data.get('experience')
-        if experience:
-            exp_min, exp_max = self._parse_experience_range(experience)
-            if exp_min is not None:
-                queryset = queryset.filter(employee__experience_years__gte=exp_min)
-            if exp_max is not None:
-                queryset = queryset.filter(employee__experience_years__lte=exp_max)
-        
-        # Notice period filter
-        notice_period = validated_data.get('notice_period')
-        if notice_period:
-            queryset = queryset.filter(notice_period__icontains=notice_period)
-        
-        # Salary range filter
-        salary_range = validated_data.get('salary_range')
-        if salary_range:
-            sal_min, sal_max = self._parse_salary_range(salary_range)
-            if sal_min is not None:
-                queryset = queryset.filter(
-                    Q(expected_ctc__gte=sal_min) | Q(expected_ctc__isnull=True)
-                )
-            if sal_max is not None:
-                queryset = queryset.filter(
-                    Q(expected_ctc__lte=sal_max) | Q(expected_ctc__isnull=True)
-                )
+        # Filter and rank the denormalized search documents; no joins until
+        # the page of results is loaded
+        queryset = search.filter(CandidateSearchDocument.objects.all())
         
-        # Actively looking filter
-        actively_looking = validated_data.get('actively_looking', False)
-        if actively_looking:
-            queryset = queryset.filter(actively_looking=True)
+        total_count = total_is_approximate = None
+        if include_total:
+            total_count, total_is_approximate = approximate_count(queryset)
         
-        # Boolean query filter (if provided)
-        query = validated_data.get('query', '').strip()
-        if query:
-            queryset = self._apply_boolean_query(queryset, query)
+        # Calculate match scores in the query; nothing is written back
+        queryset = search.annotate_match_scores(queryset, now=scored_at)
         
-        # Calculate match scores
-        queryset = self._calculate_match_scores(queryset, validated_data)
+        # Keyset pagination: continue after the last row of the previous page
+        if cursor_key:
+            queryset = after_cursor(queryset, *cursor_key)
+        queryset = queryset.order_by(*RESULT_ORDERING)
         
-        # Order by match score
-        queryset = queryset.order_by('-match_score', '-last_active')
+        rows = list(queryset.values_list('search_match_score', 'last_active', 'profile_id')[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = encode_cursor(*rows[-1], scored_at) if has_more else None
         
-        # Serialize results
-        candidates = list(queryset[:50])  # Limit to 50 results
+        # Load the full profiles for this page of results only
+        scores = {profile_id: score for score, _, profile_id in rows}
+        profiles = CandidateSearchProfile.objects.filter(id__in=scores).select_related('employee__user').prefetch_related(
+            'projects',
+            'achievement_details',
+            'employee__education',
+            'employee__experience',
+            'employee__skills'
+        ).in_bulk()
+        candidates = [profiles[profile_id] for profile_id in scores if profile_id in profiles]
+        for candidate in candidates:
+            # Per-request score; the stored match_score column is left untouched
+            candidate.match_score = scores[candidate.id]
         serializer = CandidateSearchProfileSerializer(
             candidates, 
             many=True, 
@@ -2127,138 +2255,82 @@ class BooleanCandidateSearchView(APIView):
         
         return Response({
             'candidates': serializer.data,
-            'total_count': len(candidates),
+            'total_count': total_count,
+            'total_is_approximate': total_is_approximate,
+            'next_cursor': next_cursor,
+            'has_more': has_more,
             'search_criteria': validated_data
         })
-    
-    def _parse_experience_range(self, experience_str):
-        """Parse experience range string to min and max years"""
-        if '0-1' in experience_str:
-            return 0, 1
-        elif '1-3' in experience_str:
-            return 1, 3
-        elif '3-5' in experience_str:
-            return 3, 5
-        elif '5+' in experience_str:
-            return 5, None
-        return None, None
-    
-    def _parse_salary_range(self, salary_str):
-        """Parse salary range string to min and max in lakhs"""
-        if '0-3' in salary_str:
-            return 0, 300000
-        elif '3-6' in salary_str:
-            return 300000, 600000
-        elif '6-10' in salary_str:
-            return 600000, 1000000
-        elif '10-15' in salary_str:
-            return 1000000, 1500000
-        elif '15+' in salary_str:
-            return 1500000, None
-        return None, None
-    
-    def _apply_boolean_query(self, queryset, query):
-        """Apply boolean search query to the queryset"""
-        # Parse boolean query (simplified version)
-        # Supports: AND, OR, NOT
-        
-        # Replace operators with Python operators
-        query = query.replace(' AND ', ' & ')
-        query = query.replace(' OR ', ' | ')
-        query = query.replace(' NOT ', ' -')
-        
-        # Split into terms
-        terms = re.findall(r'[&|]?\s*-?\s*"[^"]+"|[&|]?\s*-?\s*\S+', query)
-        
-        q_objects = Q()
-        current_op = '&'  # Default to AND
-        
-        for term in terms:
-            term = term.strip()
-            
-            # Determine operator
-            if term.startswith('&'):
-                current_op = '&'
-                term = term[1:].strip()
-            elif term.startswith('|'):
-                current_op = '|'
-                term = term[1:].strip()
-            
-            # Check for NOT
-            is_not = term.startswith('-')
-            if is_not:
-                term = term[1:].strip()
-            
-            # Remove quotes
-            term = term.strip('"')
-            
-            if not term:
-                continue
-            
-            # Build Q object for this term
-            term_q = (
-                Q(key_skills__icontains=term) |
-                Q(employee__current_designation__icontains=term) |
-                Q(employee__current_position__icontains=term) |
-                Q(department__icontains=term) |
-                Q(industry__icontains=term) |
-                Q(employee__skills__name__icontains=term)
-            )
-            
-            if is_not:
-                term_q = ~term_q
-            
-            # Combine with previous Q objects
-            if not q_objects:
-                q_objects = term_q
-            elif current_op == '&':
-                q_objects = q_objects & term_q
-            else:  # OR
-                q_objects = q_objects | term_q
-        
-        if q_objects:
-            queryset = queryset.filter(q_objects).distinct()
-        
-        return queryset
-    
-    def _calculate_match_scores(self, queryset, criteria):
-        """Calculate match scores for candidates based on criteria"""
-        # This is a simplified scoring system
-        # In production, you'd want a more sophisticated algorithm
-        
-        for candidate in queryset:
-            score = 70  # Base score
-            
-            # Location match
-            if criteria.get('location'):
-                if criteria['location'].lower() in candidate.employee.location.lower():
-                    score += 10
-                elif criteria['location'].lower() in candidate.preferred_location.lower():
-                    score += 5
-            
-            # Department exact match
-            if criteria.get('department'):
-                if candidate.department.lower() == criteria['department'].lower():
-                    score += 10
-            
-            # Actively looking bonus
-            if candidate.actively_looking:
-                score += 5
-            
-            # Recent activity bonus
-            if candidate.last_active:
-                days_since_active = (timezone.now() - candidate.last_active).days
-                if days_since_active < 7:
-                    score += 5
-                elif days_since_active < 30:
-                    score += 2
-            
-            # Cap score at 100
-            candidate.match_score = min(score, 100)
-            candidate.save(update_fields=['match_score'])
-        
+
+
+class SavedCandidateSearchListCreateView(generics.ListCreateAPIView):
+    """List and create saved boolean candidate searches"""
+    serializer_class = SavedCandidateSearchSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        try:
+            employer_profile = EmployerProfile.objects.get(user=self.request.user)
+        except EmployerProfile.DoesNotExist:
+            return SavedCandidateSearch.objects.none()
+        return SavedCandidateSearch.objects.filter(employer=employer_profile).annotate(
+            unseen_count=Count('matches', filter=Q(matches__is_seen=False))
+        ).order_by('-created_at')
+
+    def perform_create(self, serializer):
+        employer_profile = get_object_or_404(EmployerProfile, user=self.request.user)
+        serializer.save(employer=employer_profile)
+
+
+class SavedCandidateSearchDetailView(generics.RetrieveUpdateDestroyAPIView):
+    """Retrieve, update, or delete a saved candidate search"""
+    serializer_class = SavedCandidateSearchSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return SavedCandidateSearch.objects.filter(employer__user=self.request.user).annotate(
+            unseen_count=Count('matches', filter=Q(matches__is_seen=False))
+        )
+
+
+class SavedCandidateSearchMatchesView(generics.ListAPIView):
+    """
+    Inbox of candidates that started matching a saved search since it was saved.
+    GET ?unseen=true lists only new matches; POST marks matches as seen
+    (body: {"ids": [...]}, or all matches when omitted).
+    """
+    serializer_class = SavedCandidateSearchMatchSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_search(self):
+        return get_object_or_404(SavedCandidateSearch, pk=self.kwargs['pk'], employer__user=self.request.user)
+
+    def get_queryset(self):
+        queryset = SavedCandidateSearchMatch.objects.filter(search=self.get_search()).select_related(
+            'candidate__employee__user'
+        ).prefetch_related(
+            'candidate__projects',
+            'candidate__achievement_details',
+            'candidate__employee__education',
+            'candidate__employee__experience',
+            'candidate__employee__skills'
+        )
+        if self.request.query_params.get('unseen', '').lower() == 'true':
+            queryset = queryset.filter(is_seen=False)
         return queryset
 
+    def post(self, request, pk):
+        matches = SavedCandidateSearchMatch.objects.filter(search=self.get_search(), is_seen=False)
+        ids = request.data.get('ids')
+        if ids is not None:
+            try:
+                ids = serializers.ListField(child=serializers.IntegerField()).run_validation(ids)
+            except ValidationError:
+                return Response({'error': 'ids must be a list of integers'}, status=status.HTTP_400_BAD_REQUEST)
+            matches = matches.filter(id__in=ids)
+        updated = matches.update(is_seen=True)
+        return Response({'marked_seen': updated})
+
 
 class JobViewCountUpdateView(APIView):
     """Update view count for a specific job"""
@@ -2269,8 +2341,7 @@ class JobViewCountUpdateView(APIView):
             employer_profile = EmployerProfile.objects.get(user=request.user)
             job = Job.objects.get(pk=pk, employer=employer_profile)
 
-            job.views_count = F('views_count') + 1
-            job.save(update_fields=['views_count'])
+            job.increment_views()
 
             return Response({
                 'message': 'View count updated successfully',
@@ -2982,6 +3053,13 @@ class InterviewFeedbackListCreateView(generics.ListCreateAPIView):
             serializer.save(employer=employer_profile)
         except EmployerProfile.DoesNotExist:
             raise ValidationError("Employer profile not found")
+        
+        # Count the template the form was filled from, if any
+        template_id = self.request.data.get('template_id')
+        if template_id:
+            template = FeedbackTemplate.objects.filter(id=template_id, employer=employer_profile).first()
+            if template:
+                template.increment_usage()
 
 
 class InterviewFeedbackDetailView(generics.RetrieveUpdateDestroyAPIView):
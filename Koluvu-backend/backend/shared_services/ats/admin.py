@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import ATSProfile, ATSAnalysis, ATSKeywordLibrary, ATSSettings
+from .models import (
+    ATSProfile, ATSAnalysis, ATSKeywordLibrary, ATSSettings, ExtractedDocument,
+    CanonicalSkill, SkillAlias, UnresolvedSkill
+)
 
 
 @admin.register(ATSProfile)
@@ -25,6 +28,34 @@ class ATSKeywordLibraryAdmin(admin.ModelAdmin):
     search_fields = ['industry', 'role_category']
 
 
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(CanonicalSkill)
+class CanonicalSkillAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'category', 'created_at']
+    list_filter = ['category']
+    search_fields = ['name', 'aliases__alias']
+    inlines = [SkillAliasInline]
+
+
+@admin.register(UnresolvedSkill)
+class UnresolvedSkillAdmin(admin.ModelAdmin):
+    list_display = ['name', 'occurrences', 'first_seen_at', 'last_seen_at']
+    search_fields = ['name']
+    readonly_fields = ['first_seen_at', 'last_seen_at']
+
+
+@admin.register(ExtractedDocument)
+class ExtractedDocumentAdmin(admin.ModelAdmin):
+    list_display = ['sha256', 'file_type', 'size_bytes', 'hit_count', 'last_used_at']
+    list_filter = ['file_type']
+    search_fields = ['sha256']
+    readonly_fields = ['created_at', 'last_used_at', 'hit_count']
+
+
 @admin.register(ATSSettings)
 class ATSSettingsAdmin(admin.ModelAdmin):
     list_display = ['minimum_score_threshold', 'max_analyses_per_day', 'model_version']
@@ -0,0 +1,271 @@
+"""
+Throughput benchmark for the ATS pipeline.
+
+Generates a reproducible synthetic corpus of resumes (as TXT, PDF and DOCX)
+and jobs, then times each stage of the pipeline: document extraction,
+``analyze_document`` and ``match_resume_to_job``. Every stage reports
+documents per second, p50/p99 latency and peak Python memory, and a run
+can be saved as a baseline and compared against later runs.
+
+Nothing here needs network access; jobs are unsaved model instances, so
+matching does not touch the database either.
+"""
+import io
+import itertools
+import json
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from django.apps import apps
+
+SKILLS = [
+    'python', 'javascript', 'typescript', 'react', 'django', 'flask', 'sql', 'postgresql',
+    'aws', 'azure', 'docker', 'kubernetes', 'git', 'agile', 'scrum', 'rest', 'graphql',
+    'microservices', 'machine learning', 'data analysis', 'project management', 'java',
+    'spring boot', 'node.js', 'redis', 'kafka', 'terraform', 'ci/cd', 'linux', 'pandas',
+    'tensorflow', 'pytorch', 'tableau', 'excel', 'salesforce', 'figma', 'go', 'rust',
+]
+SOFT_SKILLS = ['leadership', 'communication', 'teamwork', 'problem solving', 'analytical thinking']
+TITLES = [
+    'Backend Developer', 'Frontend Engineer', 'Data Analyst', 'DevOps Engineer',
+    'Machine Learning Engineer', 'Product Manager', 'Full Stack Developer', 'QA Engineer',
+]
+FILLER = [
+    'Delivered features used by thousands of customers across several regions.',
+    'Worked closely with design and product teams to ship on schedule.',
+    'Reduced infrastructure cost by consolidating legacy services.',
+    'Mentored junior engineers and ran weekly code reviews.',
+    'Improved test coverage and introduced automated release checks.',
+    'Owned the on-call rotation and wrote runbooks for common incidents.',
+]
+SECTIONS = ['Experience', 'Skills', 'Education', 'Projects', 'Certifications', 'Achievements']
+
+
+def generate_resume(rng: random.Random, index: int, paragraphs: int = 12) -> str:
+    """A synthetic resume whose length and skill mix vary with the seed"""
+    skills = rng.sample(SKILLS, rng.randint(4, 12)) + rng.sample(SOFT_SKILLS, rng.randint(1, 3))
+    lines = [f'Candidate {index}', rng.choice(TITLES), '']
+    for section in SECTIONS:
+        lines.append(section)
+        if section == 'Skills':
+            lines.append(', '.join(skills))
+            continue
+        for _ in range(rng.randint(1, max(paragraphs // len(SECTIONS), 1) + 1)):
+            lines.append(f'{rng.choice(FILLER)} Used {rng.choice(skills)} and {rng.choice(skills)} daily.')
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def generate_job(rng: random.Random, index: int):
+    """An unsaved Job with varied skills/requirements JSON"""
+    Job = apps.get_model('employer_dashboard', 'Job')
+    skills = rng.sample(SKILLS, rng.randint(3, 10))
+    requirements = [
+        f'{rng.randint(1, 8)}+ years of experience with {skill}'
+        for skill in rng.sample(SKILLS, rng.randint(2, 6))
+    ] + [f'Strong {skill} skills' for skill in rng.sample(SOFT_SKILLS, rng.randint(1, 2))]
+    return Job(
+        id=index,
+        title=rng.choice(TITLES),
+        description=' '.join(rng.sample(FILLER, 3)),
+        skills=skills,
+        requirements=requirements,
+        ats_keywords=', '.join(rng.sample(SKILLS, rng.randint(0, 5))),
+    )
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(text: str, lines_per_page: int = 45) -> bytes:
+    """Render plain text into a minimal multi-page PDF using a base font"""
+    lines = text.encode('latin-1', errors='replace').decode('latin-1').splitlines() or ['']
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)]
+
+    # Object 1: catalog, 2: page tree, 3: font, then a page and content stream per page
+    objects = [b'', b'', b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for page_lines in pages:
+        content = ['BT /F1 10 Tf 14 TL 50 750 Td']
+        content.extend(f'({_pdf_escape(line)}) Tj T*' for line in page_lines)
+        content.append('ET')
+        stream = '\n'.join(content).encode('latin-1')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % content_id
+        )
+        page_ids.append(len(objects))
+
+    objects[0] = b'<< /Type /Catalog /Pages 2 0 R >>'
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+
+    output = io.BytesIO()
+    output.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b'%d 0 obj\n%s\nendobj\n' % (number, body))
+    xref_offset = output.tell()
+    output.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b'%010d 00000 n \n' % offset)
+    output.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset))
+    return output.getvalue()
+
+
+def render_docx(text: str) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def build_corpus(resumes: int = 200, jobs: int = 20, seed: int = 42,
+                 formats: Sequence[str] = ('txt', 'pdf', 'docx')) -> Dict[str, Any]:
+    """Generate the synthetic corpus; the same seed always yields the same corpus"""
+    rng = random.Random(seed)
+    texts = [generate_resume(rng, index) for index in range(resumes)]
+    corpus = {
+        'texts': texts,
+        'jobs': [generate_job(rng, index + 1) for index in range(jobs)],
+        'files': {},
+    }
+    renderers = {'txt': lambda text: text.encode('utf-8'), 'pdf': render_pdf, 'docx': render_docx}
+    for file_type in formats:
+        corpus['files'][file_type] = [renderers[file_type](text) for text in texts]
+    return corpus
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(percentile / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def measure(name: str, func: Callable[[Any], Any], items: Sequence[Any],
+            memory_sample: int = 20) -> Dict[str, Any]:
+    """
+    Time ``func`` over every item, then measure peak traced memory over a
+    sample of items in a second pass so tracing does not skew the timings.
+    """
+    latencies = []
+    started = time.perf_counter()
+    for item in items:
+        item_started = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - item_started)
+    elapsed = time.perf_counter() - started
+
+    peak_bytes = 0
+    if memory_sample:
+        tracemalloc.start()
+        try:
+            for item in items[:memory_sample]:
+                func(item)
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'stage': name,
+        'documents': len(items),
+        'per_second': round(len(items) / elapsed, 1) if elapsed > 0 else 0.0,
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 3),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 3),
+        'peak_memory_kb': round(peak_bytes / 1024, 1),
+    }
+
+
+def run_benchmark(corpus: Dict[str, Any], stages: Optional[Sequence[str]] = None,
+                  memory_sample: int = 20) -> List[Dict[str, Any]]:
+    """Run the selected stages (extract, analyze, match) over a corpus"""
+    from .extraction import extract_document
+    from .services import ATSAnalyzerService
+
+    stages = stages or ('extract', 'analyze', 'match')
+    analyzer = ATSAnalyzerService()
+    results = []
+
+    if 'extract' in stages:
+        for file_type, files in corpus['files'].items():
+            results.append(measure(
+                f'extract_document[{file_type}]',
+                lambda data, file_type=file_type: extract_document(data, file_type, timeout=0, cpu_timeout=0),
+                files, memory_sample,
+            ))
+        if 'pdf' in corpus['files']:
+            results.append(measure(
+                'extract_text_from_pdf',
+                lambda data: analyzer.extract_text_from_pdf(io.BytesIO(data)),
+                corpus['files']['pdf'], memory_sample,
+            ))
+
+    if 'analyze' in stages:
+        # Salt every call so this stage measures real analysis, not memoized results
+        run_id = time.time_ns()
+        calls = itertools.count()
+        results.append(measure(
+            'analyze_document',
+            lambda text: analyzer.analyze_document(f'{text}\nbenchmark {run_id} {next(calls)}', 'RESUME'),
+            corpus['texts'], memory_sample,
+        ))
+
+        texts = [f'{text}\nbenchmark {run_id}' for text in corpus['texts']]
+        for text in texts:
+            analyzer.analyze_document(text, 'RESUME')
+        results.append(measure(
+            'analyze_document[memoized]',
+            lambda text: analyzer.analyze_document(text, 'RESUME'),
+            texts, memory_sample,
+        ))
+
+    if 'match' in stages:
+        jobs = corpus['jobs']
+        pairs = [(text, jobs[index % len(jobs)]) for index, text in enumerate(corpus['texts'])]
+        results.append(measure(
+            'match_resume_to_job',
+            lambda pair: analyzer.match_resume_to_job(pair[0], pair[1]),
+            pairs, memory_sample,
+        ))
+
+    return results
+
+
+def save_baseline(path: str, results: List[Dict[str, Any]], parameters: Dict[str, Any]):
+    with open(path, 'w') as handle:
+        json.dump({'parameters': parameters, 'results': results}, handle, indent=2)
+
+
+def compare_to_baseline(path: str, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Per-stage change in throughput and latency relative to a saved baseline"""
+    with open(path) as handle:
+        baseline = {row['stage']: row for row in json.load(handle)['results']}
+
+    def change(current, previous):
+        return round((current - previous) / previous * 100, 1) if previous else None
+
+    comparison = []
+    for row in results:
+        previous = baseline.get(row['stage'])
+        if previous is None:
+            continue
+        comparison.append({
+            'stage': row['stage'],
+            'per_second_change_pct': change(row['per_second'], previous['per_second']),
+            'p50_change_pct': change(row['p50_ms'], previous['p50_ms']),
+            'p99_change_pct': change(row['p99_ms'], previous['p99_ms']),
+            'peak_memory_change_pct': change(row['peak_memory_kb'], previous['peak_memory_kb']),
+        })
+    return comparison
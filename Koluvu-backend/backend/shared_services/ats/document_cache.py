@@ -0,0 +1,183 @@
+"""
+Content-addressed cache of extracted document text.
+
+Extraction results are stored in the database under the SHA-256 of the
+uploaded bytes, so a resume uploaded to many jobs is parsed only once.
+Failed extractions are cached too, which keeps hostile documents from being
+parsed again, except failures marked ``transient`` (a crashed worker or a
+full queue) that say nothing about the document itself. The cache is
+bounded by the total size of stored text, summed from the table, and evicts
+least recently used entries.
+
+Hit and miss counters are kept in the counters cache when it is shared by
+every server process (``COUNTERS_CACHE_URL``); a process-local cache would
+only count the lookups of one worker, so they are not counted without one.
+``stats`` reports them (see the ``document_cache_stats`` command).
+"""
+import logging
+from typing import Any, Dict, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from shared_services.counters import get_counters_cache
+from shared_services.shared_cache import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+HITS_KEY = 'ats_document_cache_hits'
+MISSES_KEY = 'ats_document_cache_misses'
+
+
+def _model():
+    return apps.get_model('ats', 'ExtractedDocument')
+
+
+def counting_enabled() -> bool:
+    """Lookups are counted only in a counters cache shared by every server process"""
+    return is_shared_cache('counters')
+
+
+def _incr(key: str):
+    if not counting_enabled():
+        return
+    counters_cache = get_counters_cache()
+    try:
+        counters_cache.incr(key)
+    except ValueError:
+        counters_cache.set(key, 1, None)
+
+
+def lookup(digest: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached extraction result for a digest, or ``None`` on a miss.
+
+    The result has the same shape as ``extraction.extract_document``.
+    """
+    if not digest:
+        return None
+
+    ExtractedDocument = _model()
+    document = ExtractedDocument.objects.filter(sha256=digest).only('id', 'text', 'parsed').first()
+    if document is None:
+        _incr(MISSES_KEY)
+        return None
+
+    _incr(HITS_KEY)
+    ExtractedDocument.objects.filter(id=document.id).update(
+        hit_count=F('hit_count') + 1,
+        last_used_at=timezone.now()
+    )
+
+    parsed = document.parsed or {}
+    return {
+        'text': document.text,
+        'pages': parsed.get('pages'),
+        'truncated': parsed.get('truncated', False),
+        'error': parsed.get('error'),
+        'cached': True,
+    }
+
+
+def store(digest: str, file_type: str, result: Dict[str, Any]):
+    """
+    Cache an extraction result and evict old entries if over the size limit.
+    Transient failures are not cached, so the document is parsed again.
+    """
+    if not digest or result.get('transient'):
+        return
+
+    text = result.get('text') or ''
+    size_bytes = len(text.encode('utf-8'))
+    parsed = {
+        'pages': result.get('pages'),
+        'truncated': result.get('truncated', False),
+        'error': result.get('error'),
+    }
+
+    try:
+        _model().objects.create(
+            sha256=digest,
+            file_type=(file_type or '')[:10],
+            text=text,
+            parsed=parsed,
+            size_bytes=size_bytes,
+        )
+    except IntegrityError:
+        # Another worker cached the same document first
+        return
+
+    if current_size() > max_size():
+        evict()
+
+
+def max_size() -> int:
+    return getattr(settings, 'ATS_DOCUMENT_CACHE_MAX_BYTES', 256 * 1024 * 1024)
+
+
+def current_size() -> int:
+    """Total bytes of cached text"""
+    return _model().objects.aggregate(total=Sum('size_bytes'))['total'] or 0
+
+
+def evict(target_ratio: float = 0.9) -> int:
+    """
+    Delete least recently used entries until the cache is below
+    ``target_ratio`` of its size limit. Returns the number of entries removed.
+    """
+    ExtractedDocument = _model()
+    excess = current_size() - int(max_size() * target_ratio)
+    removed = 0
+
+    while excess > 0:
+        batch = list(
+            ExtractedDocument.objects.order_by('last_used_at').values_list('id', 'size_bytes')[:500]
+        )
+        if not batch:
+            break
+
+        ids = []
+        freed = 0
+        for document_id, size_bytes in batch:
+            ids.append(document_id)
+            freed += size_bytes
+            if freed >= excess:
+                break
+
+        ExtractedDocument.objects.filter(id__in=ids).delete()
+        removed += len(ids)
+        excess -= freed
+
+    if removed:
+        logger.info(f"Evicted {removed} extracted documents from the ATS document cache")
+    return removed
+
+
+def stats(reset: bool = False) -> Dict[str, Any]:
+    """
+    Hit/miss counters and current size of the document cache.
+    The counters are ``None`` when lookups are not counted.
+    """
+    hits = misses = hit_ratio = None
+    if counting_enabled():
+        counters_cache = get_counters_cache()
+        counters = counters_cache.get_many([HITS_KEY, MISSES_KEY])
+        if reset:
+            counters_cache.delete_many([HITS_KEY, MISSES_KEY])
+        hits = counters.get(HITS_KEY, 0)
+        misses = counters.get(MISSES_KEY, 0)
+        lookups = hits + misses
+        hit_ratio = round(hits / lookups, 4) if lookups else 0.0
+
+    totals = _model().objects.aggregate(entries=Count('id'), size=Sum('size_bytes'))
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hit_ratio,
+        'entries': totals['entries'],
+        'size_bytes': totals['size'] or 0,
+        'max_size_bytes': max_size(),
+    }
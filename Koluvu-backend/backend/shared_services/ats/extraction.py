@@ -0,0 +1,310 @@
+"""
+Resume text extraction outside the request cycle.
+
+Documents are parsed in a small pool of worker processes so a large or
+hostile PDF can never pin a web worker. Every document is parsed under a
+CPU-time limit (``ITIMER_PROF``), a looser wall-clock timeout and a page
+limit. Each worker's address space is capped with ``RLIMIT_AS`` when it
+starts, so an allocation past the cap fails with ``MemoryError`` inside the
+parser; resident memory is also checked between pages. ``RLIMIT_CPU`` bounds
+the total CPU time of a worker, so a parser stuck in C code that never
+returns to the signal handlers is killed by the OS. Workers are recycled
+periodically to return memory to the OS.
+
+The worker side of this module deliberately avoids importing Django so it
+can run in freshly spawned processes.
+"""
+import io
+import os
+import signal
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_TYPES = ('pdf', 'docx', 'txt')
+
+
+class ExtractionLimitExceeded(Exception):
+    """Raised inside a worker when a document exceeds a parsing limit"""
+
+
+def _current_rss_mb() -> float:
+    """Resident set size of the current process in megabytes"""
+    try:
+        with open('/proc/self/statm') as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak, reported in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return 0.0
+
+
+def _set_soft_limit(resource, which: int, limit: int, description: str):
+    _, hard = resource.getrlimit(which)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    try:
+        resource.setrlimit(which, (limit, hard))
+    except (ValueError, OSError) as e:
+        logger.warning(f"Could not limit extraction worker {description}: {str(e)}")
+
+
+def _init_worker(max_address_space_mb: int, max_cpu_seconds: int = 0):
+    """Pool initializer: cap the address space and total CPU time of the worker process"""
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return
+
+    if max_address_space_mb:
+        _set_soft_limit(resource, resource.RLIMIT_AS, max_address_space_mb * 1024 * 1024, 'address space')
+    if max_cpu_seconds:
+        # Past the soft limit the kernel sends SIGXCPU, which terminates the
+        # worker; the pool reports that as a transient failure and restarts
+        _set_soft_limit(resource, resource.RLIMIT_CPU, int(max_cpu_seconds), 'CPU time')
+
+
+def _check_memory(max_rss_mb: int):
+    if max_rss_mb and _current_rss_mb() > max_rss_mb:
+        raise ExtractionLimitExceeded(f'memory limit of {max_rss_mb} MB exceeded')
+
+
+def _open_source(source: Union[str, bytes]):
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def _extract_pdf(source, max_pages: int, max_rss_mb: int) -> Dict[str, Any]:
+    import pdfplumber
+
+    parts = []
+    with pdfplumber.open(_open_source(source)) as pdf:
+        total_pages = len(pdf.pages)
+        for page in pdf.pages[:max_pages]:
+            page_text = page.extract_text()
+            if page_text:
+                parts.append(page_text)
+            # Release the parsed page layout before moving on
+            page.flush_cache()
+            _check_memory(max_rss_mb)
+
+    return {
+        'text': '\n'.join(parts).strip(),
+        'pages': min(total_pages, max_pages),
+        'truncated': total_pages > max_pages,
+    }
+
+
+def _extract_docx(source, max_paragraphs: int, max_rss_mb: int) -> Dict[str, Any]:
+    import docx
+
+    document = docx.Document(_open_source(source))
+    parts = []
+    for paragraph in document.paragraphs[:max_paragraphs]:
+        if paragraph.text:
+            parts.append(paragraph.text)
+
+    # Skills are frequently laid out in tables
+    for table in document.tables:
+        for row in table.rows:
+            cells = [cell.text for cell in row.cells if cell.text]
+            if cells:
+                parts.append(' | '.join(cells))
+    _check_memory(max_rss_mb)
+
+    return {
+        'text': '\n'.join(parts).strip(),
+        'pages': None,
+        'truncated': len(document.paragraphs) > max_paragraphs,
+    }
+
+
+def _extract_txt(source) -> Dict[str, Any]:
+    if isinstance(source, (bytes, bytearray)):
+        data = bytes(source)
+    else:
+        with open(source, 'rb') as handle:
+            data = handle.read()
+    return {'text': data.decode('utf-8', errors='ignore').strip(), 'pages': None, 'truncated': False}
+
+
+def _on_timeout(signum, frame):
+    raise ExtractionLimitExceeded('extraction timed out')
+
+
+def _on_cpu_limit(signum, frame):
+    raise ExtractionLimitExceeded('CPU time limit exceeded')
+
+
+def extract_document(source: Union[str, bytes], file_type: str, max_pages: int = 20,
+                     timeout: float = 20.0, max_rss_mb: int = 512,
+                     cpu_timeout: float = 10.0) -> Dict[str, Any]:
+    """
+    Extract text from a PDF, DOCX or TXT document within the given limits.
+
+    Args:
+        source: Path to the document or its raw bytes
+        file_type: One of ``SUPPORTED_TYPES``
+        max_pages: Maximum PDF pages to parse (DOCX uses 50 paragraphs per page)
+        timeout: Wall-clock seconds allowed for this document
+        max_rss_mb: Resident memory ceiling for the parsing process
+        cpu_timeout: CPU seconds (user and system) allowed for this document
+
+    Returns:
+        Dictionary with ``text``, ``pages``, ``truncated`` and ``error``
+        (``None`` on success). Never raises.
+    """
+    file_type = (file_type or '').lower().lstrip('.')
+    if file_type not in SUPPORTED_TYPES:
+        return {'text': '', 'pages': None, 'truncated': False, 'error': f'unsupported file type: {file_type}'}
+
+    # Signal handlers can only be installed from the main thread of a Unix
+    # process, which is where pool workers run their tasks
+    can_signal = hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+    timers = []
+    if can_signal and timeout:
+        timers.append((signal.ITIMER_REAL, signal.SIGALRM, _on_timeout, timeout))
+    if can_signal and cpu_timeout:
+        timers.append((signal.ITIMER_PROF, signal.SIGPROF, _on_cpu_limit, cpu_timeout))
+    previous_handlers = []
+    for which, signum, handler, seconds in timers:
+        previous_handlers.append(signal.signal(signum, handler))
+        signal.setitimer(which, seconds)
+
+    try:
+        if file_type == 'pdf':
+            result = _extract_pdf(source, max_pages, max_rss_mb)
+        elif file_type == 'docx':
+            result = _extract_docx(source, max_pages * 50, max_rss_mb)
+        else:
+            result = _extract_txt(source)
+        result['error'] = None
+        return result
+    except ExtractionLimitExceeded as e:
+        return {'text': '', 'pages': None, 'truncated': True, 'error': str(e)}
+    except MemoryError:
+        return {'text': '', 'pages': None, 'truncated': True, 'error': 'address space limit exceeded'}
+    except Exception as e:
+        return {'text': '', 'pages': None, 'truncated': False, 'error': f'{type(e).__name__}: {e}'}
+    finally:
+        for (which, signum, _, _), previous_handler in zip(timers, previous_handlers):
+            signal.setitimer(which, 0)
+            signal.signal(signum, previous_handler)
+
+
+class ResumeExtractionPool:
+    """Bounded pool of worker processes running ``extract_document``"""
+
+    def __init__(self, workers: int = 2, timeout: float = 20.0, max_pages: int = 20,
+                 max_rss_mb: int = 512, max_tasks_per_child: int = 50,
+                 max_address_space_mb: int = 1024, cpu_timeout: float = 10.0):
+        self.workers = max(int(workers), 1)
+        self.timeout = timeout
+        self.cpu_timeout = cpu_timeout
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.max_address_space_mb = max_address_space_mb
+        self.max_tasks_per_child = max_tasks_per_child
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Spawned (not forked) workers are safe to start from threaded web servers
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    max_tasks_per_child=self.max_tasks_per_child,
+                    initializer=_init_worker,
+                    initargs=(self.max_address_space_mb, self._worker_cpu_seconds()),
+                )
+            return self._executor
+
+    def _worker_cpu_seconds(self) -> int:
+        """Lifetime CPU budget of a worker: every task at its limit plus start-up"""
+        if not self.cpu_timeout:
+            return 0
+        return int(self.cpu_timeout * self.max_tasks_per_child) + 30
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, source: Union[str, bytes], file_type: str,
+               callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Queue a document for extraction.
+
+        ``callback`` receives the result dictionary from ``extract_document``
+        once the worker finishes, or an error result with ``transient`` set
+        when the worker itself failed. It runs on a pool management thread, so
+        it must manage its own database connections.
+        """
+        executor = self._get_executor()
+        try:
+            future = executor.submit(
+                extract_document, source, file_type,
+                self.max_pages, self.timeout, self.max_rss_mb, self.cpu_timeout,
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS); start a fresh pool
+            self._reset(executor)
+            executor = self._get_executor()
+            future = executor.submit(
+                extract_document, source, file_type,
+                self.max_pages, self.timeout, self.max_rss_mb, self.cpu_timeout,
+            )
+
+        if callback is not None:
+            def _done(done_future):
+                try:
+                    result = done_future.result()
+                except BrokenProcessPool as e:
+                    self._reset(executor)
+                    result = {'text': '', 'pages': None, 'truncated': False, 'error': f'worker crashed: {e}',
+                              'transient': True}
+                except Exception as e:
+                    result = {'text': '', 'pages': None, 'truncated': False, 'error': str(e), 'transient': True}
+
+                try:
+                    callback(result)
+                except Exception as e:
+                    logger.error(f"Error in resume extraction callback: {str(e)}", exc_info=True)
+
+            future.add_done_callback(_done)
+
+        return future
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ResumeExtractionPool:
+    """Process-wide extraction pool configured from settings"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from django.conf import settings
+            _pool = ResumeExtractionPool(
+                workers=getattr(settings, 'ATS_EXTRACTION_WORKERS', 2),
+                timeout=getattr(settings, 'ATS_EXTRACTION_TIMEOUT', 20),
+                cpu_timeout=getattr(settings, 'ATS_EXTRACTION_CPU_TIMEOUT', 10),
+                max_pages=getattr(settings, 'ATS_EXTRACTION_MAX_PAGES', 20),
+                max_rss_mb=getattr(settings, 'ATS_EXTRACTION_MAX_RSS_MB', 512),
+                max_address_space_mb=getattr(settings, 'ATS_EXTRACTION_MAX_ADDRESS_SPACE_MB', 1024),
+            )
+        return _pool
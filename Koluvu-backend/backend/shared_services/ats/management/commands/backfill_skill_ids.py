@@ -0,0 +1,105 @@
+from collections import defaultdict
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from shared_services.ats.skills import canonical_skill_id, resolve_skill_ids, seed_default_aliases
+
+
+class Command(BaseCommand):
+    help = 'Resolve free-text skills on existing jobs, candidates and courses to canonical skill ids'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Rows loaded and written per batch'
+        )
+        parser.add_argument(
+            '--no-seed', action='store_true',
+            help='Do not create the built-in skill aliases first'
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = max(options['batch_size'], 1)
+
+        if not options['no_seed']:
+            created = seed_default_aliases()
+            self.stdout.write(f'Seeded {created} skill aliases')
+
+        # Individual skill rows first; profile and course id lists are built from them
+        self._backfill(
+            'employee_dashboard', 'Skill', ['name'], 'canonical_skill_id',
+            lambda row: canonical_skill_id(row.name)
+        )
+        self._backfill(
+            'courses', 'Skill', ['name'], 'canonical_skill_id',
+            lambda row: canonical_skill_id(row.name)
+        )
+        self._backfill(
+            'employer_dashboard', 'Job', ['skills'], 'skill_ids',
+            lambda row: resolve_skill_ids(row.skills)
+        )
+        self._backfill(
+            'employer_dashboard', 'Candidate', ['skills'], 'skill_ids',
+            lambda row: resolve_skill_ids(row.skills)
+        )
+        self._backfill(
+            'employee_dashboard', 'CandidateSearchProfile', ['employee_id', 'key_skills'], 'skill_ids',
+            self._profile_skill_ids, prefetch=self._load_employee_skills
+        )
+        self._backfill(
+            'courses', 'Course', [], 'skill_ids',
+            self._course_skill_ids, prefetch=self._load_course_skills
+        )
+
+        self.stdout.write(self.style.SUCCESS('Successfully backfilled canonical skill ids'))
+
+    def _backfill(self, app_label, model_name, fields, target, resolve, prefetch=None):
+        model = apps.get_model(app_label, model_name)
+        updated = 0
+        last_id = 0
+        while True:
+            rows = list(
+                model.objects.filter(id__gt=last_id).order_by('id').only('id', *fields)[:self.batch_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            if prefetch:
+                prefetch(rows)
+            for row in rows:
+                setattr(row, target, resolve(row))
+
+            # bulk_update skips save(), so no per-row signals or re-resolution
+            model.objects.bulk_update(rows, [target], batch_size=self.batch_size)
+            updated += len(rows)
+
+        self.stdout.write(f'{app_label}.{model_name}: updated {updated} rows')
+
+    def _load_employee_skills(self, profiles):
+        Skill = apps.get_model('employee_dashboard', 'Skill')
+        self._employee_skills = defaultdict(set)
+        rows = Skill.objects.filter(
+            employee_id__in=[profile.employee_id for profile in profiles],
+            canonical_skill_id__isnull=False
+        ).values_list('employee_id', 'canonical_skill_id')
+        for employee_id, skill_id in rows:
+            self._employee_skills[employee_id].add(skill_id)
+
+    def _profile_skill_ids(self, profile):
+        skill_ids = set(resolve_skill_ids(profile.key_skills))
+        skill_ids.update(self._employee_skills.get(profile.employee_id, ()))
+        return sorted(skill_ids)
+
+    def _load_course_skills(self, courses):
+        Course = apps.get_model('courses', 'Course')
+        self._course_skills = defaultdict(set)
+        rows = Course.skills.through.objects.filter(
+            course_id__in=[course.id for course in courses],
+            skill__canonical_skill_id__isnull=False
+        ).values_list('course_id', 'skill__canonical_skill_id')
+        for course_id, skill_id in rows:
+            self._course_skills[course_id].add(skill_id)
+
+    def _course_skill_ids(self, course):
+        return sorted(self._course_skills.get(course.id, ()))
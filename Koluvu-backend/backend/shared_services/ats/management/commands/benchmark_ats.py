@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+from shared_services.ats.benchmark import build_corpus, run_benchmark, save_baseline, compare_to_baseline
+
+STAGES = ('extract', 'analyze', 'match')
+FORMATS = ('txt', 'pdf', 'docx')
+
+
+class Command(BaseCommand):
+    help = 'Benchmark ATS extraction, analysis and matching on a synthetic resume/job corpus'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--resumes', type=int, default=200, help='Number of synthetic resumes')
+        parser.add_argument('--jobs', type=int, default=20, help='Number of synthetic jobs')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed for the corpus')
+        parser.add_argument(
+            '--stage', action='append', dest='stages', choices=STAGES,
+            help='Only run this stage (can be repeated; default: all)'
+        )
+        parser.add_argument(
+            '--format', action='append', dest='formats', choices=FORMATS,
+            help='Only generate this document format (can be repeated; default: all)'
+        )
+        parser.add_argument(
+            '--memory-sample', type=int, default=20,
+            help='Documents per stage re-run under tracemalloc for peak memory (0 to skip)'
+        )
+        parser.add_argument('--save-baseline', metavar='PATH', help='Write the results to a JSON baseline')
+        parser.add_argument('--compare', metavar='PATH', help='Compare the results to a saved baseline')
+
+    def handle(self, *args, **options):
+        if options['resumes'] < 1 or options['jobs'] < 1:
+            raise CommandError('--resumes and --jobs must be at least 1')
+
+        parameters = {
+            'resumes': options['resumes'],
+            'jobs': options['jobs'],
+            'seed': options['seed'],
+            'formats': options['formats'] or list(FORMATS),
+        }
+
+        self.stdout.write(
+            f"Generating {parameters['resumes']} resumes ({', '.join(parameters['formats'])}) "
+            f"and {parameters['jobs']} jobs..."
+        )
+        corpus = build_corpus(
+            resumes=parameters['resumes'],
+            jobs=parameters['jobs'],
+            seed=parameters['seed'],
+            formats=parameters['formats'],
+        )
+
+        results = run_benchmark(corpus, options['stages'], options['memory_sample'])
+
+        self.stdout.write(f"{'stage':<30} {'docs/sec':>10} {'p50 ms':>10} {'p99 ms':>10} {'peak KB':>10}")
+        for row in results:
+            self.stdout.write(
+                f"{row['stage']:<30} {row['per_second']:>10} {row['p50_ms']:>10} "
+                f"{row['p99_ms']:>10} {row['peak_memory_kb']:>10}"
+            )
+
+        if options['compare']:
+            try:
+                comparison = compare_to_baseline(options['compare'], results)
+            except (OSError, ValueError, KeyError) as e:
+                raise CommandError(f"Could not read baseline {options['compare']}: {e}")
+
+            self.stdout.write(f"\nChange vs {options['compare']} (%):")
+            self.stdout.write(f"{'stage':<30} {'docs/sec':>10} {'p50':>10} {'p99':>10} {'peak':>10}")
+            for row in comparison:
+                self.stdout.write(
+                    f"{row['stage']:<30} {str(row['per_second_change_pct']):>10} "
+                    f"{str(row['p50_change_pct']):>10} {str(row['p99_change_pct']):>10} "
+                    f"{str(row['peak_memory_change_pct']):>10}"
+                )
+
+        if options['save_baseline']:
+            save_baseline(options['save_baseline'], results, parameters)
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {options['save_baseline']}"))
+        else:
+            self.stdout.write(self.style.SUCCESS('Benchmark complete'))
@@ -0,0 +1,76 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from shared_services.ats.skills import normalize_skill, resolve_skill_id
+
+
+class Command(BaseCommand):
+    help = 'Review skills queued for curation and promote them to the canonical skill taxonomy'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--promote', action='append', default=[], metavar='NAME',
+            help='Add a queued skill to the taxonomy (can be repeated)'
+        )
+        parser.add_argument(
+            '--alias', action='append', default=[], metavar='NAME=SKILL',
+            help='Make a queued skill an alias of an existing canonical skill (can be repeated)'
+        )
+        parser.add_argument(
+            '--dismiss', action='append', default=[], metavar='NAME',
+            help='Drop a queued skill without adding it (can be repeated)'
+        )
+        parser.add_argument(
+            '--promote-seen', type=int, metavar='N',
+            help='Promote every queued skill seen at least N times'
+        )
+        parser.add_argument(
+            '--limit', type=int, default=50,
+            help='Queued skills listed when no action is given'
+        )
+
+    def handle(self, *args, **options):
+        CanonicalSkill = apps.get_model('ats', 'CanonicalSkill')
+        SkillAlias = apps.get_model('ats', 'SkillAlias')
+        UnresolvedSkill = apps.get_model('ats', 'UnresolvedSkill')
+
+        promote = {normalize_skill(name) for name in options['promote']}
+        if options['promote_seen']:
+            promote.update(
+                UnresolvedSkill.objects.filter(occurrences__gte=options['promote_seen']).values_list('name', flat=True)
+            )
+
+        aliases = {}
+        for pair in options['alias']:
+            name, separator, skill_name = pair.partition('=')
+            if not separator:
+                raise CommandError(f'--alias expects NAME=SKILL, got "{pair}"')
+            skill_id = resolve_skill_id(skill_name)
+            if skill_id is None:
+                raise CommandError(f'Unknown canonical skill: {skill_name}')
+            aliases[normalize_skill(name)] = skill_id
+
+        dismiss = {normalize_skill(name) for name in options['dismiss']}
+
+        if not (promote or aliases or dismiss):
+            queued = UnresolvedSkill.objects.all()[:max(options['limit'], 1)]
+            self.stdout.write(f"{'skill':<40} {'seen':>8}  last seen")
+            for skill in queued:
+                self.stdout.write(f'{skill.name:<40} {skill.occurrences:>8}  {skill.last_seen_at:%Y-%m-%d}')
+            return
+
+        with transaction.atomic():
+            for name in sorted(promote):
+                if name:
+                    CanonicalSkill.objects.get_or_create(name=name)
+            for name, skill_id in aliases.items():
+                if name and not CanonicalSkill.objects.filter(name=name).exists():
+                    SkillAlias.objects.get_or_create(alias=name, defaults={'skill_id': skill_id})
+            UnresolvedSkill.objects.filter(name__in=promote | set(aliases) | dismiss).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully promoted {len(promote)}, aliased {len(aliases)} and dismissed {len(dismiss)} skills; '
+                f'run backfill_skill_ids to update existing records'
+            )
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from shared_services.ats.document_cache import counting_enabled, evict, stats
+
+
+class Command(BaseCommand):
+    help = 'Show the hit ratio and size of the extracted document cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset', action='store_true',
+            help='Reset the hit and miss counters after showing them'
+        )
+        parser.add_argument(
+            '--evict', action='store_true',
+            help='Evict least recently used documents until the cache is below its size limit'
+        )
+
+    def handle(self, *args, **options):
+        if options['evict']:
+            removed = evict()
+            self.stdout.write(f'Evicted {removed} documents')
+
+        document_stats = stats(reset=options['reset'])
+
+        if counting_enabled():
+            self.stdout.write(
+                f"hits={document_stats['hits']} misses={document_stats['misses']} "
+                f"hit_ratio={document_stats['hit_ratio']:.2%}"
+            )
+        else:
+            self.stdout.write(self.style.WARNING(
+                "Lookups are not counted: CACHES['counters'] is not shared between processes "
+                "(set COUNTERS_CACHE_URL)"
+            ))
+        self.stdout.write(
+            f"entries={document_stats['entries']} size={document_stats['size_bytes']} "
+            f"max_size={document_stats['max_size_bytes']}"
+        )
+        self.stdout.write(self.style.SUCCESS('Done'))
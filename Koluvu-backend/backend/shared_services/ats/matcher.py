@@ -0,0 +1,171 @@
+"""
+Multi-pattern keyword matcher for ATS scoring.
+
+The matcher compiles a keyword list into an Aho-Corasick automaton once and
+then scans a document in a single pass, so the cost of matching grows with
+the length of the document rather than with the number of keywords.
+Matches respect word boundaries, so "sql" is not found inside "nosql" and
+"git" is not found inside "digital".
+"""
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache, caches
+
+from .versions import bump_version, get_version
+
+
+KEYWORD_LIBRARY_VERSION_KEY = 'ats_keyword_library_version'
+
+
+def normalize_keyword(keyword) -> str:
+    """Lowercase a keyword and collapse internal whitespace"""
+    return re.sub(r'\s+', ' ', str(keyword or '').strip().lower())
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of keywords.
+
+    Text passed to ``find``/``counts`` is expected to be lowercased with
+    whitespace collapsed (see ``ATSAnalyzerService._clean_text``); keywords
+    are normalized the same way when the matcher is built.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._index: Dict[str, int] = {}
+        # Per-keyword flags: does the keyword start/end with a word character?
+        self._bounded_start: List[bool] = []
+        self._bounded_end: List[bool] = []
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for keyword in keywords:
+            self._add(normalize_keyword(keyword))
+        self._build()
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def __contains__(self, keyword):
+        return normalize_keyword(keyword) in self._index
+
+    def _add(self, keyword: str):
+        if not keyword or keyword in self._index:
+            return
+
+        keyword_id = len(self.keywords)
+        self.keywords.append(keyword)
+        self._index[keyword] = keyword_id
+        self._bounded_start.append(_is_word_char(keyword[0]))
+        self._bounded_end.append(_is_word_char(keyword[-1]))
+
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(keyword_id)
+
+    def _build(self):
+        """Compute failure links breadth-first and merge outputs"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find(self, text: str) -> Dict[str, List[int]]:
+        """
+        Scan text once and return whole-word hits.
+
+        Returns:
+            Dictionary mapping each matched keyword to the list of start
+            offsets at which it occurs in ``text``
+        """
+        hits: Dict[str, List[int]] = {}
+        if not text or not self.keywords:
+            return hits
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self.keywords
+        text_length = len(text)
+
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            if not output[state]:
+                continue
+
+            for keyword_id in output[state]:
+                keyword = keywords[keyword_id]
+                start = position - len(keyword) + 1
+
+                if self._bounded_start[keyword_id] and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                end = position + 1
+                if self._bounded_end[keyword_id] and end < text_length and _is_word_char(text[end]):
+                    continue
+
+                hits.setdefault(keyword, []).append(start)
+
+        return hits
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """Return the number of whole-word occurrences of each matched keyword"""
+        return {keyword: len(positions) for keyword, positions in self.find(text).items()}
+
+
+@lru_cache(maxsize=256)
+def _compile(keywords: tuple) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Return a compiled matcher for a keyword set, reusing recent compilations"""
+    normalized = sorted({normalize_keyword(k) for k in keywords if normalize_keyword(k)})
+    return _compile(tuple(normalized))
+
+
+def get_ats_cache():
+    """Cache holding results keyed by the library version"""
+    return caches['ats'] if 'ats' in settings.CACHES else cache
+
+
+def get_keyword_library_version() -> int:
+    """Current version of the shared ATS keyword library"""
+    return get_version(KEYWORD_LIBRARY_VERSION_KEY)
+
+
+def bump_keyword_library_version() -> int:
+    """Invalidate everything compiled from or cached against the keyword library"""
+    return bump_version(KEYWORD_LIBRARY_VERSION_KEY)
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:46
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ats', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractedDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('file_type', models.CharField(max_length=10)),
+                ('text', models.TextField(blank=True, default='')),
+                ('parsed', models.JSONField(blank=True, default=dict, help_text='Parsed structure where available (pages, truncation, errors)')),
+                ('size_bytes', models.IntegerField(default=0, help_text='Size of the stored text in bytes')),
+                ('hit_count', models.IntegerField(default=0)),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Extracted Document',
+                'verbose_name_plural': 'Extracted Documents',
+                'db_table': 'ats_extracted_documents',
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ats', '0002_extracteddocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CanonicalSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Normalized (lowercase) skill name', max_length=100, unique=True)),
+                ('category', models.CharField(blank=True, default='', max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Canonical Skill',
+                'verbose_name_plural': 'Canonical Skills',
+                'db_table': 'ats_canonical_skills',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(help_text='Normalized (lowercase) alias', max_length=100, unique=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='ats.canonicalskill')),
+            ],
+            options={
+                'verbose_name': 'Skill Alias',
+                'verbose_name_plural': 'Skill Aliases',
+                'db_table': 'ats_skill_aliases',
+            },
+        ),
+    ]
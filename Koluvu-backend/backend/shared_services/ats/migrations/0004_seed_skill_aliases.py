@@ -0,0 +1,59 @@
+import re
+
+from django.db import migrations
+
+# Frozen copy of shared_services.ats.skills.DEFAULT_SKILL_ALIASES at the time
+# of this migration; canonical name first
+SKILL_ALIASES = {
+    'javascript': ['js', 'java script', 'ecmascript', 'es6'],
+    'typescript': ['ts'],
+    'react': ['react.js', 'reactjs', 'react js'],
+    'vue': ['vue.js', 'vuejs'],
+    'angular': ['angular.js', 'angularjs'],
+    'node.js': ['node', 'nodejs', 'node js'],
+    'python': ['python3', 'python 3'],
+    'postgresql': ['postgres', 'psql'],
+    'mongodb': ['mongo'],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'azure': ['microsoft azure'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'ci/cd': ['cicd', 'ci cd', 'continuous integration'],
+    'c#': ['csharp', 'c sharp'],
+    'c++': ['cpp'],
+    'go': ['golang'],
+    '.net': ['dotnet', 'dot net'],
+    'rest': ['rest api', 'restful', 'restful api'],
+    'excel': ['ms excel', 'microsoft excel'],
+}
+
+
+def normalize_skill(value):
+    return re.sub(r'\s+', ' ', str(value or '').strip().lower()).strip(' ,;:*•')
+
+
+def seed_skill_aliases(apps, schema_editor):
+    # Seed before any free-text skill is resolved, so common spellings
+    # ("k8s", "reactjs") become aliases instead of separate skills
+    CanonicalSkill = apps.get_model('ats', 'CanonicalSkill')
+    SkillAlias = apps.get_model('ats', 'SkillAlias')
+
+    for name, aliases in SKILL_ALIASES.items():
+        skill, _ = CanonicalSkill.objects.get_or_create(name=normalize_skill(name))
+        for alias in aliases:
+            alias = normalize_skill(alias)
+            if not CanonicalSkill.objects.filter(name=alias).exists():
+                SkillAlias.objects.get_or_create(alias=alias, defaults={'skill': skill})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ats', '0003_canonicalskill_skillalias'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_skill_aliases, reverse_code=migrations.RunPython.noop),
+    ]
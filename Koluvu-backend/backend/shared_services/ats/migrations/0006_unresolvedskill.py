@@ -0,0 +1,30 @@
+# Generated by Django 5.2.3 on 2026-10-18 12:04
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ats', '0005_cacheversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnresolvedSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Normalized (lowercase) skill name', max_length=100, unique=True)),
+                ('occurrences', models.PositiveIntegerField(default=1)),
+                ('first_seen_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_seen_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Unresolved Skill',
+                'verbose_name_plural': 'Unresolved Skills',
+                'db_table': 'ats_unresolved_skills',
+                'ordering': ['-occurrences', 'name'],
+            },
+        ),
+    ]
@@ -1,5 +1,11 @@
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+from .matcher import bump_keyword_library_version
+from .skills import bump_skill_taxonomy_version
 
 
 class ATSProfile(models.Model):
@@ -82,6 +88,107 @@ class ATSKeywordLibrary(models.Model):
         verbose_name_plural = 'ATS Keyword Libraries'
 
 
+@receiver(post_save, sender=ATSKeywordLibrary)
+@receiver(post_delete, sender=ATSKeywordLibrary)
+def keyword_library_changed(sender, instance, **kwargs):
+    """Invalidate compiled keyword matchers when the library is edited"""
+    bump_keyword_library_version()
+
+
+class CanonicalSkill(models.Model):
+    """Canonical skill shared by jobs, candidates and courses; referenced by integer id"""
+    
+    name = models.CharField(max_length=100, unique=True, help_text="Normalized (lowercase) skill name")
+    category = models.CharField(max_length=100, blank=True, default='')
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'ats_canonical_skills'
+        verbose_name = 'Canonical Skill'
+        verbose_name_plural = 'Canonical Skills'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    """Alternative spelling of a canonical skill (e.g. "reactjs" for "react")"""
+    
+    alias = models.CharField(max_length=100, unique=True, help_text="Normalized (lowercase) alias")
+    skill = models.ForeignKey(CanonicalSkill, on_delete=models.CASCADE, related_name='aliases')
+    
+    class Meta:
+        db_table = 'ats_skill_aliases'
+        verbose_name = 'Skill Alias'
+        verbose_name_plural = 'Skill Aliases'
+    
+    def __str__(self):
+        return f"{self.alias} -> {self.skill.name}"
+
+
+class UnresolvedSkill(models.Model):
+    """Skill name seen on a saved entity but missing from the taxonomy, waiting for curation"""
+    
+    name = models.CharField(max_length=100, unique=True, help_text="Normalized (lowercase) skill name")
+    occurrences = models.PositiveIntegerField(default=1)
+    first_seen_at = models.DateTimeField(default=timezone.now)
+    last_seen_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        db_table = 'ats_unresolved_skills'
+        verbose_name = 'Unresolved Skill'
+        verbose_name_plural = 'Unresolved Skills'
+        ordering = ['-occurrences', 'name']
+    
+    def __str__(self):
+        return f"{self.name} ({self.occurrences})"
+
+
+@receiver(post_save, sender=CanonicalSkill)
+@receiver(post_delete, sender=CanonicalSkill)
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def skill_taxonomy_changed(sender, instance, **kwargs):
+    """Invalidate cached alias lookups when the taxonomy is edited"""
+    bump_skill_taxonomy_version()
+
+
+class ExtractedDocument(models.Model):
+    """Extracted document text stored under the SHA-256 of the uploaded bytes"""
+    
+    sha256 = models.CharField(max_length=64, unique=True)
+    file_type = models.CharField(max_length=10)
+    text = models.TextField(blank=True, default='')
+    parsed = models.JSONField(default=dict, blank=True, help_text="Parsed structure where available (pages, truncation, errors)")
+    size_bytes = models.IntegerField(default=0, help_text="Size of the stored text in bytes")
+    
+    hit_count = models.IntegerField(default=0)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        db_table = 'ats_extracted_documents'
+        verbose_name = 'Extracted Document'
+        verbose_name_plural = 'Extracted Documents'
+
+
+class CacheVersion(models.Model):
+    """Named version number that invalidates compiled and cached data keyed by it"""
+    
+    name = models.CharField(max_length=100, unique=True)
+    version = models.BigIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'ats_cache_versions'
+        verbose_name = 'Cache Version'
+        verbose_name_plural = 'Cache Versions'
+    
+    def __str__(self):
+        return f"{self.name}: {self.version}"
+
+
 class ATSSettings(models.Model):
     """Global ATS settings and configuration"""
     
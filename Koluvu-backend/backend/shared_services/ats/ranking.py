@@ -0,0 +1,114 @@
+"""
+TF-IDF ranking of applicants against a job.
+
+All applicant resumes for a job are vectorized into one sparse TF-IDF matrix
+and scored with a single matrix-vector product against the job vector,
+instead of looping over applications in Python.
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+logger = logging.getLogger(__name__)
+
+
+def build_job_document(job) -> str:
+    """Flatten the job fields used for matching into a single text document"""
+    parts = [job.title or '', job.description or '', job.job_brief or '']
+
+    for field in ('skills', 'requirements', 'responsibilities'):
+        values = getattr(job, field, None)
+        if isinstance(values, list):
+            parts.extend(str(value) for value in values if value)
+
+    if job.ats_keywords:
+        parts.append(job.ats_keywords.replace(',', ' '))
+
+    # Skills carry the most signal, so count them twice
+    if isinstance(job.skills, list):
+        parts.extend(str(skill) for skill in job.skills if skill)
+
+    return '\n'.join(parts)
+
+
+def rank_documents(query_text: str, documents: Iterable[Tuple[Any, str]],
+                   top_terms: int = 10, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Rank documents by TF-IDF cosine similarity to a query document.
+
+    Args:
+        query_text: Text of the job (see ``build_job_document``)
+        documents: Iterable of ``(key, text)`` pairs, e.g. application id and resume text
+        top_terms: Number of per-term contributions to report for each document
+        limit: Return only this many best-scoring documents; every document is
+            still scored, but term contributions are computed for these only
+
+    Returns:
+        List of ``{'key', 'score', 'terms'}`` dictionaries ordered by descending
+        score, where ``score`` is 0-100 and ``terms`` lists the terms that
+        contributed most to it
+    """
+    documents = list(documents)
+    if not documents:
+        return []
+
+    keys = [key for key, _ in documents]
+    texts = [text or '' for _, text in documents]
+
+    vectorizer = TfidfVectorizer(
+        lowercase=True,
+        stop_words='english',
+        sublinear_tf=True,
+        ngram_range=(1, 2),
+        dtype=np.float32,
+    )
+    try:
+        matrix = vectorizer.fit_transform(texts)
+    except ValueError:
+        # Every document was empty or consisted only of stop words
+        return [{'key': key, 'score': 0.0, 'terms': []} for key in keys]
+
+    query = vectorizer.transform([query_text or ''])
+
+    # Rows are L2-normalized, so this product is the cosine similarity of
+    # every applicant with the job in one sparse operation
+    scores = np.asarray((matrix @ query.T).todense()).ravel()
+
+    if limit is not None and limit < len(scores):
+        # Select the top rows in linear time, then sort only those; rows tied
+        # with the last score are taken in input order, as the full sort does
+        threshold = -np.partition(-scores, limit - 1)[limit - 1] if limit > 0 else np.inf
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:max(limit - len(above), 0)]
+        top = np.concatenate([above, tied])
+        order = top[np.lexsort((top, -scores[top]))]
+    else:
+        order = np.argsort(-scores, kind='stable')
+
+    # Element-wise product keeps only the terms shared with the job
+    contributions = matrix[order].multiply(query).tocsr()
+    feature_names = vectorizer.get_feature_names_out()
+
+    results = []
+    for position, row in enumerate(order):
+        start, end = contributions.indptr[position], contributions.indptr[position + 1]
+        values = contributions.data[start:end]
+        indices = contributions.indices[start:end]
+
+        terms = []
+        if len(values):
+            best = np.argsort(-values, kind='stable')[:top_terms]
+            terms = [
+                {'term': feature_names[indices[i]], 'contribution': round(float(values[i]) * 100, 2)}
+                for i in best
+            ]
+
+        results.append({
+            'key': keys[row],
+            'score': round(float(scores[row]) * 100, 2),
+            'terms': terms,
+        })
+
+    return results
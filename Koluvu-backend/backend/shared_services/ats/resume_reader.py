@@ -0,0 +1,139 @@
+"""
+Bounded resume reading for the public ATS analyze endpoints.
+
+Uploads are size-checked before the body is read and again while it
+streams in. PDF and DOCX files are parsed in the extraction pool under its
+page, CPU-time, wall-clock and memory limits. Extracted text is shared through the
+document cache, and complete analysis results are cached per
+(resume, job description) pair.
+"""
+import hashlib
+import logging
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+# Imported absolutely so the app's two import paths share one worker pool
+from shared_services.ats.extraction import SUPPORTED_TYPES, get_extraction_pool
+
+from . import document_cache
+from .matcher import get_ats_cache, get_keyword_library_version
+from .upload_handlers import get_upload_digest, limit_upload_size
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeReadError(Exception):
+    """The uploaded resume could not be read; ``status`` is the HTTP status to return"""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def max_upload_bytes() -> int:
+    return getattr(settings, 'ATS_ANALYZE_MAX_UPLOAD_BYTES', 5 * 1024 * 1024)
+
+
+def _too_large() -> ResumeReadError:
+    limit = max_upload_bytes()
+    if limit >= 1024 * 1024:
+        size = f'{limit // (1024 * 1024)}MB'
+    else:
+        size = f'{max(limit // 1024, 1)}KB'
+    return ResumeReadError(f'Resume must be smaller than {size}', status=413)
+
+
+def prepare_upload(request):
+    """
+    Reject oversized requests from their Content-Length and cap the size of
+    each uploaded file while it streams in.
+
+    Must run before ``request.POST``/``request.FILES`` are accessed.
+    """
+    limit = max_upload_bytes()
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+
+    # Leave room for the job description and multipart framing
+    if content_length > limit + 64 * 1024:
+        raise _too_large()
+
+    limit_upload_size(request, limit)
+
+
+def check_upload_size(request, field_name='resume'):
+    """Raise ``ResumeReadError`` if the upload handler dropped an oversized file"""
+    if field_name in (getattr(request, 'oversized_uploads', None) or ()):
+        raise _too_large()
+
+
+def read_resume(request, resume_file, field_name='resume') -> Dict[str, Any]:
+    """
+    Extract the text of an uploaded resume.
+
+    Returns:
+        Dictionary with ``text`` and ``digest`` (SHA-256 of the upload)
+
+    Raises:
+        ResumeReadError: The file is unsupported or unreadable
+    """
+    file_type = resume_file.name.lower().rsplit('.', 1)[-1] if '.' in resume_file.name else ''
+    if file_type not in SUPPORTED_TYPES:
+        raise ResumeReadError('Only PDF, DOCX and TXT resumes are supported')
+
+    digest = get_upload_digest(request, field_name, resume_file)
+    result = document_cache.lookup(digest)
+    if result is None:
+        result = _extract(resume_file, file_type)
+        # Failures caused by load rather than by the document are not cached
+        document_cache.store(digest, file_type, result)
+
+    if not result.get('text'):
+        if result.get('error'):
+            logger.info(f"Resume extraction failed for {digest}: {result['error']}")
+        raise ResumeReadError('Could not extract any text from the resume', status=422)
+
+    return {'text': result['text'], 'digest': digest}
+
+
+def _extract(resume_file, file_type: str) -> Dict[str, Any]:
+    # Large uploads are already on disk; hand the path to the worker
+    # instead of copying the bytes through the pipe
+    if hasattr(resume_file, 'temporary_file_path'):
+        source = resume_file.temporary_file_path()
+    else:
+        source = resume_file.read()
+        resume_file.seek(0)
+
+    pool = get_extraction_pool()
+    future = pool.submit(source, file_type)
+    try:
+        # The worker enforces the extraction timeout itself; this only
+        # bounds the time spent waiting for a free worker
+        return future.result(timeout=pool.timeout * 2)
+    except FutureTimeoutError:
+        future.cancel()
+        return {'text': '', 'pages': None, 'truncated': False, 'error': 'extraction queue timed out',
+                'transient': True}
+    except Exception as e:
+        return {'text': '', 'pages': None, 'truncated': False, 'error': str(e), 'transient': True}
+
+
+def _analysis_cache_key(digest: str, job_description: str) -> str:
+    normalized = ' '.join(job_description.lower().split())
+    pair = hashlib.sha256(f'{digest}\0{normalized}'.encode('utf-8')).hexdigest()
+    return f'ats_analyze_result:{get_keyword_library_version()}:{pair}'
+
+
+def get_cached_analysis(digest: str, job_description: str) -> Optional[Dict[str, Any]]:
+    """Analysis result previously computed for the same resume and job description"""
+    return get_ats_cache().get(_analysis_cache_key(digest, job_description))
+
+
+def cache_analysis(digest: str, job_description: str, results: Dict[str, Any]):
+    timeout = getattr(settings, 'ATS_ANALYZE_RESULT_CACHE_TTL', 60 * 60)
+    get_ats_cache().set(_analysis_cache_key(digest, job_description), results, timeout)
@@ -1,11 +1,28 @@
 import re
 import json
-from typing import Dict, List, Any
+import hashlib
+from typing import Dict, List, Any, Tuple, Union
+from django.apps import apps
 from django.conf import settings
+from django.db import DatabaseError
 import logging
 
+from .matcher import (
+    KeywordMatcher, get_matcher, get_ats_cache, get_keyword_library_version, normalize_keyword
+)
+
 logger = logging.getLogger(__name__)
 
+# Compiled library matcher, rebuilt whenever the keyword library version changes
+_library_matcher = {'version': None, 'matcher': None}
+
+# Weight of a job keyword by the field it came from (highest wins)
+JOB_KEYWORD_WEIGHTS = {
+    'skills': 3,
+    'ats_keywords': 2,
+    'requirements': 1,
+}
+
 
 class ATSAnalyzerService:
     """Service class for ATS document analysis"""
@@ -34,6 +51,13 @@ class ATSAnalyzerService:
             # Clean and prepare text
             cleaned_text = self._clean_text(document_text)
             
+            # Re-submissions of the same text reuse the earlier result until
+            # the keyword library changes
+            cache_key = self._analysis_cache_key(cleaned_text, analysis_type)
+            cached = get_ats_cache().get(cache_key)
+            if cached is not None:
+                return cached
+            
             # Find keywords
             keywords_found = self._extract_keywords(cleaned_text)
             keywords_missing = self._identify_missing_keywords(keywords_found, analysis_type)
@@ -47,13 +71,15 @@ class ATSAnalyzerService:
             # Generate suggestions
             suggestions = self._generate_suggestions(score, keywords_found, keywords_missing, analysis_type)
             
-            return {
+            results = {
                 'score': round(score, 2),
                 'keywords_found': keywords_found,
                 'keywords_missing': keywords_missing,
                 'feedback': feedback,
                 'suggestions': suggestions
             }
+            get_ats_cache().set(cache_key, results, getattr(settings, 'ATS_ANALYSIS_CACHE_TTL', 24 * 60 * 60))
+            return results
             
         except Exception as e:
             logger.error(f"Error in ATS analysis: {str(e)}")
@@ -76,18 +102,36 @@ class ATSAnalyzerService:
         # Convert to lowercase for analysis
         return text.lower()
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """Extract relevant keywords from text"""
-        found_keywords = []
-        
-        for keyword in self.common_keywords:
-            if keyword.lower() in text:
-                found_keywords.append(keyword)
+    def _analysis_cache_key(self, cleaned_text: str, analysis_type: str) -> str:
+        """Memoization key for ``analyze_document`` results"""
+        text_hash = hashlib.sha256(cleaned_text.encode('utf-8')).hexdigest()
+        return f'ats_analysis:{get_keyword_library_version()}:{analysis_type}:{text_hash}'
+    
+    def _get_library_matcher(self) -> KeywordMatcher:
+        """Matcher compiled from the common keywords plus ATSKeywordLibrary rows"""
+        version = get_keyword_library_version()
+        if _library_matcher['version'] != version or _library_matcher['matcher'] is None:
+            keywords = list(self.common_keywords)
+            try:
+                ATSKeywordLibrary = apps.get_model('ats', 'ATSKeywordLibrary')
+                for library_keywords in ATSKeywordLibrary.objects.values_list('keywords', flat=True):
+                    if isinstance(library_keywords, list):
+                        keywords.extend(str(k) for k in library_keywords if k)
+            except (LookupError, DatabaseError) as e:
+                logger.warning(f"ATS keyword library unavailable: {str(e)}")
+            
+            _library_matcher['matcher'] = KeywordMatcher(keywords)
+            _library_matcher['version'] = version
         
-        # Additional keyword extraction logic could be added here
-        # (e.g., NLP, industry-specific terms, etc.)
+        return _library_matcher['matcher']
+    
+    def _extract_keywords(self, text: str) -> List[str]:
+        """Extract relevant keywords from text in a single pass"""
+        matcher = self._get_library_matcher()
+        hits = matcher.find(text)
         
-        return found_keywords
+        # Keep the library order so results are stable between runs
+        return [keyword for keyword in matcher.keywords if keyword in hits]
     
     def _identify_missing_keywords(self, found_keywords: List[str], analysis_type: str) -> List[str]:
         """Identify important missing keywords based on analysis type"""
@@ -214,6 +258,56 @@ class ATSAnalyzerService:
         else:
             return 'Needs Improvement'
     
+    def build_job_keyword_profile(self, job) -> Tuple[Dict[str, int], str]:
+        """
+        Compile the keyword profile a resume is matched against for a job
+        
+        Args:
+            job: Job model instance with requirements and skills
+            
+        Returns:
+            Tuple of (normalized keyword -> weight, version hash of the profile)
+        """
+        weights = {}
+        
+        def add(keyword, weight):
+            keyword = normalize_keyword(keyword)
+            if keyword:
+                weights[keyword] = max(weights.get(keyword, 0), weight)
+        
+        # Get skills from job
+        if isinstance(getattr(job, 'skills', None), list):
+            for skill in job.skills:
+                if skill:
+                    add(skill, JOB_KEYWORD_WEIGHTS['skills'])
+        
+        # Get requirements keywords
+        if isinstance(getattr(job, 'requirements', None), list):
+            for req in job.requirements:
+                if req:
+                    for word in str(req).lower().split():
+                        if len(word) > 3:
+                            add(word.strip('.,!?;:'), JOB_KEYWORD_WEIGHTS['requirements'])
+        
+        # Get ATS keywords if available
+        if getattr(job, 'ats_keywords', ''):
+            for keyword in job.ats_keywords.split(','):
+                add(keyword, JOB_KEYWORD_WEIGHTS['ats_keywords'])
+        
+        profile = dict(sorted(weights.items()))
+        version = hashlib.sha256(json.dumps(profile, sort_keys=True).encode('utf-8')).hexdigest()
+        return profile, version
+    
+    def get_job_keywords(self, job) -> Dict[str, int]:
+        """
+        Keyword weights for a job, read from the profile persisted by Job.save
+        and only compiled on the fly for jobs saved before profiles existed
+        """
+        profile = getattr(job, 'ats_keyword_profile', None)
+        if profile and getattr(job, 'ats_keyword_version', ''):
+            return profile
+        return self.build_job_keyword_profile(job)[0]
+    
     def match_resume_to_job(self, resume_text: str, job) -> Dict[str, Any]:
         """
         Match resume against specific job requirements
@@ -226,40 +320,45 @@ class ATSAnalyzerService:
             Dictionary with match score and keyword analysis
         """
         try:
-            resume_text_lower = resume_text.lower()
-            
-            # Extract keywords from job
-            job_keywords = set()
-            
-            # Get skills from job
-            if hasattr(job, 'skills') and isinstance(job.skills, list):
-                job_keywords.update([skill.lower().strip() for skill in job.skills if skill])
+            job_keywords = self.get_job_keywords(job)
+        except Exception as e:
+            logger.error(f"Error collecting job keywords: {str(e)}")
+            job_keywords = []
+        
+        return self.match_resume_to_keywords(resume_text, job_keywords)
+    
+    def match_resume_to_keywords(self, resume_text: str,
+                                 job_keywords: Union[Dict[str, int], List[str]]) -> Dict[str, Any]:
+        """
+        Match resume against precomputed job keywords
+        
+        Args:
+            resume_text: Extracted text from resume
+            job_keywords: Keyword weights from ``get_job_keywords``, or a plain
+                keyword list where every keyword has the same weight
             
-            # Get requirements keywords
-            if hasattr(job, 'requirements') and isinstance(job.requirements, list):
-                for req in job.requirements:
-                    if req:
-                        words = str(req).lower().split()
-                        job_keywords.update([w.strip('.,!?;:') for w in words if len(w) > 3])
+        Returns:
+            Dictionary with match score and keyword analysis
+        """
+        try:
+            resume_text_lower = self._clean_text(resume_text)
             
-            # Get ATS keywords if available
-            if hasattr(job, 'ats_keywords') and job.ats_keywords:
-                ats_words = job.ats_keywords.split(',')
-                job_keywords.update([w.strip().lower() for w in ats_words if w.strip()])
+            if not isinstance(job_keywords, dict):
+                job_keywords = {keyword: 1 for keyword in job_keywords}
             
-            # Match keywords
-            matched_keywords = []
-            missing_keywords = []
+            # Match all job keywords in one pass over the resume
+            matcher = get_matcher(job_keywords)
+            keyword_counts = matcher.counts(resume_text_lower)
+            weights = {k: job_keywords.get(k, 1) for k in matcher.keywords}
             
-            for keyword in job_keywords:
-                if keyword in resume_text_lower:
-                    matched_keywords.append(keyword)
-                else:
-                    missing_keywords.append(keyword)
+            # Heaviest, then most frequent matches first
+            matched_keywords = sorted(keyword_counts, key=lambda k: (-weights[k], -keyword_counts[k], k))
+            missing_keywords = sorted((k for k in weights if k not in keyword_counts), key=lambda k: (-weights[k], k))
             
-            # Calculate match score
-            if len(job_keywords) > 0:
-                match_percentage = (len(matched_keywords) / len(job_keywords)) * 100
+            # Calculate weighted match score
+            total_weight = sum(weights.values())
+            if total_weight > 0:
+                match_percentage = sum(weights[k] for k in keyword_counts) / total_weight * 100
             else:
                 match_percentage = 50.0  # Default if no keywords
             
@@ -278,7 +377,8 @@ class ATSAnalyzerService:
                 'ats_score': round(final_score, 2),
                 'matching_keywords': matched_keywords[:20],  # Top 20
                 'missing_keywords': missing_keywords[:10],   # Top 10 missing
-                'total_job_keywords': len(job_keywords),
+                'keyword_counts': keyword_counts,
+                'total_job_keywords': len(weights),
                 'matched_count': len(matched_keywords),
                 'match_percentage': round(match_percentage, 2)
             }
@@ -289,6 +389,7 @@ class ATSAnalyzerService:
                 'ats_score': 0,
                 'matching_keywords': [],
                 'missing_keywords': [],
+                'keyword_counts': {},
                 'total_job_keywords': 0,
                 'matched_count': 0,
                 'match_percentage': 0
@@ -0,0 +1,238 @@
+"""
+Canonical skill taxonomy.
+
+Free-text skills from jobs, candidate profiles and courses are resolved to
+integer ids of ``CanonicalSkill`` rows when they are written, through a
+dictionary of normalized names and aliases. Each entity keeps a sorted list
+of those ids, so matching two entities is an integer set intersection
+instead of a case-insensitive substring compare.
+
+Saving an entity never adds to the taxonomy: unknown skills are counted in
+``UnresolvedSkill`` for curation (``curate_skills`` command), and entities
+pick up promoted skills when ``backfill_skill_ids`` runs.
+"""
+import re
+from typing import Dict, Iterable, List, Optional
+
+from django.apps import apps
+from django.db import DatabaseError
+from django.db.models import F
+from django.utils import timezone
+
+from .matcher import normalize_keyword
+from .versions import bump_version, get_version
+
+SKILL_TAXONOMY_VERSION_KEY = 'ats_skill_taxonomy_version'
+
+MAX_SKILL_LENGTH = 100
+
+# Seed aliases for common spellings; canonical name first
+DEFAULT_SKILL_ALIASES = {
+    'javascript': ['js', 'java script', 'ecmascript', 'es6'],
+    'typescript': ['ts'],
+    'react': ['react.js', 'reactjs', 'react js'],
+    'vue': ['vue.js', 'vuejs'],
+    'angular': ['angular.js', 'angularjs'],
+    'node.js': ['node', 'nodejs', 'node js'],
+    'python': ['python3', 'python 3'],
+    'postgresql': ['postgres', 'psql'],
+    'mongodb': ['mongo'],
+    'kubernetes': ['k8s'],
+    'aws': ['amazon web services'],
+    'gcp': ['google cloud', 'google cloud platform'],
+    'azure': ['microsoft azure'],
+    'machine learning': ['ml'],
+    'artificial intelligence': ['ai'],
+    'ci/cd': ['cicd', 'ci cd', 'continuous integration'],
+    'c#': ['csharp', 'c sharp'],
+    'c++': ['cpp'],
+    'go': ['golang'],
+    '.net': ['dotnet', 'dot net'],
+    'rest': ['rest api', 'restful', 'restful api'],
+    'excel': ['ms excel', 'microsoft excel'],
+}
+
+# Compiled alias -> id dictionary, rebuilt when the taxonomy version changes
+_skill_index = {'version': None, 'aliases': {}}
+
+_SPLIT_RE = re.compile(r'[,;\n|]+')
+
+
+def normalize_skill(value) -> str:
+    """Normalize a free-text skill the way taxonomy names and aliases are stored"""
+    return normalize_keyword(value).strip(' ,;:*•')
+
+
+def split_skills(value) -> List[str]:
+    """
+    Split a skills value into individual skills.
+
+    Accepts JSON lists (of strings or ``{'name': ...}`` objects) and
+    comma-, semicolon- or newline-separated text.
+    """
+    if not value:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        items = []
+        for item in value:
+            if isinstance(item, dict):
+                item = item.get('name') or item.get('skill') or ''
+            items.extend(split_skills(str(item)) if isinstance(item, str) else [str(item)])
+        return items
+    return [part for part in _SPLIT_RE.split(str(value)) if part.strip()]
+
+
+def get_skill_taxonomy_version() -> int:
+    return get_version(SKILL_TAXONOMY_VERSION_KEY)
+
+
+def bump_skill_taxonomy_version() -> int:
+    """Invalidate alias dictionaries compiled from the taxonomy"""
+    return bump_version(SKILL_TAXONOMY_VERSION_KEY)
+
+
+def get_skill_index() -> Dict[str, int]:
+    """Mapping of every normalized skill name and alias to its canonical id"""
+    version = get_skill_taxonomy_version()
+    if _skill_index['version'] != version:
+        CanonicalSkill = apps.get_model('ats', 'CanonicalSkill')
+        SkillAlias = apps.get_model('ats', 'SkillAlias')
+
+        aliases = dict(CanonicalSkill.objects.values_list('name', 'id'))
+        # Names take precedence over aliases that happen to collide with them
+        for alias, skill_id in SkillAlias.objects.values_list('alias', 'skill_id'):
+            aliases.setdefault(alias, skill_id)
+
+        _skill_index['aliases'] = aliases
+        _skill_index['version'] = version
+
+    return _skill_index['aliases']
+
+
+def resolve_skill_id(value, create: bool = False, index: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """
+    Canonical id for one free-text skill, or None if it is unknown.
+
+    Unknown skills become new canonical skills when ``create`` is set; only
+    curation does that (see ``curate_skills``). ``index`` is a dictionary
+    from ``get_skill_index`` already loaded by the caller.
+    """
+    name = normalize_skill(value)
+    if not name or len(name) > MAX_SKILL_LENGTH:
+        return None
+
+    if index is None:
+        index = get_skill_index()
+    skill_id = index.get(name)
+    if skill_id is not None or not create:
+        return skill_id
+
+    CanonicalSkill = apps.get_model('ats', 'CanonicalSkill')
+    previous_version = _skill_index['version']
+    skill, _ = CanonicalSkill.objects.get_or_create(name=name)
+    index[name] = skill.id
+
+    # Creating the skill bumped the version; when nothing else changed in
+    # between, keep the index we just extended instead of reloading it
+    if get_skill_taxonomy_version() == (previous_version or 0) + 1:
+        _skill_index['version'] = previous_version + 1
+    return skill.id
+
+
+def resolve_skill_ids(values: Iterable, create: bool = False) -> List[int]:
+    """
+    Sorted, de-duplicated canonical ids for a skills value (see
+    ``split_skills``). Unknown skills are queued for curation unless
+    ``create`` adds them to the taxonomy.
+    """
+    ids = set()
+    unknown = []
+    try:
+        index = get_skill_index()
+        for value in split_skills(values):
+            skill_id = resolve_skill_id(value, create=create, index=index)
+            if skill_id is not None:
+                ids.add(skill_id)
+            else:
+                unknown.append(value)
+        queue_unknown_skills(unknown)
+    except (LookupError, DatabaseError):
+        # Taxonomy tables are not migrated yet
+        return []
+    return sorted(ids)
+
+
+def canonical_skill_id(value) -> Optional[int]:
+    """Canonical id for a single skill being saved; unknown skills are queued for curation"""
+    try:
+        skill_id = resolve_skill_id(value)
+        if skill_id is None:
+            queue_unknown_skills([value])
+    except (LookupError, DatabaseError):
+        return None
+    return skill_id
+
+
+def queue_unknown_skills(values: Iterable) -> int:
+    """Count occurrences of skills missing from the taxonomy; returns the number of distinct names"""
+    names = {normalize_skill(value) for value in values}
+    names = {name for name in names if name and len(name) <= MAX_SKILL_LENGTH}
+    if not names:
+        return 0
+
+    UnresolvedSkill = apps.get_model('ats', 'UnresolvedSkill')
+    now = timezone.now()
+    seen = set(UnresolvedSkill.objects.filter(name__in=names).values_list('name', flat=True))
+    if seen:
+        UnresolvedSkill.objects.filter(name__in=seen).update(occurrences=F('occurrences') + 1, last_seen_at=now)
+    UnresolvedSkill.objects.bulk_create(
+        [UnresolvedSkill(name=name, first_seen_at=now, last_seen_at=now) for name in sorted(names - seen)],
+        ignore_conflicts=True,
+    )
+    return len(names)
+
+
+def skill_overlap(skill_ids: Iterable[int], other_skill_ids: Iterable[int]) -> List[int]:
+    """Sorted canonical ids present in both id lists"""
+    return sorted(set(skill_ids or ()) & set(other_skill_ids or ()))
+
+
+def skill_spellings(value, limit: int = 10) -> List[str]:
+    """Canonical name and aliases of the skill a free-text value resolves to"""
+    try:
+        skill_id = resolve_skill_id(value, create=False)
+    except (LookupError, DatabaseError):
+        return []
+    if skill_id is None:
+        return []
+    spellings = [alias for alias, alias_skill_id in get_skill_index().items() if alias_skill_id == skill_id]
+    return sorted(spellings, key=len)[:limit]
+
+
+def skill_names(skill_ids: Iterable[int]) -> List[str]:
+    """Canonical names for a list of ids, in the same order"""
+    skill_ids = list(skill_ids or ())
+    CanonicalSkill = apps.get_model('ats', 'CanonicalSkill')
+    names = dict(CanonicalSkill.objects.filter(id__in=skill_ids).values_list('id', 'name'))
+    return [names[skill_id] for skill_id in skill_ids if skill_id in names]
+
+
+def seed_default_aliases(registry=None) -> int:
+    """
+    Create the built-in canonical skills and aliases; returns the number of
+    aliases added. ``registry`` is the app registry (historical in migrations).
+    """
+    registry = registry or apps
+    CanonicalSkill = registry.get_model('ats', 'CanonicalSkill')
+    SkillAlias = registry.get_model('ats', 'SkillAlias')
+
+    created = 0
+    for name, aliases in DEFAULT_SKILL_ALIASES.items():
+        skill, _ = CanonicalSkill.objects.get_or_create(name=normalize_skill(name))
+        for alias in aliases:
+            alias = normalize_skill(alias)
+            if CanonicalSkill.objects.filter(name=alias).exists():
+                continue
+            _, was_created = SkillAlias.objects.get_or_create(alias=alias, defaults={'skill': skill})
+            created += int(was_created)
+    return created
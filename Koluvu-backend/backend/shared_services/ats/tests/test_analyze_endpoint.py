@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+
+# The URLconf loads the ATS app under its INSTALLED_APPS path
+ANALYZE = 'backend.shared_services.ats.services.ATSAnalyzerService.analyze_document'
+RESULT = {'score': 80, 'feedback': {}, 'keywords_found': ['python'], 'keywords_missing': [], 'suggestions': []}
+
+
+class AnalyzeEndpointTestCase(TestCase):
+    url = '/api/shared/ats/analyze/'
+
+    def setUp(self):
+        caches['ats'].clear()
+
+    def post(self, content, name='resume.txt', job_description='Python developer'):
+        resume = SimpleUploadedFile(name, content, content_type='application/octet-stream')
+        return self.client.post(self.url, {'resume': resume, 'job_description': job_description})
+
+    def test_text_is_extracted_and_analyzed(self):
+        with mock.patch(ANALYZE, return_value=RESULT) as analyze:
+            res = self.post(b'Experienced Python developer')
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['score'], 80)
+        document_text = analyze.call_args.kwargs['document_text']
+        self.assertIn('Experienced Python developer', document_text)
+        self.assertIn('Target Job Description:\nPython developer', document_text)
+
+    def test_identical_requests_reuse_the_analysis(self):
+        with mock.patch(ANALYZE, return_value=RESULT) as analyze:
+            self.post(b'Experienced Python developer')
+            res = self.post(b'Experienced Python developer')
+            self.post(b'Experienced Python developer', job_description='Go developer')
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(analyze.call_count, 2)
+
+    def test_unsupported_type_is_rejected(self):
+        res = self.post(b'MZ', name='resume.exe')
+        self.assertEqual(res.status_code, 400)
+
+    @override_settings(ATS_ANALYZE_MAX_UPLOAD_BYTES=1024)
+    def test_oversized_upload_is_rejected(self):
+        res = self.post(b'x' * 4096)
+        self.assertEqual(res.status_code, 413)
+
+    def test_empty_document_is_unprocessable(self):
+        res = self.post(b'   ')
+        self.assertEqual(res.status_code, 422)
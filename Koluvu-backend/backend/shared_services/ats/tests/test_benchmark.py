@@ -0,0 +1,51 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..benchmark import build_corpus, compare_to_baseline, run_benchmark
+from ..extraction import extract_document
+
+
+class BenchmarkCorpusTestCase(TestCase):
+    def test_corpus_is_deterministic(self):
+        first = build_corpus(resumes=3, jobs=2, seed=7, formats=('txt',))
+        second = build_corpus(resumes=3, jobs=2, seed=7, formats=('txt',))
+        self.assertEqual(first['texts'], second['texts'])
+        self.assertNotEqual(first['texts'], build_corpus(resumes=3, jobs=2, seed=8, formats=('txt',))['texts'])
+
+    def test_rendered_documents_extract_back_to_their_text(self):
+        corpus = build_corpus(resumes=2, jobs=1, formats=('pdf', 'docx'))
+        for file_type in ('pdf', 'docx'):
+            result = extract_document(corpus['files'][file_type][0], file_type, timeout=0)
+            self.assertIsNone(result['error'])
+            first_line = corpus['texts'][0].splitlines()[0]
+            self.assertIn(first_line.split()[0], result['text'])
+
+    def test_every_stage_is_measured(self):
+        corpus = build_corpus(resumes=4, jobs=2, formats=('txt',))
+        results = run_benchmark(corpus, memory_sample=2)
+        stages = [row['stage'] for row in results]
+        self.assertEqual(stages, [
+            'extract_document[txt]', 'analyze_document', 'analyze_document[memoized]', 'match_resume_to_job',
+        ])
+        for row in results:
+            self.assertEqual(row['documents'], 4)
+            self.assertLessEqual(row['p50_ms'], row['p99_ms'])
+
+    def test_baseline_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            out = StringIO()
+            call_command('benchmark_ats', resumes=3, jobs=1, stages=['match'], memory_sample=0,
+                         save_baseline=path, stdout=out)
+            with open(path) as handle:
+                baseline = json.load(handle)
+            self.assertEqual(baseline['parameters']['resumes'], 3)
+
+            comparison = compare_to_baseline(path, baseline['results'])
+            self.assertEqual(comparison[0]['stage'], 'match_resume_to_job')
+            self.assertEqual(comparison[0]['per_second_change_pct'], 0.0)
@@ -0,0 +1,88 @@
+import shutil
+import tempfile
+from io import StringIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from .. import document_cache
+
+
+def counters_cache(backend, **options):
+    return {**settings.CACHES, 'counters': {'BACKEND': backend, **options}}
+
+
+class DocumentCacheTestCase(TestCase):
+    def test_results_and_document_failures_are_cached(self):
+        document_cache.store('a' * 64, 'pdf', {'text': 'resume', 'pages': 1, 'truncated': False, 'error': None})
+        document_cache.store('b' * 64, 'pdf', {'text': '', 'pages': None, 'truncated': True,
+                                               'error': 'extraction timed out'})
+
+        self.assertEqual(document_cache.lookup('a' * 64)['text'], 'resume')
+        self.assertEqual(document_cache.lookup('b' * 64)['error'], 'extraction timed out')
+
+    def test_transient_failures_are_not_cached(self):
+        document_cache.store('c' * 64, 'pdf', {'text': '', 'pages': None, 'truncated': False,
+                                               'error': 'worker crashed', 'transient': True})
+
+        ExtractedDocument = apps.get_model('ats', 'ExtractedDocument')
+        self.assertFalse(ExtractedDocument.objects.filter(sha256='c' * 64).exists())
+        self.assertIsNone(document_cache.lookup('c' * 64))
+
+    def test_size_is_summed_from_the_table(self):
+        document_cache.store('d' * 64, 'txt', {'text': 'abcd', 'pages': None, 'truncated': False, 'error': None})
+        document_cache.store('e' * 64, 'txt', {'text': 'ef', 'pages': None, 'truncated': False, 'error': None})
+        # Rows removed by another process are reflected immediately
+        apps.get_model('ats', 'ExtractedDocument').objects.filter(sha256='e' * 64).delete()
+
+        self.assertEqual(document_cache.current_size(), 4)
+        self.assertEqual(document_cache.stats()['size_bytes'], 4)
+
+    @override_settings(ATS_DOCUMENT_CACHE_MAX_BYTES=10)
+    def test_eviction_removes_least_recently_used(self):
+        document_cache.store('f' * 64, 'txt', {'text': 'x' * 6, 'pages': None, 'truncated': False, 'error': None})
+        document_cache.store('g' * 64, 'txt', {'text': 'y' * 6, 'pages': None, 'truncated': False, 'error': None})
+
+        self.assertIsNone(document_cache.lookup('f' * 64))
+        self.assertEqual(document_cache.lookup('g' * 64)['text'], 'y' * 6)
+
+    @override_settings(CACHES=counters_cache('django.core.cache.backends.locmem.LocMemCache'))
+    def test_lookups_are_not_counted_in_a_process_local_cache(self):
+        document_cache.lookup('h' * 64)
+
+        stats = document_cache.stats()
+        self.assertIsNone(stats['hits'])
+        self.assertIsNone(stats['misses'])
+
+
+class DocumentCacheCountersTestCase(TestCase):
+    def setUp(self):
+        # The file based cache stands in for a shared backend such as Redis
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared = override_settings(CACHES=counters_cache(
+            'django.core.cache.backends.filebased.FileBasedCache', LOCATION=location
+        ))
+        shared.enable()
+        self.addCleanup(shared.disable)
+
+    def test_hits_and_misses_are_counted_in_the_shared_cache(self):
+        document_cache.store('a' * 64, 'txt', {'text': 'resume', 'pages': None, 'truncated': False, 'error': None})
+        document_cache.lookup('a' * 64)
+        document_cache.lookup('a' * 64)
+        document_cache.lookup('b' * 64)
+
+        stats = document_cache.stats(reset=True)
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_ratio']), (2, 1, 0.6667))
+        self.assertEqual((stats['entries'], stats['size_bytes']), (1, 6))
+        self.assertEqual(document_cache.stats()['hits'], 0)
+
+    def test_stats_command(self):
+        document_cache.lookup('c' * 64)
+
+        out = StringIO()
+        call_command('document_cache_stats', stdout=out)
+        self.assertIn('hits=0 misses=1 hit_ratio=0.00%', out.getvalue())
+        self.assertIn('entries=0 size=0', out.getvalue())
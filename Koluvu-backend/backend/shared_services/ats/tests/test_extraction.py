@@ -0,0 +1,61 @@
+import multiprocessing
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..extraction import ResumeExtractionPool, _init_worker, extract_document
+
+
+class ExtractionWorkerTestCase(SimpleTestCase):
+    def test_initializer_caps_address_space(self):
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker, initargs=(256,),
+        ) as executor:
+            soft, _ = executor.submit(resource.getrlimit, resource.RLIMIT_AS).result(timeout=60)
+        self.assertEqual(soft, 256 * 1024 * 1024)
+
+    def test_initializer_caps_cpu_time(self):
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker, initargs=(0, 120),
+        ) as executor:
+            soft, _ = executor.submit(resource.getrlimit, resource.RLIMIT_CPU).result(timeout=60)
+        self.assertEqual(soft, 120)
+
+    def test_cpu_time_limit_stops_a_busy_parser(self):
+        def spin(source):
+            while True:
+                pass
+
+        with mock.patch('shared_services.ats.extraction._extract_txt', side_effect=spin):
+            result = extract_document(b'text', 'txt', timeout=30, cpu_timeout=0.2)
+        self.assertEqual(result['error'], 'CPU time limit exceeded')
+        self.assertTrue(result['truncated'])
+
+    def test_pool_extracts_under_the_cap(self):
+        pool = ResumeExtractionPool(workers=1, max_address_space_mb=256)
+        try:
+            result = pool.submit(b'plain resume text', 'txt').result(timeout=60)
+            self.assertEqual(result['text'], 'plain resume text')
+            self.assertIsNone(result['error'])
+        finally:
+            pool._get_executor().shutdown()
+
+    def test_allocation_past_the_cap_is_reported(self):
+        with mock.patch('shared_services.ats.extraction._extract_txt', side_effect=MemoryError):
+            result = extract_document(b'text', 'txt', timeout=0)
+        self.assertEqual(result['error'], 'address space limit exceeded')
+        self.assertEqual(result['text'], '')
+
+    def test_resume_reader_shares_the_process_pool(self):
+        # The app is installed as backend.shared_services.ats
+        from shared_services.ats import extraction
+        from backend.shared_services.ats import resume_reader
+        self.assertIs(resume_reader.get_extraction_pool, extraction.get_extraction_pool)
+
+    def test_unsupported_type(self):
+        result = extract_document(b'', 'exe', timeout=0)
+        self.assertIn('unsupported', result['error'])
@@ -0,0 +1,24 @@
+from django.test import SimpleTestCase
+
+from ..matcher import KeywordMatcher, get_matcher
+
+
+class KeywordMatcherTestCase(SimpleTestCase):
+    def test_respects_word_boundaries(self):
+        matcher = KeywordMatcher(['sql', 'git', 'c++', 'node.js'])
+        hits = matcher.find('nosql and digital skills; sql, c++ and node.js daily')
+        self.assertEqual(set(hits), {'sql', 'c++', 'node.js'})
+
+    def test_positions_and_counts(self):
+        matcher = KeywordMatcher(['machine learning', 'learning', 'python'])
+        text = 'python for machine learning. learning python'
+        hits = matcher.find(text)
+        self.assertEqual(hits['python'], [0, 38])
+        self.assertEqual(hits['machine learning'], [11])
+        self.assertEqual(matcher.counts(text)['learning'], 2)
+
+    def test_keywords_are_normalized(self):
+        matcher = get_matcher(['  Machine   Learning ', 'PYTHON', ''])
+        self.assertEqual(matcher.keywords, ['machine learning', 'python'])
+        self.assertIn('Python', matcher)
+        self.assertIs(matcher, get_matcher(['python', 'machine learning']))
@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+
+from ..ranking import rank_documents
+
+
+class RankDocumentsTestCase(SimpleTestCase):
+    documents = [
+        (1, 'marketing manager with social media campaigns'),
+        (2, 'python django developer building rest apis'),
+        (3, 'senior python developer, django and postgres'),
+        (4, 'accountant handling payroll'),
+        (5, 'python scripting for data analysis'),
+    ]
+    query = 'python django developer'
+
+    def test_orders_by_score(self):
+        ranking = rank_documents(self.query, self.documents)
+        self.assertEqual(len(ranking), 5)
+        scores = [entry['score'] for entry in ranking]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertIn(ranking[0]['key'], {2, 3})
+        self.assertTrue(ranking[0]['terms'])
+
+    def test_limit_matches_full_ranking(self):
+        full = rank_documents(self.query, self.documents)
+        for limit in (0, 1, 2, 4, 5, 10):
+            self.assertEqual(rank_documents(self.query, self.documents, limit=limit), full[:limit])
+
+    def test_ties_keep_input_order(self):
+        documents = [(key, 'accountant') for key in range(6)]
+        ranking = rank_documents('python', documents, limit=3)
+        self.assertEqual([entry['key'] for entry in ranking], [0, 1, 2])
@@ -0,0 +1,45 @@
+from io import StringIO
+
+from django.apps import apps
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..skills import (
+    canonical_skill_id, get_skill_taxonomy_version, resolve_skill_ids, seed_default_aliases,
+    skill_names, skill_overlap, split_skills,
+)
+
+
+class SkillTaxonomyTestCase(TestCase):
+    def setUp(self):
+        seed_default_aliases()
+
+    def test_split_skills(self):
+        self.assertEqual(split_skills('Python, Django;\nReact'), ['Python', ' Django', 'React'])
+        self.assertEqual(split_skills(['Go', {'name': 'Rust'}]), ['Go', 'Rust'])
+
+    def test_aliases_resolve_to_the_same_id(self):
+        job_ids = resolve_skill_ids(['ReactJS', 'k8s'])
+        candidate_ids = resolve_skill_ids('react.js, Kubernetes, Excel')
+        self.assertEqual(job_ids, sorted(job_ids))
+        self.assertEqual(skill_overlap(job_ids, candidate_ids), job_ids)
+        self.assertEqual(sorted(skill_names(job_ids)), ['kubernetes', 'react'])
+
+    def test_unknown_skills_are_queued_not_created(self):
+        CanonicalSkill = apps.get_model('ats', 'CanonicalSkill')
+        UnresolvedSkill = apps.get_model('ats', 'UnresolvedSkill')
+        skills = CanonicalSkill.objects.count()
+
+        self.assertEqual(resolve_skill_ids('Python, Unheard Of Skill'), resolve_skill_ids('python'))
+        self.assertIsNone(canonical_skill_id('unheard of  skill'))
+        self.assertEqual(CanonicalSkill.objects.count(), skills)
+        self.assertEqual(UnresolvedSkill.objects.get(name='unheard of skill').occurrences, 2)
+
+    def test_curation_promotes_queued_skills(self):
+        resolve_skill_ids('Brand New Skill, Reactjs Hooks')
+        version = get_skill_taxonomy_version()
+        call_command('curate_skills', promote=['brand new skill'], alias=['reactjs hooks=react'], stdout=StringIO())
+
+        self.assertGreater(get_skill_taxonomy_version(), version)
+        self.assertEqual(sorted(skill_names(resolve_skill_ids('brand  new skill, ReactJS Hooks'))), ['brand new skill', 'react'])
+        self.assertFalse(apps.get_model('ats', 'UnresolvedSkill').objects.exists())
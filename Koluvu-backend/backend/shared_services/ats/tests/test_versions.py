@@ -0,0 +1,30 @@
+from django.apps import apps
+from django.test import TestCase
+
+from ..matcher import get_keyword_library_version
+from ..services import ATSAnalyzerService
+from ..versions import bump_version, get_version
+
+
+class CacheVersionTestCase(TestCase):
+    def test_versions_are_created_and_bumped(self):
+        version = get_version('test_version')
+        self.assertEqual(get_version('test_version'), version)
+        self.assertEqual(bump_version('test_version'), version + 1)
+        self.assertEqual(bump_version('other_version') + 1, bump_version('other_version'))
+
+    def test_bumps_from_other_processes_are_seen(self):
+        version = get_keyword_library_version()
+        # Another worker editing the library only touches the shared row
+        CacheVersion = apps.get_model('ats', 'CacheVersion')
+        CacheVersion.objects.filter(name='ats_keyword_library_version').update(version=version + 5)
+        self.assertEqual(get_keyword_library_version(), version + 5)
+
+    def test_library_edits_invalidate_analysis_results(self):
+        analyzer = ATSAnalyzerService()
+        key = analyzer._analysis_cache_key('python developer', 'RESUME')
+        ATSKeywordLibrary = apps.get_model('ats', 'ATSKeywordLibrary')
+        ATSKeywordLibrary.objects.create(industry='IT', role_category='Backend', keywords=['elixir'])
+
+        self.assertNotEqual(analyzer._analysis_cache_key('python developer', 'RESUME'), key)
+        self.assertIn('elixir', analyzer._extract_keywords('elixir and python'))
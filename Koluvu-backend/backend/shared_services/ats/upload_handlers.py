@@ -0,0 +1,100 @@
+"""
+Upload handler that hashes files while they stream in.
+
+Installed first in ``FILE_UPLOAD_HANDLERS`` so every chunk passes through it
+before the memory/temporary-file handlers store it. The SHA-256 of each
+uploaded file is recorded on the request as ``request.upload_digests``,
+keyed by form field name, so the document cache can be consulted without
+reading the upload a second time.
+"""
+import hashlib
+
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile
+
+
+class SHA256UploadHandler(FileUploadHandler):
+    """Compute the SHA-256 of each uploaded file as its chunks arrive"""
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self._hasher = None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self._hasher = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self._hasher.update(raw_data)
+        # Pass the chunk on to the handler that actually stores the file
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.request is not None:
+            digests = getattr(self.request, 'upload_digests', None)
+            if digests is None:
+                digests = {}
+                self.request.upload_digests = digests
+            digests[self.field_name] = self._hasher.hexdigest()
+        # Let the next handler return the stored file
+        return None
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Drop any uploaded file larger than ``max_bytes`` as it streams in.
+
+    Oversized files are skipped rather than stored, so they never occupy
+    more than one chunk of memory. The names of skipped fields are recorded
+    in ``request.oversized_uploads``.
+    """
+
+    def __init__(self, request=None, max_bytes=0):
+        super().__init__(request)
+        self.max_bytes = max_bytes
+        self._received = 0
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self._received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self._received += len(raw_data)
+        if self.max_bytes and self._received > self.max_bytes:
+            if self.request is not None:
+                oversized = getattr(self.request, 'oversized_uploads', None)
+                if oversized is None:
+                    oversized = set()
+                    self.request.oversized_uploads = oversized
+                oversized.add(self.field_name)
+            raise SkipFile()
+        return raw_data
+
+    def file_complete(self, file_size):
+        return None
+
+
+def limit_upload_size(request, max_bytes):
+    """
+    Install ``MaxSizeUploadHandler`` for this request.
+
+    Must be called before ``request.POST``/``request.FILES`` are accessed,
+    which also means the view has to be CSRF exempt.
+    """
+    request.upload_handlers.insert(0, MaxSizeUploadHandler(request, max_bytes))
+
+
+def get_upload_digest(request, field_name, uploaded_file) -> str:
+    """
+    SHA-256 of an uploaded file, taken from the streaming handler when it
+    ran, otherwise computed chunk by chunk from the stored upload.
+    """
+    digests = getattr(request, 'upload_digests', None) or {}
+    digest = digests.get(field_name)
+    if digest:
+        return digest
+
+    hasher = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        hasher.update(chunk)
+    uploaded_file.seek(0)
+    return hasher.hexdigest()
@@ -10,13 +10,21 @@ from .views import ATSProfileViewSet, ATSAnalysisViewSet, ATSKeywordLibraryViewS
 def analyze_resume(request):
     """Simple analyze endpoint"""
     from .services import ATSAnalyzerService
+    from .resume_reader import (
+        ResumeReadError, prepare_upload, check_upload_size, read_resume,
+        get_cached_analysis, cache_analysis
+    )
     import json
     
     try:
+        # Bound the upload before the request body is parsed
+        prepare_upload(request)
+        
         print(f"Request method: {request.method}")
         print(f"Request content type: {request.content_type}")
         print(f"Request FILES: {list(request.FILES.keys())}")
         print(f"Request POST: {dict(request.POST)}")
+        check_upload_size(request)
         
         # Handle file upload - check both FILES and POST data
         resume_file = request.FILES.get('resume')
@@ -41,14 +49,14 @@ def analyze_resume(request):
         if not job_description.strip():
             return JsonResponse({'error': 'Job description is required'}, status=400)
         
-        # Extract text from file (basic implementation)
-        if resume_file.name.endswith('.txt'):
-            try:
-                document_text = resume_file.read().decode('utf-8')
-            except:
-                document_text = f"Resume file: {resume_file.name}"
-        else:
-            document_text = f"Resume file: {resume_file.name}"
+        # Extract text from the resume (PDF/DOCX are parsed in the extraction pool)
+        resume = read_resume(request, resume_file)
+        document_text = resume['text']
+        
+        # Identical resume and job description pairs reuse the earlier result
+        results = get_cached_analysis(resume['digest'], job_description)
+        if results is not None:
+            return JsonResponse(results)
             
         # Perform analysis
         analyzer = ATSAnalyzerService()
@@ -59,9 +67,12 @@ def analyze_resume(request):
             analysis_type='RESUME',
             user_profile=None
         )
+        cache_analysis(resume['digest'], job_description, results)
         
         return JsonResponse(results)
         
+    except ResumeReadError as e:
+        return JsonResponse({'error': str(e)}, status=e.status)
     except Exception as e:
         return JsonResponse({'error': f'Analysis failed: {str(e)}'}, status=500)
 
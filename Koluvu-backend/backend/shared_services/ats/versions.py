@@ -0,0 +1,37 @@
+"""
+Invalidation versions shared by every process.
+
+Compiled matchers, alias dictionaries and cached results are keyed by a
+version number kept in a database row, so an edit made through one worker
+invalidates them in every other worker whatever cache backend is
+configured. Reading a version is a single primary-key-sized lookup.
+"""
+import time
+
+from django.apps import apps
+from django.db.models import F
+
+
+def _model():
+    return apps.get_model('ats', 'CacheVersion')
+
+
+def get_version(name: str) -> int:
+    """Current value of a named version, created on first use"""
+    CacheVersion = _model()
+    version = CacheVersion.objects.filter(name=name).values_list('version', flat=True).first()
+    if version is None:
+        # A fresh, time-based version never collides with results cached
+        # under a version whose row has since been lost
+        row, _ = CacheVersion.objects.get_or_create(name=name, defaults={'version': int(time.time() * 1000)})
+        version = row.version
+    return version
+
+
+def bump_version(name: str) -> int:
+    """Increment a named version, invalidating everything keyed by it"""
+    CacheVersion = _model()
+    if not CacheVersion.objects.filter(name=name).update(version=F('version') + 1):
+        get_version(name)
+        CacheVersion.objects.filter(name=name).update(version=F('version') + 1)
+    return get_version(name)
@@ -12,6 +12,10 @@ from .serializers import (
     ATSKeywordLibrarySerializer, ATSSettingsSerializer
 )
 from .services import ATSAnalyzerService
+from .resume_reader import (
+    ResumeReadError, prepare_upload, check_upload_size, read_resume,
+    get_cached_analysis, cache_analysis
+)
 
 
 class ATSProfileViewSet(viewsets.ModelViewSet):
@@ -104,10 +108,15 @@ class ATSAnalysisViewSet(viewsets.ModelViewSet):
     def analyze(self, request):
         """Analyze resume/document endpoint"""
         try:
+            # Bound the upload before the request body is parsed
+            prepare_upload(request)
+            
             # Handle file upload
             resume_file = request.FILES.get('resume')
             job_description = request.data.get('job_description', '')
             
+            check_upload_size(request)
+            
             if not resume_file:
                 return Response(
                     {'error': 'Resume file is required'}, 
@@ -120,20 +129,12 @@ class ATSAnalysisViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Extract text from file (basic implementation)
+            # Extract text from the resume (PDF/DOCX are parsed in the extraction pool)
             try:
-                if resume_file.name.endswith('.txt'):
-                    document_text = resume_file.read().decode('utf-8')
-                else:
-                    # For now, just use the filename as placeholder
-                    # In production, you'd use libraries like PyPDF2, python-docx, etc.
-                    document_text = f"Resume file: {resume_file.name}\n"
-                    
-            except Exception as e:
-                return Response(
-                    {'error': f'Error reading file: {str(e)}'}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+                resume = read_resume(request, resume_file)
+            except ResumeReadError as e:
+                return Response({'error': str(e)}, status=e.status)
+            document_text = resume['text']
             
             # Get or create ATS profile for user
             if request.user.is_authenticated:
@@ -145,18 +146,22 @@ class ATSAnalysisViewSet(viewsets.ModelViewSet):
                 # For anonymous users, create a temporary analysis
                 ats_profile = None
             
-            # Perform ATS analysis using service
-            analyzer = ATSAnalyzerService()
-            
-            # Combine resume text with job description for analysis
-            combined_text = f"{document_text}\n\nTarget Job Description:\n{job_description}"
-            
-            # Run the analysis
-            results = analyzer.analyze_document(
-                document_text=combined_text,
-                analysis_type='RESUME',
-                user_profile=ats_profile
-            )
+            # Identical resume and job description pairs reuse the earlier result
+            results = get_cached_analysis(resume['digest'], job_description)
+            if results is None:
+                # Perform ATS analysis using service
+                analyzer = ATSAnalyzerService()
+                
+                # Combine resume text with job description for analysis
+                combined_text = f"{document_text}\n\nTarget Job Description:\n{job_description}"
+                
+                # Run the analysis
+                results = analyzer.analyze_document(
+                    document_text=combined_text,
+                    analysis_type='RESUME',
+                    user_profile=ats_profile
+                )
+                cache_analysis(resume['digest'], job_description, results)
             
             # If user is authenticated, save the analysis
             if ats_profile:
@@ -178,6 +183,8 @@ class ATSAnalysisViewSet(viewsets.ModelViewSet):
             
             return Response(results, status=status.HTTP_200_OK)
             
+        except ResumeReadError as e:
+            return Response({'error': str(e)}, status=e.status)
         except Exception as e:
             return Response(
                 {'error': f'Analysis failed: {str(e)}'}, 
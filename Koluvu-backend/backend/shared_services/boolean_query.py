@@ -0,0 +1,325 @@
+# shared_services/boolean_query.py
+
+"""
+Boolean search query parser and compiler.
+
+Queries such as ``React AND (TypeScript OR "Type Script") NOT Junior`` are
+parsed into an AST with the usual precedence (NOT binds tighter than AND,
+AND tighter than OR; adjacent terms are ANDed) and compiled into a single
+Django ``Q`` predicate over one precomputed, normalized search text
+column, so a query never adds joins. On PostgreSQL the same AST also
+compiles to a full-text ``SearchQuery`` that narrows the rows through a
+GIN index before that exact predicate is checked.
+"""
+import re
+from typing import Callable, Iterable, List, Optional
+
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Q
+
+MAX_QUERY_LENGTH = 500
+MAX_TERMS = 20
+MAX_DEPTH = 8
+MAX_TERM_LENGTH = 100
+
+_TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"?|([^\s()"]+))')
+_OPERATORS = {'AND': 'AND', '&&': 'AND', '&': 'AND', 'OR': 'OR', '||': 'OR', '|': 'OR', 'NOT': 'NOT', '!': 'NOT'}
+_SEARCH_TEXT_RE = re.compile(r'[^a-z0-9+#.]+')
+_LEXEME_RE = re.compile(r'[a-z0-9]')
+
+
+class BooleanQueryError(ValueError):
+    """The query cannot be parsed or exceeds a complexity limit"""
+
+
+def normalize_search_text(*values) -> str:
+    """
+    Normalize text for token-bounded containment search.
+
+    The result is lowercase, word tokens separated by single spaces, with a
+    leading and trailing space, so ``' java '`` matches the word "java" but
+    not "javascript". ``+``, ``#`` and inner dots are kept for "c++", "c#"
+    and "node.js".
+    """
+    tokens = []
+    for value in values:
+        if not value:
+            continue
+        for token in _SEARCH_TEXT_RE.split(str(value).lower()):
+            token = token.rstrip('.')
+            if token:
+                tokens.append(token)
+    return f" {' '.join(tokens)} " if tokens else ''
+
+
+class Term:
+    def __init__(self, text: str):
+        self.text = text
+
+    def __eq__(self, other):
+        return isinstance(other, Term) and other.text == self.text
+
+    def __repr__(self):
+        return f'Term({self.text!r})'
+
+
+class Not:
+    def __init__(self, child):
+        self.child = child
+
+    def __eq__(self, other):
+        return isinstance(other, Not) and other.child == self.child
+
+    def __repr__(self):
+        return f'Not({self.child!r})'
+
+
+class Operation:
+    """AND/OR over two or more children"""
+
+    def __init__(self, operator: str, children: list):
+        self.operator = operator
+        self.children = children
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Operation)
+            and other.operator == self.operator
+            and other.children == self.children
+        )
+
+    def __repr__(self):
+        return f'{self.operator}({", ".join(map(repr, self.children))})'
+
+
+def tokenize(query: str) -> List[tuple]:
+    """Split a query into ``(kind, value)`` tokens: LPAREN, RPAREN, OP, TERM"""
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = _TOKEN_RE.match(query, position)
+        if not match or match.end() == position:
+            break
+        position = match.end()
+        lparen, rparen, phrase, word = match.groups()
+        if lparen:
+            tokens.append(('LPAREN', '('))
+        elif rparen:
+            tokens.append(('RPAREN', ')'))
+        elif phrase is not None:
+            if phrase.strip():
+                tokens.append(('TERM', phrase))
+        elif word.upper() in _OPERATORS:
+            tokens.append(('OP', _OPERATORS[word.upper()]))
+        elif word.startswith('-') and len(word) > 1:
+            # "-junior" is shorthand for NOT junior
+            tokens.append(('OP', 'NOT'))
+            tokens.append(('TERM', word[1:]))
+        else:
+            tokens.append(('TERM', word))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser: or := and (OR and)*; and := not ([AND] not)*; not := NOT not | primary"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        if not self.tokens:
+            raise BooleanQueryError('Query is empty')
+        node = self.parse_or()
+        if self.position < len(self.tokens):
+            raise BooleanQueryError(f'Unexpected "{self.peek()[1]}"')
+        return node
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.peek() == ('OP', 'OR'):
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Operation('OR', children)
+
+    def parse_and(self):
+        children = [self.parse_not()]
+        while True:
+            kind, value = self.peek()
+            if kind == 'OP' and value == 'AND':
+                self.take()
+            elif not (kind in ('TERM', 'LPAREN') or (kind == 'OP' and value == 'NOT')):
+                break
+            children.append(self.parse_not())
+        return children[0] if len(children) == 1 else Operation('AND', children)
+
+    def parse_not(self):
+        if self.peek() == ('OP', 'NOT'):
+            self.take()
+            return Not(self.parse_not())
+        return self.parse_primary()
+
+    def parse_primary(self):
+        kind, value = self.take()
+        if kind == 'TERM':
+            return Term(value)
+        if kind == 'LPAREN':
+            self.depth += 1
+            if self.depth > MAX_DEPTH:
+                raise BooleanQueryError(f'Query is nested more than {MAX_DEPTH} levels deep')
+            node = self.parse_or()
+            if self.take()[0] != 'RPAREN':
+                raise BooleanQueryError('Missing closing parenthesis')
+            self.depth -= 1
+            return node
+        if kind is None:
+            raise BooleanQueryError('Query ends unexpectedly')
+        raise BooleanQueryError(f'Unexpected "{value}"')
+
+
+def _simplify(node):
+    """Normalize terms, flatten nested AND/OR, collapse double negation and drop duplicates"""
+    if isinstance(node, Term):
+        text = normalize_search_text(node.text).strip()
+        if not text:
+            raise BooleanQueryError(f'"{node.text}" is not a searchable term')
+        if len(text) > MAX_TERM_LENGTH:
+            raise BooleanQueryError(f'Terms must be at most {MAX_TERM_LENGTH} characters')
+        return Term(text)
+    if isinstance(node, Not):
+        child = _simplify(node.child)
+        return child.child if isinstance(child, Not) else Not(child)
+
+    children = []
+    for child in node.children:
+        child = _simplify(child)
+        flattened = child.children if isinstance(child, Operation) and child.operator == node.operator else [child]
+        for item in flattened:
+            if item not in children:
+                children.append(item)
+    return children[0] if len(children) == 1 else Operation(node.operator, children)
+
+
+def _count_terms(node) -> int:
+    if isinstance(node, Term):
+        return 1
+    if isinstance(node, Not):
+        return _count_terms(node.child)
+    return sum(_count_terms(child) for child in node.children)
+
+
+def _has_positive_term(node, negated=False) -> bool:
+    """Whether the query can only match rows that contain some term (no pure negations)"""
+    if isinstance(node, Term):
+        return not negated
+    if isinstance(node, Not):
+        return _has_positive_term(node.child, not negated)
+    if node.operator == 'AND' and not negated:
+        return any(_has_positive_term(child) for child in node.children)
+    return all(_has_positive_term(child, negated) for child in node.children)
+
+
+def parse_boolean_query(query: str):
+    """
+    Parse and validate a boolean search query.
+
+    Raises:
+        BooleanQueryError: The query is malformed, too long, too deeply
+            nested, has too many terms or only excludes terms
+    """
+    query = (query or '').strip()
+    if len(query) > MAX_QUERY_LENGTH:
+        raise BooleanQueryError(f'Query must be at most {MAX_QUERY_LENGTH} characters')
+
+    node = _simplify(_Parser(tokenize(query)).parse())
+
+    if _count_terms(node) > MAX_TERMS:
+        raise BooleanQueryError(f'Query may contain at most {MAX_TERMS} terms')
+    if not _has_positive_term(node):
+        # A query made only of exclusions would scan the whole candidate pool
+        raise BooleanQueryError('Query must include at least one term that is not excluded')
+    return node
+
+
+def _term_variants(text: str, expand=None) -> List[str]:
+    variants = [text]
+    if expand:
+        for variant in expand(text):
+            variant = normalize_search_text(variant).strip()
+            if variant and variant not in variants:
+                variants.append(variant)
+    return variants
+
+
+def compile_query(node, field: str = 'search_text',
+                  expand: Optional[Callable[[str], Iterable[str]]] = None) -> Q:
+    """
+    Compile a parsed query into one ``Q`` over a normalized search text field.
+
+    ``expand`` may map a term to equivalent spellings (e.g. skill aliases);
+    a term then matches any of them.
+    """
+    if isinstance(node, Term):
+        predicate = Q()
+        for variant in _term_variants(node.text, expand):
+            predicate |= Q(**{f'{field}__contains': f' {variant} '})
+        return predicate
+    if isinstance(node, Not):
+        return ~compile_query(node.child, field, expand)
+
+    predicate = compile_query(node.children[0], field, expand)
+    for child in node.children[1:]:
+        compiled = compile_query(child, field, expand)
+        predicate = predicate & compiled if node.operator == 'AND' else predicate | compiled
+    return predicate
+
+
+def compile_search_query(node, expand: Optional[Callable[[str], Iterable[str]]] = None,
+                         config: str = 'simple') -> Optional[SearchQuery]:
+    """
+    Compile a parsed query into a full-text ``SearchQuery`` that matches a
+    superset of the rows ``compile_query`` matches, or ``None`` when no
+    useful superset exists.
+
+    The text search parser splits tokens such as "c++" or "node.js"
+    differently from ``normalize_search_text``, so this only narrows the
+    candidates; the exact predicate must still be applied. Negations are
+    left to the exact predicate for the same reason.
+    """
+    if isinstance(node, Term):
+        query = None
+        for variant in _term_variants(node.text, expand):
+            if not _LEXEME_RE.search(variant):
+                # No lexemes: an empty tsquery would match nothing
+                return None
+            phrase = SearchQuery(variant, search_type='phrase', config=config)
+            query = phrase if query is None else query | phrase
+        return query
+    if isinstance(node, Not):
+        return None
+
+    compiled = [compile_search_query(child, expand, config) for child in node.children]
+    if node.operator == 'OR':
+        if any(query is None for query in compiled):
+            return None
+        query = compiled[0]
+        for child in compiled[1:]:
+            query = query | child
+        return query
+
+    query = None
+    for child in compiled:
+        if child is not None:
+            query = child if query is None else query & child
+    return query
+
@@ -0,0 +1,255 @@
+"""
+Write-behind counters.
+
+Hot counter columns (job views and applications, shared resume views,
+feedback template usage) are not updated per event. ``increment`` adds to
+a pending delta in the counters cache, and ``flush`` periodically writes
+all pending deltas with one ``F()`` UPDATE per distinct delta, so a popular
+row is locked once per flush instead of once per event. Reads add the
+pending delta to the stored value (``pending`` / ``PendingCountersMixin``).
+
+Objects with a pending delta are registered in time buckets of
+``COUNTER_FLUSH_INTERVAL`` seconds the first time their delta leaves zero.
+A flush only reads buckets that closed at least one interval ago, so every
+registration in them is complete. It claims each delta by decrementing it
+before the UPDATE and adds the claims back if the UPDATE fails, so a delta
+is written exactly once. ``flush`` runs inline on the first increment of
+each interval and from the ``flush_counters`` command.
+
+Buffering needs a counters cache shared by every server process (set
+``COUNTERS_CACHE_URL``): with a process-local cache, the deltas of a
+process that stops receiving requests would never be flushed and reads
+would only see the deltas of their own process. Without one, every
+increment is a direct ``F()`` UPDATE.
+"""
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Iterable
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+from django.db.models import F
+from rest_framework import serializers
+
+from .shared_cache import is_shared_cache
+
+logger = logging.getLogger(__name__)
+
+# Counter name -> (app label, model, field)
+COUNTERS = {
+    'job_views': ('employer_dashboard', 'Job', 'views_count'),
+    'job_applications': ('employer_dashboard', 'Job', 'applications_count'),
+    'resume_share_views': ('employee_dashboard', 'ResumeSharingLink', 'view_count'),
+    'feedback_template_usage': ('employer_dashboard', 'FeedbackTemplate', 'usage_count'),
+}
+
+KEY_PREFIX = 'counter'
+
+# Registration buckets outlive a stopped flusher by this long
+BUCKET_TTL = 24 * 60 * 60
+
+# Buckets looked back on when no flush has run yet
+INITIAL_LOOKBACK = 120
+
+
+def get_counters_cache():
+    return caches['counters'] if 'counters' in settings.CACHES else cache
+
+
+def buffering_enabled() -> bool:
+    """Increments are buffered only in a counters cache shared by every server process"""
+    return is_shared_cache('counters')
+
+
+def flush_interval() -> int:
+    return max(getattr(settings, 'COUNTER_FLUSH_INTERVAL', 5), 1)
+
+
+def _pending_key(name: str, pk) -> str:
+    return f'{KEY_PREFIX}:{name}:pending:{pk}'
+
+
+def _bucket() -> int:
+    return int(time.time() // flush_interval())
+
+
+def _register(name: str, pk):
+    """Record that ``pk`` has a pending delta, in the current bucket"""
+    counters_cache = get_counters_cache()
+    bucket = _bucket()
+    count_key = f'{KEY_PREFIX}:{name}:bucket:{bucket}'
+    counters_cache.add(count_key, 0, BUCKET_TTL)
+    slot = counters_cache.incr(count_key)
+    counters_cache.set(f'{count_key}:{slot}', pk, BUCKET_TTL)
+
+
+def increment(name: str, pk, delta: int = 1):
+    """Add ``delta`` to a counter of the object with primary key ``pk``"""
+    if name not in COUNTERS:
+        raise KeyError(f'Unknown counter: {name}')
+    if not buffering_enabled():
+        _update(name, [pk], delta)
+        return
+
+    counters_cache = get_counters_cache()
+    key = _pending_key(name, pk)
+    counters_cache.add(key, 0, None)
+    if counters_cache.incr(key, delta) == delta:
+        # The delta just left zero; flushes put it back there
+        _register(name, pk)
+
+    if counters_cache.add(f'{KEY_PREFIX}:{name}:flush_due', 1, flush_interval()):
+        flush(name)
+
+
+def pending(name: str, pks: Iterable) -> Dict:
+    """Pending (not yet flushed) delta per primary key, for keys that have one"""
+    pks = list(pks)
+    if not pks or not buffering_enabled():
+        return {}
+    values = get_counters_cache().get_many([_pending_key(name, pk) for pk in pks])
+    deltas = {}
+    for pk in pks:
+        delta = values.get(_pending_key(name, pk))
+        if delta:
+            deltas[pk] = delta
+    return deltas
+
+
+def pending_total(name: str, pks: Iterable) -> int:
+    """Sum of the pending deltas of several objects"""
+    return sum(pending(name, pks).values())
+
+
+def _dirty_keys(name: str):
+    """
+    Primary keys registered in the buckets that closed at least one
+    interval ago, and the last of those buckets
+    """
+    counters_cache = get_counters_cache()
+    last_bucket = _bucket() - 2
+    flushed = counters_cache.get(f'{KEY_PREFIX}:{name}:flushed')
+    first_bucket = flushed + 1 if flushed is not None else last_bucket - INITIAL_LOOKBACK
+
+    count_keys = [f'{KEY_PREFIX}:{name}:bucket:{bucket}' for bucket in range(first_bucket, last_bucket + 1)]
+    counts = counters_cache.get_many(count_keys)
+    slot_keys = [f'{count_key}:{slot}' for count_key, count in counts.items() for slot in range(1, count + 1)]
+    pks = set(counters_cache.get_many(slot_keys).values())
+    return pks, last_bucket, list(counts) + slot_keys
+
+
+def _update(name: str, pks, delta: int):
+    app_label, model_name, field = COUNTERS[name]
+    model = apps.get_model(app_label, model_name)
+    model.objects.filter(pk__in=pks).update(**{field: F(field) + delta})
+
+
+def _claim(name: str, pks) -> Dict:
+    """
+    Take the pending deltas of ``pks`` out of the cache; returns the
+    claimed delta per primary key. Increments made meanwhile stay pending
+    and are registered again for the next flush.
+    """
+    counters_cache = get_counters_cache()
+    claimed = {}
+    try:
+        for pk, delta in pending(name, pks).items():
+            remaining = counters_cache.decr(_pending_key(name, pk), delta)
+            claimed[pk] = delta
+            if remaining > 0:
+                _register(name, pk)
+    except Exception:
+        _restore(name, claimed)
+        raise
+    return claimed
+
+
+def _restore(name: str, claimed: Dict):
+    """Put claimed deltas back after a failed flush"""
+    counters_cache = get_counters_cache()
+    for pk, delta in claimed.items():
+        key = _pending_key(name, pk)
+        counters_cache.add(key, 0, None)
+        if counters_cache.incr(key, delta) == delta:
+            _register(name, pk)
+
+
+def flush(name: str) -> int:
+    """Write the pending deltas of one counter; returns the number of rows updated"""
+    if not buffering_enabled():
+        return 0
+
+    counters_cache = get_counters_cache()
+    lock_key = f'{KEY_PREFIX}:{name}:flush_lock'
+    if not counters_cache.add(lock_key, 1, 60):
+        return 0
+
+    try:
+        pks, last_bucket, bucket_keys = _dirty_keys(name)
+        deltas = _claim(name, pks)
+
+        by_delta = defaultdict(list)
+        for pk, delta in deltas.items():
+            by_delta[delta].append(pk)
+
+        try:
+            with transaction.atomic():
+                for delta, ids in by_delta.items():
+                    _update(name, ids, delta)
+        except Exception:
+            _restore(name, deltas)
+            raise
+
+        # Every delta registered in these buckets is written or pending again
+        counters_cache.set(f'{KEY_PREFIX}:{name}:flushed', last_bucket, None)
+        counters_cache.delete_many(bucket_keys)
+    except Exception:
+        logger.exception(f'Failed to flush {name} counters')
+        return 0
+    finally:
+        counters_cache.delete(lock_key)
+
+    return len(deltas)
+
+
+def flush_all() -> Dict[str, int]:
+    return {name: flush(name) for name in COUNTERS}
+
+
+class PendingCountersMixin:
+    """
+    Serializer mixin adding pending deltas to counter fields; set
+    ``pending_counters`` to a field -> counter name mapping, and
+    ``list_serializer_class = PendingCountersListSerializer`` in Meta so
+    lists look up the deltas of all their objects at once.
+    """
+    pending_counters = {}
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        prefetched = getattr(self, '_pending_deltas', None)
+        for field, name in self.pending_counters.items():
+            if data.get(field) is None:
+                continue
+            if prefetched is not None:
+                delta = prefetched.get(name, {}).get(instance.pk, 0)
+            else:
+                delta = pending(name, [instance.pk]).get(instance.pk, 0)
+            data[field] += delta
+        return data
+
+
+class PendingCountersListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        instances = list(data.all() if hasattr(data, 'all') else data)
+        pks = [instance.pk for instance in instances]
+        self.child._pending_deltas = {
+            name: pending(name, pks) for name in set(self.child.pending_counters.values())
+        }
+        try:
+            return super().to_representation(instances)
+        finally:
+            self.child._pending_deltas = None
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 
 
@@ -28,6 +30,7 @@ class Skill(models.Model):
     ]
     
     name = models.CharField(max_length=100)
+    canonical_skill_id = models.PositiveIntegerField(null=True, blank=True, db_index=True)
     category = models.ForeignKey(SkillCategory, on_delete=models.CASCADE, related_name='skills')
     description = models.TextField(blank=True)
     difficulty_level = models.CharField(max_length=20, choices=DIFFICULTY_LEVELS)
@@ -45,6 +48,15 @@ class Skill(models.Model):
     class Meta:
         db_table = 'skills'
         unique_together = ['name', 'category']
+    
+    def save(self, *args, **kwargs):
+        """Resolve the skill name to its canonical skill id"""
+        from shared_services.ats.skills import canonical_skill_id
+        self.canonical_skill_id = canonical_skill_id(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'canonical_skill_id'}
+        super().save(*args, **kwargs)
 
 
 class Course(models.Model):
@@ -79,6 +91,7 @@ class Course(models.Model):
     
     # Relationships
     skills = models.ManyToManyField(Skill, related_name='courses', help_text="Skills taught in this course")
+    skill_ids = models.JSONField(default=list, blank=True, help_text="Sorted canonical ids of the skills taught")
     instructor = models.ForeignKey(User, on_delete=models.CASCADE, related_name='courses_taught')
     
     # Pricing and enrollment
@@ -104,6 +117,19 @@ class Course(models.Model):
         ordering = ['-created_at']
 
 
+@receiver(m2m_changed, sender=Course.skills.through)
+def course_skills_changed(sender, instance, action, reverse, pk_set=None, **kwargs):
+    """Keep the course's canonical skill ids in sync with its skills"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    courses = Course.objects.filter(id__in=pk_set or ()) if reverse else [instance]
+    for course in courses:
+        skill_ids = sorted(set(
+            course.skills.filter(canonical_skill_id__isnull=False).values_list('canonical_skill_id', flat=True)
+        ))
+        Course.objects.filter(id=course.id).update(skill_ids=skill_ids)
+
+
 class CourseModule(models.Model):
     """Modules within a course"""
     
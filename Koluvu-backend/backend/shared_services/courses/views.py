@@ -14,6 +14,7 @@ from .serializers import (
     EnrollCourseSerializer, UserSkillProfileSerializer, CourseReviewSerializer,
     CourseReviewCreateSerializer
 )
+from shared_services.ats.skills import resolve_skill_id
 
 
 class SkillCategoryViewSet(viewsets.ReadOnlyModelViewSet):
@@ -72,7 +73,12 @@ class CourseViewSet(viewsets.ModelViewSet):
         # Apply filters
         skill = self.request.query_params.get('skill')
         if skill:
-            queryset = queryset.filter(skills__name__icontains=skill)
+            # Match through the canonical taxonomy so aliases ("reactjs") find "React" courses
+            skill_id = resolve_skill_id(skill, create=False)
+            if skill_id:
+                queryset = queryset.filter(skills__canonical_skill_id=skill_id).distinct()
+            else:
+                queryset = queryset.filter(skills__name__icontains=skill)
         
         difficulty = self.request.query_params.get('difficulty')
         if difficulty:
@@ -0,0 +1,132 @@
+"""
+Offline geocoding and radius search.
+
+Free-text locations ("Bangalore, Karnataka", "Hybrid - Gurgaon") are
+resolved to coordinates through the bundled gazetteer
+(``data/gazetteer.csv``: city names, aliases and coordinates) without any
+network call, when jobs and profiles are saved. Radius searches first
+narrow rows to the bounding box of the circle, a range scan on an index
+over the coordinates, and then compute the exact great-circle (haversine)
+distance for the rows in the box only.
+"""
+import csv
+import math
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import ASin, Cos, Least, Power, Radians, Sin, Sqrt
+
+GAZETTEER_PATH = Path(__file__).resolve().parent / 'data' / 'gazetteer.csv'
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Longest place name tried when scanning a location word by word
+MAX_NAME_WORDS = 3
+
+_SEGMENT_RE = re.compile(r'[,;/|()\[\]]+|\s+-\s+|\s+or\s+')
+_NON_WORD_RE = re.compile(r'[^\w\s-]+')
+
+
+class Place(NamedTuple):
+    name: str
+    region: str
+    country: str
+    latitude: float
+    longitude: float
+
+
+def normalize_place(value) -> str:
+    return ' '.join(_NON_WORD_RE.sub(' ', str(value or '').lower()).split())
+
+
+@lru_cache(maxsize=1)
+def gazetteer() -> Dict[str, Place]:
+    """Normalized name and alias -> place"""
+    places = {}
+    with open(GAZETTEER_PATH, newline='', encoding='utf-8') as handle:
+        for row in csv.DictReader(handle):
+            place = Place(
+                row['name'], row['region'], row['country'],
+                float(row['latitude']), float(row['longitude']),
+            )
+            for name in [row['name'], *row['aliases'].split('|')]:
+                name = normalize_place(name)
+                if name:
+                    places.setdefault(name, place)
+    return places
+
+
+def lookup_place(location) -> Optional[Place]:
+    """
+    Place of a free-text location: the first comma (or slash, dash, ...)
+    separated part naming a known place, else the first known place name
+    found in the text
+    """
+    places = gazetteer()
+    text = str(location or '').lower()
+    segments = [normalize_place(segment) for segment in _SEGMENT_RE.split(text)]
+    for segment in segments:
+        if segment in places:
+            return places[segment]
+
+    words = normalize_place(text.replace('-', ' ')).split()
+    for start in range(len(words)):
+        for length in range(min(MAX_NAME_WORDS, len(words) - start), 0, -1):
+            place = places.get(' '.join(words[start:start + length]))
+            if place is not None:
+                return place
+    return None
+
+
+def geocode(location) -> Optional[Tuple[float, float]]:
+    """``(latitude, longitude)`` of a free-text location, or None if unknown"""
+    place = lookup_place(location)
+    return (place.latitude, place.longitude) if place else None
+
+
+def haversine_km(lat1, lon1, lat2, lon2) -> float:
+    """Great-circle distance between two points in kilometres"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """
+    ``(min_lat, max_lat, min_lon, max_lon)`` of a box containing the
+    circle. The longitude range is the whole globe when the circle reaches
+    a pole; boxes crossing the antimeridian are not split and may miss
+    points on its far side.
+    """
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = latitude - delta_lat, latitude + delta_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    delta_lon = math.degrees(math.asin(min(1.0, math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(latitude)))))
+    return min_lat, max_lat, max(longitude - delta_lon, -180.0), min(longitude + delta_lon, 180.0)
+
+
+def haversine_expression(latitude, longitude, lat_field='latitude', lon_field='longitude'):
+    """Database expression of the distance in kilometres from a point to the row's coordinates"""
+    lat = Value(math.radians(latitude), output_field=FloatField())
+    lon = Value(math.radians(longitude), output_field=FloatField())
+    cos_lat = Value(math.cos(math.radians(latitude)), output_field=FloatField())
+    row_lat = Radians(F(lat_field))
+    row_lon = Radians(F(lon_field))
+    a = Power(Sin((row_lat - lat) / 2), 2) + cos_lat * Cos(row_lat) * Power(Sin((row_lon - lon) / 2), 2)
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Least(Value(1.0), Sqrt(a)), output_field=FloatField())
+
+
+def within_radius(queryset, latitude, longitude, radius_km, lat_field='latitude', lon_field='longitude'):
+    """Rows of ``queryset`` within ``radius_km`` of a point, annotated with ``distance_km``"""
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    return queryset.filter(**{
+        f'{lat_field}__range': (min_lat, max_lat),
+        f'{lon_field}__range': (min_lon, max_lon),
+    }).annotate(
+        distance_km=haversine_expression(latitude, longitude, lat_field, lon_field)
+    ).filter(distance_km__lte=radius_km)
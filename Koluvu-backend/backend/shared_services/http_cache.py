@@ -0,0 +1,67 @@
+"""
+HTTP conditional request helpers.
+
+Read endpoints derive a weak ETag and a Last-Modified date from the
+``updated_at`` of the rows they render, which costs one narrow query. When
+the client already holds that version (``If-None-Match`` or
+``If-Modified-Since``), the view answers 304 without loading or
+serializing anything. ETags are weak because counters such as view counts
+are part of the bodies but do not touch ``updated_at``.
+"""
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+def public_cache_control():
+    """
+    Shared caches may store the response, but revalidate it with the
+    origin after ``HTTP_PUBLIC_MAX_AGE`` seconds
+    """
+    return {'public': True, 'max_age': getattr(settings, 'HTTP_PUBLIC_MAX_AGE', 0), 'must_revalidate': True}
+
+
+def private_cache_control():
+    """Only the requesting browser may store the response, and must revalidate it"""
+    return {'private': True, 'max_age': 0, 'must_revalidate': True}
+
+
+def weak_etag(*parts) -> str:
+    """Weak ETag over the string forms of ``parts`` (ids, timestamps, versions)"""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def latest(*timestamps):
+    """Most recent of the given datetimes, ignoring None"""
+    timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+    return max(timestamps) if timestamps else None
+
+
+def set_conditional_headers(response, etag, last_modified=None, cache_control=None):
+    """Add validators and Cache-Control to a response (200 or 304)"""
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    cache_control = cache_control or private_cache_control()
+    patch_cache_control(response, **cache_control)
+    if cache_control.get('private'):
+        patch_vary_headers(response, ['Authorization', 'Cookie'])
+    return response
+
+
+def not_modified_response(request, etag, last_modified=None, cache_control=None):
+    """
+    304 response when the request's preconditions show the client holds
+    this version (412 when an ``If-Match`` fails), else None
+    """
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified is not None else None,
+    )
+    if response is None:
+        return None
+    return set_conditional_headers(response, etag, last_modified, cache_control)
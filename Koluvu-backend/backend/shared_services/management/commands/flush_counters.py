@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+from shared_services.counters import buffering_enabled, flush_all, flush_interval
+
+
+class Command(BaseCommand):
+    help = 'Write buffered counter increments (job views, applications, ...) to the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop', action='store_true',
+            help='Keep flushing every COUNTER_FLUSH_INTERVAL seconds'
+        )
+
+    def handle(self, *args, **options):
+        if not buffering_enabled():
+            self.stdout.write(self.style.WARNING(
+                "Counters are written directly: CACHES['counters'] is not shared between processes "
+                "(set COUNTERS_CACHE_URL)"
+            ))
+            return
+
+        while True:
+            flushed = flush_all()
+            self.stdout.write(', '.join(f'{name}: {rows}' for name, rows in flushed.items()))
+            if not options['loop']:
+                break
+            time.sleep(flush_interval())
+
+        self.stdout.write(self.style.SUCCESS('Successfully flushed buffered counters'))
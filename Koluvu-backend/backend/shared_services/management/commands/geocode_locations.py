@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from employee_dashboard.models import EmployeeProfile
+from employer_dashboard.models import Job
+from shared_services.geo import geocode
+
+
+class Command(BaseCommand):
+    help = 'Geocode the locations of existing jobs and employee profiles from the bundled gazetteer'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='Rows written per UPDATE batch'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        for model in (Job, EmployeeProfile):
+            rows = []
+            scanned = located = updated = 0
+            for row in model.objects.only('id', 'location', 'latitude', 'longitude').iterator(chunk_size=batch_size):
+                scanned += 1
+                coordinates = geocode(row.location) or (None, None)
+                located += coordinates[0] is not None
+                if coordinates == (row.latitude, row.longitude):
+                    continue
+                row.latitude, row.longitude = coordinates
+                rows.append(row)
+                if len(rows) >= batch_size:
+                    model.objects.bulk_update(rows, ['latitude', 'longitude'])
+                    updated += len(rows)
+                    rows = []
+            if rows:
+                model.objects.bulk_update(rows, ['latitude', 'longitude'])
+                updated += len(rows)
+            self.stdout.write(f'{model.__name__}: {located} of {scanned} located, {updated} updated')
+
+        self.stdout.write(self.style.SUCCESS('Successfully geocoded locations'))
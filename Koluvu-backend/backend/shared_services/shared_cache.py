@@ -0,0 +1,22 @@
+"""
+Caches shared between server processes.
+
+State every process has to agree on (response caches invalidated by a
+version key, write-behind counters) only works in a cache all processes
+read and write. With a process-local backend each worker would keep its
+own version and its own pending deltas, so a write handled by one worker
+would never reach the others.
+"""
+from django.conf import settings
+
+# Backends that keep entries per process, or not at all
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_shared_cache(alias: str) -> bool:
+    """Whether the cache ``alias`` is configured and shared by all server processes"""
+    config = settings.CACHES.get(alias)
+    return config is not None and config.get('BACKEND') not in LOCAL_CACHE_BACKENDS
@@ -0,0 +1,51 @@
+from django.test import SimpleTestCase
+
+from ..boolean_query import (
+    BooleanQueryError, Not, Operation, Term, compile_query, compile_search_query, normalize_search_text,
+    parse_boolean_query
+)
+
+
+class BooleanQueryTestCase(SimpleTestCase):
+    def test_precedence_and_parentheses(self):
+        self.assertEqual(
+            parse_boolean_query('React AND (TypeScript OR JavaScript) NOT Junior'),
+            Operation('AND', [
+                Term('react'),
+                Operation('OR', [Term('typescript'), Term('javascript')]),
+                Not(Term('junior')),
+            ])
+        )
+        self.assertEqual(
+            parse_boolean_query('a OR b c'),
+            Operation('OR', [Term('a'), Operation('AND', [Term('b'), Term('c')])])
+        )
+
+    def test_phrases_and_shorthand_negation(self):
+        self.assertEqual(
+            parse_boolean_query('"Machine  Learning" -intern'),
+            Operation('AND', [Term('machine learning'), Not(Term('intern'))])
+        )
+
+    def test_limits_and_errors(self):
+        for query in ['', 'NOT python', 'a AND (b', 'a)', '(' * 10 + 'a' + ')' * 10,
+                      ' OR '.join(f't{i}' for i in range(30))]:
+            with self.assertRaises(BooleanQueryError, msg=query):
+                parse_boolean_query(query)
+
+    def test_compiles_to_token_bounded_predicate(self):
+        predicate = compile_query(parse_boolean_query('java NOT junior'))
+        self.assertEqual(
+            str(predicate),
+            "(AND: ('search_text__contains', ' java '), (NOT (AND: ('search_text__contains', ' junior '))))"
+        )
+        self.assertEqual(normalize_search_text('C++, Node.js.', 'JavaScript'), ' c++ node.js javascript ')
+
+    def test_search_query_is_superset_prefilter(self):
+        # Negations and OR branches without lexemes cannot be narrowed by the index
+        self.assertIsNone(compile_search_query(parse_boolean_query('c++ OR "#"')))
+        self.assertEqual(
+            compile_search_query(parse_boolean_query('java NOT junior')),
+            compile_search_query(Term('java'))
+        )
+        self.assertIsNotNone(compile_search_query(parse_boolean_query('(java OR python) AND django')))
@@ -0,0 +1,126 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+
+from .. import counters
+from ..counters import flush, increment, pending
+
+User = get_user_model()
+
+
+def counters_cache(backend, **options):
+    return {**settings.CACHES, 'counters': {'BACKEND': backend, **options}}
+
+
+class CountersTestCase(TestCase):
+    def setUp(self):
+        # The file based cache stands in for a shared backend such as Redis
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared = override_settings(COUNTER_FLUSH_INTERVAL=5, CACHES=counters_cache(
+            'django.core.cache.backends.filebased.FileBasedCache', LOCATION=location
+        ))
+        shared.enable()
+        self.addCleanup(shared.disable)
+
+        self.bucket = 1000
+        bucket = mock.patch.object(counters, '_bucket', side_effect=lambda: self.bucket)
+        bucket.start()
+        self.addCleanup(bucket.stop)
+
+        EmployerProfile = apps.get_model('employer_dashboard', 'EmployerProfile')
+        Job = apps.get_model('employer_dashboard', 'Job')
+        employer = EmployerProfile.objects.create(user=User.objects.create(username='employer'), company_name='Acme')
+        self.job = Job.objects.create(employer=employer, title='Backend Developer', description='Build APIs', status='active')
+
+    def views(self):
+        self.job.refresh_from_db(fields=['views_count'])
+        return self.job.views_count
+
+    def close_buckets(self):
+        self.bucket += 2
+
+    def test_reads_merge_pending_deltas(self):
+        for _ in range(3):
+            increment('job_views', self.job.id)
+
+        self.assertEqual(self.views(), 0)
+        self.assertEqual(pending('job_views', [self.job.id]), {self.job.id: 3})
+
+        from employer_dashboard.serializers import JobSerializer, PublicJobListSerializer
+        self.assertEqual(JobSerializer(self.job).data['views_count'], 3)
+        self.assertEqual(PublicJobListSerializer([self.job], many=True).data[0]['views_count'], 3)
+
+    def test_flush_writes_closed_buckets_once(self):
+        for _ in range(3):
+            increment('job_views', self.job.id)
+        self.assertEqual(flush('job_views'), 0)
+
+        self.close_buckets()
+        self.assertEqual(flush('job_views'), 1)
+        self.assertEqual(self.views(), 3)
+        self.assertEqual(pending('job_views', [self.job.id]), {})
+
+        self.close_buckets()
+        self.assertEqual(flush('job_views'), 0)
+        self.assertEqual(self.views(), 3)
+
+    def test_increments_during_flush_stay_pending(self):
+        increment('job_views', self.job.id, 2)
+        self.close_buckets()
+
+        update = counters._update
+
+        def update_while_viewed(name, pks, delta):
+            increment('job_views', self.job.id)
+            update(name, pks, delta)
+
+        with mock.patch.object(counters, '_update', side_effect=update_while_viewed):
+            self.assertEqual(flush('job_views'), 1)
+        self.assertEqual(self.views(), 2)
+        self.assertEqual(pending('job_views', [self.job.id]), {self.job.id: 1})
+
+        self.close_buckets()
+        flush('job_views')
+        self.assertEqual(self.views(), 3)
+
+    def test_failed_flush_restores_deltas(self):
+        increment('job_views', self.job.id, 3)
+        self.close_buckets()
+
+        with mock.patch.object(counters, '_update', side_effect=DatabaseError), self.assertLogs(counters.logger):
+            self.assertEqual(flush('job_views'), 0)
+        self.assertEqual(self.views(), 0)
+        self.assertEqual(pending('job_views', [self.job.id]), {self.job.id: 3})
+
+        self.assertEqual(flush('job_views'), 1)
+        self.assertEqual(self.views(), 3)
+        self.close_buckets()
+        flush('job_views')
+        self.assertEqual(self.views(), 3)
+
+    def test_failed_claim_writes_nothing(self):
+        increment('job_views', self.job.id, 3)
+        self.close_buckets()
+
+        counters_cache = counters.get_counters_cache()
+        with mock.patch.object(counters_cache, 'decr', side_effect=ConnectionError), self.assertLogs(counters.logger):
+            self.assertEqual(flush('job_views'), 0)
+        self.assertEqual(self.views(), 0)
+        self.assertEqual(pending('job_views', [self.job.id]), {self.job.id: 3})
+
+        self.assertEqual(flush('job_views'), 1)
+        self.assertEqual(self.views(), 3)
+
+    @override_settings(CACHES=counters_cache('django.core.cache.backends.locmem.LocMemCache'))
+    def test_process_local_cache_writes_through(self):
+        increment('job_views', self.job.id)
+        self.assertEqual(self.views(), 1)
+        self.assertEqual(pending('job_views', [self.job.id]), {})
+        self.assertEqual(flush('job_views'), 0)
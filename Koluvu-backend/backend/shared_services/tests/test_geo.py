@@ -0,0 +1,23 @@
+from django.test import SimpleTestCase
+
+from ..geo import bounding_box, geocode, haversine_km, lookup_place
+
+
+class GeocodeTestCase(SimpleTestCase):
+    def test_resolves_free_text_locations(self):
+        self.assertEqual(lookup_place('Bangalore, Karnataka').name, 'Bengaluru')
+        self.assertEqual(lookup_place('Hybrid - Gurgaon').name, 'Gurugram')
+        self.assertEqual(lookup_place('Remote (Hyderabad)').name, 'Hyderabad')
+        self.assertEqual(lookup_place('Office near Navi Mumbai station').name, 'Mumbai')
+        self.assertIsNone(geocode('Remote'))
+        self.assertIsNone(geocode(''))
+
+    def test_bounding_box_contains_radius(self):
+        bengaluru, chennai = geocode('Bengaluru'), geocode('Chennai')
+        self.assertAlmostEqual(haversine_km(*bengaluru, *chennai), 290, delta=5)
+
+        min_lat, max_lat, min_lon, max_lon = bounding_box(*bengaluru, 50)
+        for edge in ((min_lat, bengaluru[1]), (max_lat, bengaluru[1]),
+                     (bengaluru[0], min_lon), (bengaluru[0], max_lon)):
+            self.assertAlmostEqual(haversine_km(*bengaluru, *edge), 50, delta=0.5)
+        self.assertEqual(bounding_box(89.9, 0, 50)[2:], (-180.0, 180.0))
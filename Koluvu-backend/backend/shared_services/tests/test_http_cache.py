@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta, timezone
+
+from django.test import RequestFactory, SimpleTestCase
+from django.utils.http import http_date
+
+from ..http_cache import not_modified_response, public_cache_control, weak_etag
+
+
+class ConditionalResponseTestCase(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.etag = weak_etag('job', 1, '2026-10-01T12:00:00')
+        self.last_modified = datetime(2026, 10, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def not_modified(self, **headers):
+        request = self.factory.get('/', headers=headers)
+        return not_modified_response(request, self.etag, self.last_modified, public_cache_control())
+
+    def test_matching_etag_is_not_modified(self):
+        response = self.not_modified(if_none_match=self.etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], self.etag)
+        self.assertEqual(response['Last-Modified'], http_date(self.last_modified.timestamp()))
+        self.assertIn('must-revalidate', response['Cache-Control'])
+
+        # Weak comparison: the strong form of the same tag matches too
+        self.assertEqual(self.not_modified(if_none_match=self.etag[2:]).status_code, 304)
+        self.assertEqual(self.not_modified(if_none_match=f'W/"other", {self.etag}').status_code, 304)
+
+    def test_other_etag_is_modified(self):
+        self.assertIsNone(self.not_modified(if_none_match=weak_etag('job', 1, '2026-09-30T12:00:00')))
+
+    def test_if_modified_since(self):
+        self.assertEqual(self.not_modified(if_modified_since=http_date(self.last_modified.timestamp())).status_code, 304)
+        later = self.last_modified + timedelta(hours=1)
+        self.assertEqual(self.not_modified(if_modified_since=http_date(later.timestamp())).status_code, 304)
+        earlier = self.last_modified - timedelta(seconds=1)
+        self.assertIsNone(self.not_modified(if_modified_since=http_date(earlier.timestamp())))
+
+    def test_if_none_match_takes_precedence(self):
+        recent = http_date((self.last_modified + timedelta(hours=1)).timestamp())
+        self.assertIsNone(self.not_modified(if_none_match='W/"other"', if_modified_since=recent))
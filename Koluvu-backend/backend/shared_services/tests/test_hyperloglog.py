@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase
+
+from ..hyperloglog import HyperLogLog
+
+
+class HyperLogLogTestCase(SimpleTestCase):
+    def test_estimates_distinct_values(self):
+        sketch = HyperLogLog()
+        for value in range(20000):
+            sketch.add(f'viewer-{value}')
+            sketch.add(f'viewer-{value}')
+        self.assertAlmostEqual(sketch.count(), 20000, delta=20000 * 0.05)
+
+        small = HyperLogLog()
+        for value in range(10):
+            small.add(value)
+        self.assertEqual(small.count(), 10)
+        self.assertEqual(HyperLogLog().count(), 0)
+
+    def test_merge_counts_union_in_fixed_size(self):
+        monday, tuesday = HyperLogLog(), HyperLogLog()
+        for value in range(3000):
+            monday.add(value)
+        for value in range(2000, 5000):
+            tuesday.add(value)
+
+        week = HyperLogLog.union([monday, tuesday])
+        self.assertAlmostEqual(week.count(), 5000, delta=5000 * 0.05)
+        self.assertEqual(len(week.to_bytes()), 4096)
+        self.assertEqual(HyperLogLog.from_bytes(week.to_bytes()).count(), week.count())
+
+        with self.assertRaises(ValueError):
+            monday.merge(HyperLogLog(precision=10))